@@ -1,354 +1,1152 @@
-from typing import Optional
-
-from django.http import HttpRequest
+from datetime import datetime, time, timedelta
+from functools import partial
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from django.core.files import File as DjangoFile
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Exists, Prefetch, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from ninja import File, Router, UploadedFile
+from ninja.decorators import decorate_view
 
 from apps.chores.api_schema import (
+    REVIEW_QUEUE_PAGE_LIMIT,
+    REVIEW_QUEUE_PAGE_SIZE,
     AssignmentDetailSchema,
-    AssignmentSummarySchema,
+    BulkAssignmentActionSchema,
+    BulkAssignmentResultSchema,
     ChoreDetailSchema,
-    EvidenceSchema,
+    DashboardSchema,
+    DirectUploadConfirmSchema,
+    DirectUploadCreateSchema,
+    DirectUploadSchema,
     EquipmentSchema,
     ErrorSchema,
+    EvidenceSchema,
+    EvidenceUploadConflictSchema,
+    EvidenceUploadCreateSchema,
+    EvidenceUploadSchema,
     LocationSchema,
-    TaskSchema,
+    ReviewQueueSchema,
+    SparseAssignmentDetailSchema,
+    SparseAssignmentSummarySchema,
+    SparseChoreDetailSchema,
+    SparseEquipmentSchema,
+    SparseLocationSchema,
+    SyncSchema,
+)
+from apps.chores.catalog import (
+    EQUIPMENT_CACHE_KEY,
+    LOCATIONS_CACHE_KEY,
+    aapply_catalog_validators,
+    acache_payload,
+    aget_cached_payload,
+    aget_catalog_version,
+    chore_detail_cache_key,
+)
+from apps.chores.derivatives import DERIVATIVE_SIZES, current_derivatives, schedule_derivatives
+from apps.chores.direct_uploads import (
+    DIRECT_UPLOAD_KINDS,
+    DirectUploadError,
+    evidence_object_name,
+    evidence_storage,
+    load_upload_token,
+    presign_upload,
+    sign_upload_token,
+    supports_direct_uploads,
+    upload_expires_at,
+    verify_uploaded_object,
+)
+from apps.chores.documents import (
+    astore_detail_document,
+    build_detail_document,
+    detail_document_queryset,
+    equipment_document,
+    location_document,
+)
+from apps.chores.events import (
+    EVIDENCE_ADDED,
+    PARENTS_CHANNEL,
+    TRANSITION_EVENTS,
+    child_channel,
+    publish_assignment_event,
+)
+from apps.chores.models import Assignment, AssignmentEvidence, Chore, Equipment, EvidenceUpload, Location, Task
+from apps.chores.normalization import UnreadableImageError, normalize_image
+from apps.chores.sync import SyncTokenExpired, adeleted_since, changed_since, make_sync_token, read_sync_token
+from apps.chores.tasks import normalize_direct_photo
+from apps.chores.transitions import (
+    APPROVE,
+    MARK_INCOMPLETE,
+    READY_FOR_APPROVAL,
+    apply_transition,
+    transition_eligibility,
+)
+from apps.chores.uploads import (
+    MAX_CHUNK_SIZE,
+    MAX_UPLOAD_SIZE,
+    UPLOAD_TTL,
+    ChunkError,
+    ScratchFileMissing,
+    UploadBusy,
+    clean_filename,
+    create_scratch_file,
+    discard_scratch_file,
+    file_sha256,
+    locked_scratch_file,
+    upload_path,
+    write_chunk,
 )
-from apps.chores.models import Assignment, AssignmentEvidence, Chore, Equipment, Location, Task
 from apps.core.api_schema import AuthErrorSchema, NotFoundSchema
-from apps.core.utils import is_child, is_parent
+from apps.core.delivery import is_local_storage, serve_media
+from apps.core.events import event_stream
+from apps.core.fieldsets import ALL_FIELDS, FieldSelection, FieldSelectionError
+from apps.core.idempotency import idempotent
+from apps.core.media import amedia_urls, media_url, media_urls
+from apps.core.pagination import after_cursor, make_cursor, read_cursor
+from apps.core.renderers import STREAMING_CHUNK_SIZE, PrevalidatedResponse, StreamingPrevalidatedResponse
+from apps.core.storage import delete_stored_files, save_files_concurrently
+from apps.core.utils import ais_child, ais_parent, is_child, is_parent
 from apps.users.models import User
 
 router = Router(tags=['Chores'])
 
+SSE_HEARTBEAT_SECONDS = 15
+# HEIC and other formats Pillow cannot decode are refused because their metadata cannot be stripped.
+UNREADABLE_PHOTO_MESSAGE = 'Photo is not a readable image; upload a JPEG, PNG or WebP'
+# The scratch file was written on another host or removed by temporary file cleanup.
+SCRATCH_FILE_MISSING_MESSAGE = 'Upload data is no longer available; start a new upload'
+
+# Ninja namespaces the URLs of each API by its version.
+API_URL_NAMESPACE = 'api-1.0.0'
+EVIDENCE_FILE_URL_NAME = 'evidence_file'
+INSTRUCTIONS_VIDEO_URL_NAME = 'chore_instructions_video'
+
 
 def _get_request_user(request: HttpRequest) -> Optional[User]:
     """Return the authenticated user if present."""
     return getattr(request, 'auth', None)
 
 
-def _get_child_or_404(child_id: int) -> Optional[User]:
+async def _aget_child_or_404(child_id: int) -> Optional[User]:
     """Return the active child user or None if not found."""
-    return User.objects.filter(id=child_id, groups__name='child', is_active=True).first()
+    return await User.objects.filter(id=child_id, groups__name='child', is_active=True).afirst()
+
+
+def _has_role(user: User, group_name: str) -> Exists:
+    """Check group membership inside another query, for permission checks that must not cost their own."""
+    return Exists(User.groups.through.objects.filter(user_id=user.id, group__name=group_name))
+
+
+async def _ais_family_member(user: User) -> bool:
+    """Check from an async view that the user is a child or a parent."""
+    return await ais_child(user) or await ais_parent(user)
+
+
+def _absolute_media_url(request: HttpRequest, storage, name: Optional[str]) -> Optional[str]:
+    url = media_url(storage, name, request)
+    return request.build_absolute_uri(url) if url else None
 
 
 def _file_url(request: HttpRequest, field) -> Optional[str]:
     """Build an absolute URL for a FileField or ImageField if present."""
     if not field:
         return None
-    try:
-        return request.build_absolute_uri(field.url)
-    except ValueError:
+    return _absolute_media_url(request, field.storage, field.name)
+
+
+def _stored_file_url(request: HttpRequest, model, field_name: str, name: Optional[str]) -> Optional[str]:
+    """Build an absolute URL for a file name fetched through a `values()` projection."""
+    return _absolute_media_url(request, model._meta.get_field(field_name).storage, name)
+
+
+def _image_names(images: list[tuple]) -> list[str]:
+    names = []
+    for name, record in images:
+        names.append(name)
+        names.extend(current_derivatives(name, record).values())
+    return names
+
+
+def _prime_media_urls(request: HttpRequest, model, field_name: str, images: list[tuple]) -> None:
+    """Resolve URLs for `(name, derivative record)` pairs in one batch before a list is serialized."""
+    media_urls(model._meta.get_field(field_name).storage, _image_names(images), request)
+
+
+async def _aprime_media_urls(request: HttpRequest, model, field_name: str, images: list[tuple]) -> None:
+    """Async `_prime_media_urls`; the sync builders then resolve every URL from the request memo."""
+    await amedia_urls(model._meta.get_field(field_name).storage, _image_names(images), request)
+
+
+def _derivative_urls(
+    request: HttpRequest, model, field_name: str, name: Optional[str], record: Optional[dict]
+) -> dict[str, Optional[str]]:
+    """Return `{size: url}` for an image's derivatives, using the original until they are built."""
+    return _sized_urls(lambda stored_name: _stored_file_url(request, model, field_name, stored_name), name, record)
+
+
+def _sized_urls(
+    url: Callable[[Optional[str]], Optional[str]], name: Optional[str], record: Optional[dict]
+) -> dict[str, Optional[str]]:
+    original_url = url(name)
+    derivatives = current_derivatives(name, record)
+    return {size: url(derivatives[size]) if size in derivatives else original_url for size in DERIVATIVE_SIZES}
+
+
+def _delivery_url(request: HttpRequest, url_name: str, name: Optional[str], **kwargs) -> Optional[str]:
+    """Build the URL of an endpoint delivering a file from local storage to authorized users."""
+    if not name:
         return None
+    return request.build_absolute_uri(reverse(f'{API_URL_NAMESPACE}:{url_name}', kwargs={**kwargs, 'name': name}))
+
+
+def _evidence_file_url(request: HttpRequest, evidence: AssignmentEvidence, name: Optional[str]) -> Optional[str]:
+    return _delivery_url(
+        request, EVIDENCE_FILE_URL_NAME, name, assignment_id=evidence.assignment_id, evidence_id=evidence.id
+    )
+
+
+def _instructions_video_url(request: HttpRequest, chore_id: int, name: Optional[str]) -> Optional[str]:
+    """Build an instructions video URL; videos in local storage are served by `get_chore_instructions_video`."""
+    if is_local_storage(Chore._meta.get_field('instructions_video').storage):
+        return _delivery_url(request, INSTRUCTIONS_VIDEO_URL_NAME, name, id=chore_id)
+    return _stored_file_url(request, Chore, 'instructions_video', name)
+
+
+def _evidence_payload(request: HttpRequest, evidence: AssignmentEvidence) -> dict:
+    """Build an `EvidenceSchema`-shaped payload.
+
+    Evidence in local storage is not published under `MEDIA_URL`, so its URLs point at
+    `get_evidence_file`; remote storage URLs are signed.
+    """
+    if is_local_storage(evidence.photo.storage):
+        photo = _sized_urls(
+            lambda name: _evidence_file_url(request, evidence, name), evidence.photo.name, evidence.photo_derivatives
+        )
+        photo_url = _evidence_file_url(request, evidence, evidence.photo.name)
+        video_url = _evidence_file_url(request, evidence, evidence.video.name)
+    else:
+        photo = _derivative_urls(request, AssignmentEvidence, 'photo', evidence.photo.name, evidence.photo_derivatives)
+        photo_url = _file_url(request, evidence.photo)
+        video_url = _file_url(request, evidence.video)
+    return {
+        'id': evidence.id,
+        'photo_url': photo_url,
+        'photo_thumbnail_url': photo['thumbnail'],
+        'photo_medium_url': photo['medium'],
+        'video_url': video_url,
+        'created_at': evidence.created_at,
+    }
 
 
 def _build_evidence_schema(request: HttpRequest, evidence: AssignmentEvidence) -> EvidenceSchema:
     """Serialize evidence into a response schema."""
-    return EvidenceSchema(
-        id=evidence.id,
-        photo_url=_file_url(request, evidence.photo),
-        video_url=_file_url(request, evidence.video),
-        created_at=evidence.created_at,
-    )
+    return EvidenceSchema(**_evidence_payload(request, evidence))
+
+
+def _chore_summary_payload(chore: Chore) -> dict:
+    return {'id': chore.id, 'name': chore.name, 'description': chore.description, 'points': chore.points}
+
+
+def _assignment_summary_payload(assignment: Assignment) -> dict:
+    """Build an `AssignmentSummarySchema`-shaped payload."""
+    return {
+        'assignment_id': assignment.id,
+        'due_date': assignment.due_date,
+        'is_completed': assignment.is_completed,
+        'pending_approval': assignment.pending_approval,
+        'approved': assignment.approved,
+        'closed': assignment.closed,
+        'chore': _chore_summary_payload(assignment.chore),
+    }
+
+
+def _chore_summary_row_payload(row: dict) -> dict:
+    return {
+        'id': row['chore_id'],
+        'name': row['chore__name'],
+        'description': row['chore__description'],
+        'points': row['chore__points'],
+    }
+
+
+# Response field -> the `values()` columns it is built from.
+ASSIGNMENT_SUMMARY_COLUMNS = {
+    'assignment_id': ('id',),
+    'due_date': ('due_date',),
+    'is_completed': ('is_completed',),
+    'pending_approval': ('pending_approval',),
+    'approved': ('approved',),
+    'closed': ('closed',),
+    'chore': ('chore_id', 'chore__name', 'chore__description', 'chore__points'),
+}
+ASSIGNMENT_SUMMARY_FIELDS = tuple(ALL_FIELDS.columns(ASSIGNMENT_SUMMARY_COLUMNS))
+ASSIGNMENT_SUMMARY_RELATIONS = ('chore',)
+ASSIGNMENT_SUMMARY_ROW_GETTERS = {
+    'assignment_id': itemgetter('id'),
+    **{name: itemgetter(name) for name in ('due_date', 'is_completed', 'pending_approval', 'approved', 'closed')},
+    'chore': _chore_summary_row_payload,
+}
+
+
+def _assignment_summary_row_payload(row: dict) -> dict:
+    """Build an `AssignmentSummarySchema`-shaped payload from an `ASSIGNMENT_SUMMARY_FIELDS` row."""
+    return {name: getter(row) for name, getter in ASSIGNMENT_SUMMARY_ROW_GETTERS.items()}
+
+
+def _evidence_images(evidence: list[AssignmentEvidence]) -> dict[str, list[tuple]]:
+    """Return the `(name, derivative record)` pairs per evidence file field."""
+    return {
+        'photo': [(item.photo.name, item.photo_derivatives) for item in evidence],
+        'video': [(item.video.name, None) for item in evidence],
+    }
+
+
+def _evidence_list_payload(request: HttpRequest, evidence: Iterable[AssignmentEvidence]) -> list[dict]:
+    """Build `EvidenceSchema`-shaped payloads, resolving all media URLs in one batch."""
+    evidence = list(evidence)
+    for field_name, images in _evidence_images(evidence).items():
+        _prime_media_urls(request, AssignmentEvidence, field_name, images)
+    return [_evidence_payload(request, item) for item in evidence]
+
+
+# Response field -> the model fields `only()` loads for it.
+ASSIGNMENT_DETAIL_COLUMNS = {
+    'assignment_id': ('id',),
+    'due_date': ('due_date',),
+    'is_completed': ('is_completed',),
+    'pending_approval': ('pending_approval',),
+    'approved': ('approved',),
+    'closed': ('closed',),
+    'chore': ('chore', 'chore__name', 'chore__description', 'chore__points'),
+    'approved_at': ('approved_at',),
+    'completed_at': ('completed_at',),
+    'closed_at': ('closed_at',),
+    'evidence': (),
+}
+ASSIGNMENT_DETAIL_RELATIONS = ('chore', 'evidence')
+
+
+def _assignment_detail_queryset(selection: FieldSelection = ALL_FIELDS) -> QuerySet:
+    """Return assignments loading only what the selected `AssignmentDetailSchema` fields need."""
+    columns = selection.columns(ASSIGNMENT_DETAIL_COLUMNS, ASSIGNMENT_DETAIL_RELATIONS)
+    # `assigned_to` is read by the permission check.
+    queryset = Assignment.objects.only('assigned_to', *columns)
+    if selection.expands('chore'):
+        queryset = queryset.select_related('chore')
+    if selection.expands('evidence'):
+        queryset = queryset.prefetch_related('evidence')
+    return queryset
+
+
+def _assignment_detail_payload(
+    request: HttpRequest, assignment: Assignment, selection: FieldSelection = ALL_FIELDS
+) -> dict:
+    """Build an `AssignmentDetailSchema`-shaped payload of the selected fields; evidence must be prefetched."""
+    getters = {name: attrgetter(name) for name in ASSIGNMENT_DETAIL_COLUMNS} | {
+        'assignment_id': attrgetter('id'),
+        'chore': lambda assignment: _chore_summary_payload(assignment.chore),
+        'evidence': lambda assignment: _evidence_list_payload(request, assignment.evidence.all()),
+    }
+    return selection.builder(getters, ASSIGNMENT_DETAIL_RELATIONS)(assignment)
+
+
+# One LEFT JOIN row per evidence item (a single row with null evidence columns when there is none).
+ASSIGNMENT_DETAIL_ROW_FIELDS = (
+    *ASSIGNMENT_SUMMARY_FIELDS,
+    'assigned_to_id',
+    'approved_at',
+    'completed_at',
+    'closed_at',
+    'evidence__id',
+    'evidence__photo',
+    'evidence__photo_derivatives',
+    'evidence__video',
+    'evidence__created_at',
+)
 
 
-def _build_assignment_summary(assignment: Assignment) -> AssignmentSummarySchema:
-    """Serialize an assignment summary payload."""
-    chore = assignment.chore
-    return AssignmentSummarySchema(
-        assignment_id=assignment.id,
-        due_date=assignment.due_date,
-        is_completed=assignment.is_completed,
-        pending_approval=assignment.pending_approval,
-        approved=assignment.approved,
-        closed=assignment.closed,
-        chore={
-            'id': chore.id,
-            'name': chore.name,
-            'description': chore.description,
-            'points': chore.points,
-        },
-    )
+def _assignment_detail_rows_payload(request: HttpRequest, rows: list[dict]) -> dict:
+    """Build an `AssignmentDetailSchema`-shaped payload from one assignment's `ASSIGNMENT_DETAIL_ROW_FIELDS` rows."""
+    row = rows[0]
+    evidence = [
+        AssignmentEvidence(
+            id=item['evidence__id'],
+            assignment_id=row['id'],
+            photo=item['evidence__photo'],
+            photo_derivatives=item['evidence__photo_derivatives'],
+            video=item['evidence__video'],
+            created_at=item['evidence__created_at'],
+        )
+        for item in rows
+        if item['evidence__id'] is not None
+    ]
+    return {
+        **_assignment_summary_row_payload(row),
+        'approved_at': row['approved_at'],
+        'completed_at': row['completed_at'],
+        'closed_at': row['closed_at'],
+        'evidence': _evidence_list_payload(request, evidence),
+    }
+
+
+LOCATION_FIELDS = ('id', 'name', 'description', 'notes')
 
 
 def _build_location_schema(location: Optional[Location]) -> Optional[LocationSchema]:
     """Serialize a location payload."""
-    if not location:
-        return None
-    return LocationSchema(
-        id=location.id,
-        name=location.name,
-        description=location.description,
-        notes=location.notes,
+    payload = location_document(location)
+    return LocationSchema(**payload) if payload else None
+
+
+def _equipment_document_payload(request: HttpRequest, document: dict, location: bool = True) -> dict:
+    """Build an `EquipmentSchema`-shaped payload from an equipment document.
+
+    The location is left out unless `location` is set.
+    """
+    image = _derivative_urls(request, Equipment, 'image', document['image'], document['image_derivatives'])
+    payload = {'id': document['id'], 'name': document['name'], 'description': document['description']}
+    if location:
+        payload['location'] = document['location']
+    payload.update(
+        notes=document['notes'],
+        image_url=_stored_file_url(request, Equipment, 'image', document['image']),
+        image_thumbnail_url=image['thumbnail'],
+        image_medium_url=image['medium'],
     )
+    return payload
 
 
 def _build_equipment_schema(request: HttpRequest, equipment: Equipment) -> EquipmentSchema:
     """Serialize an equipment payload."""
-    return EquipmentSchema(
-        id=equipment.id,
-        name=equipment.name,
-        description=equipment.description,
-        location=_build_location_schema(equipment.location),
-        notes=equipment.notes,
-        image_url=_file_url(request, equipment.image),
-    )
-
-
-def _build_task_schema(request: HttpRequest, task: Task) -> TaskSchema:
-    """Serialize a task payload."""
-    equipment = [_build_equipment_schema(request, item) for item in task.equipment.all()]
-    return TaskSchema(
-        id=task.id,
-        name=task.name,
-        description=task.description,
-        notes=task.notes,
-        steps=task.steps,
-        equipment=equipment,
-    )
+    return EquipmentSchema(**_equipment_document_payload(request, equipment_document(equipment)))
+
+
+# Response field -> the `values()` columns it is built from.
+EQUIPMENT_LIST_COLUMNS = {
+    'id': ('id',),
+    'name': ('name',),
+    'description': ('description',),
+    'location': ('location_id', 'location__name', 'location__description', 'location__notes'),
+    'notes': ('notes',),
+    'image_url': ('image',),
+    'image_thumbnail_url': ('image', 'image_derivatives'),
+    'image_medium_url': ('image', 'image_derivatives'),
+}
+EQUIPMENT_LIST_FIELDS = tuple(ALL_FIELDS.columns(EQUIPMENT_LIST_COLUMNS))
+EQUIPMENT_LIST_RELATIONS = ('location',)
+
+
+def _location_row_payload(row: dict) -> Optional[dict]:
+    if row['location_id'] is None:
+        return None
+    return {
+        'id': row['location_id'],
+        'name': row['location__name'],
+        'description': row['location__description'],
+        'notes': row['location__notes'],
+    }
+
+
+def _equipment_row_getters(request: HttpRequest) -> dict[str, Callable[[dict], Any]]:
+    """Return the `EquipmentSchema` field getters for `EQUIPMENT_LIST_COLUMNS` rows."""
+
+    def derivative_url(size: str) -> Callable[[dict], Optional[str]]:
+        return lambda row: _derivative_urls(request, Equipment, 'image', row['image'], row['image_derivatives'])[size]
+
+    return {
+        'id': itemgetter('id'),
+        'name': itemgetter('name'),
+        'description': itemgetter('description'),
+        'location': _location_row_payload,
+        'notes': itemgetter('notes'),
+        'image_url': lambda row: _stored_file_url(request, Equipment, 'image', row['image']),
+        'image_thumbnail_url': derivative_url('thumbnail'),
+        'image_medium_url': derivative_url('medium'),
+    }
+
+
+def _task_document_payload(
+    request: HttpRequest, document: dict, equipment: bool = True, equipment_location: bool = True
+) -> dict:
+    """Build a `TaskSchema`-shaped payload from a task document, leaving equipment out unless `equipment` is set."""
+    payload = {name: document[name] for name in ('id', 'name', 'description', 'notes', 'steps')}
+    if equipment:
+        payload['equipment'] = [
+            _equipment_document_payload(request, item, equipment_location) for item in document['equipment']
+        ]
+    return payload
 
 
-def _build_chore_detail(request: HttpRequest, chore: Chore) -> ChoreDetailSchema:
-    """Serialize a chore detail payload."""
-    equipment = [_build_equipment_schema(request, item) for item in chore.equipment.all()]
-    tasks = [_build_task_schema(request, task) for task in chore.tasks.all()]
-    return ChoreDetailSchema(
-        id=chore.id,
-        name=chore.name,
-        description=chore.description,
-        points=chore.points,
-        penalize_incomplete=chore.penalize_incomplete,
-        penalty_amount=chore.penalty_amount,
-        is_recurring=chore.is_recurring,
-        recurrence=chore.recurrence,
-        recurrence_day_of_week=chore.recurrence_day_of_week,
-        recurrence_day_of_month=chore.recurrence_day_of_month,
-        instructions_video_url=_file_url(request, chore.instructions_video),
-        instructions_video_name=chore.instructions_video_name,
-        instructions_video_source=chore.instructions_video_source,
-        location=_build_location_schema(chore.location),
-        equipment=equipment,
-        tasks=tasks,
-        notes=chore.notes,
-        time_due=chore.time_due,
-        age_restricted=chore.age_restricted,
-        minimum_age=chore.minimum_age,
-        assign_to_all=chore.assign_to_all,
-        disabled=chore.disabled,
-    )
+CHORE_DETAIL_FIELDS = tuple(ChoreDetailSchema.model_fields)
+CHORE_DETAIL_RELATIONS = (
+    'location',
+    'equipment',
+    'equipment.location',
+    'tasks',
+    'tasks.equipment',
+    'tasks.equipment.location',
+)
 
 
+def _document_equipment_images(document: dict, selection: FieldSelection = ALL_FIELDS) -> list[tuple]:
+    """Return `(name, derivative record)` pairs for the selected equipment in a chore detail document."""
+    all_equipment = []
+    if selection.expands('equipment'):
+        all_equipment.extend(document['equipment'])
+    if selection.expands('tasks.equipment'):
+        all_equipment.extend(item for task in document['tasks'] for item in task['equipment'])
+    return [(item['image'], item['image_derivatives']) for item in all_equipment]
+
+
+SYNC_ASSIGNMENT_FIELDS = (*ASSIGNMENT_SUMMARY_FIELDS, 'approved_at', 'completed_at', 'closed_at')
+SYNC_EQUIPMENT_FIELDS = ('id', 'name', 'description', 'location_id', 'notes', 'image', 'image_derivatives')
+
+
+def _sync_assignment_row_payload(row: dict) -> dict:
+    """Build a `SyncAssignmentSchema`-shaped payload from a `SYNC_ASSIGNMENT_FIELDS` row."""
+    payload = _assignment_summary_row_payload(row)
+    payload.update(approved_at=row['approved_at'], completed_at=row['completed_at'], closed_at=row['closed_at'])
+    return payload
+
+
+def _sync_equipment_row_payload(request: HttpRequest, row: dict) -> dict:
+    """Build a `SyncEquipmentSchema`-shaped payload from a `SYNC_EQUIPMENT_FIELDS` row."""
+    image = _derivative_urls(request, Equipment, 'image', row['image'], row['image_derivatives'])
+    return {
+        'id': row['id'],
+        'name': row['name'],
+        'description': row['description'],
+        'location_id': row['location_id'],
+        'notes': row['notes'],
+        'image_url': _stored_file_url(request, Equipment, 'image', row['image']),
+        'image_thumbnail_url': image['thumbnail'],
+        'image_medium_url': image['medium'],
+    }
+
+
+def _sync_task_payload(task: Task) -> dict:
+    """Build a `SyncTaskSchema`-shaped payload; equipment must be prefetched."""
+    return {
+        'id': task.id,
+        'name': task.name,
+        'description': task.description,
+        'notes': task.notes,
+        'steps': task.steps,
+        'equipment_ids': [item.id for item in task.equipment.all()],
+    }
+
+
+def _sync_chore_payload(request: HttpRequest, chore: Chore) -> dict:
+    """Build a `SyncChoreSchema`-shaped payload; equipment and tasks must be prefetched."""
+    return {
+        'id': chore.id,
+        'name': chore.name,
+        'description': chore.description,
+        'points': chore.points,
+        'penalize_incomplete': chore.penalize_incomplete,
+        'penalty_amount': chore.penalty_amount,
+        'is_recurring': chore.is_recurring,
+        'recurrence': chore.recurrence,
+        'recurrence_day_of_week': chore.recurrence_day_of_week,
+        'recurrence_day_of_month': chore.recurrence_day_of_month,
+        'instructions_video_url': _instructions_video_url(request, chore.id, chore.instructions_video.name),
+        'instructions_video_name': chore.instructions_video_name,
+        'instructions_video_source': chore.instructions_video_source,
+        'location_id': chore.location_id,
+        'equipment_ids': [item.id for item in chore.equipment.all()],
+        'task_ids': [task.id for task in chore.tasks.all()],
+        'notes': chore.notes,
+        'time_due': chore.time_due,
+        'age_restricted': chore.age_restricted,
+        'minimum_age': chore.minimum_age,
+        'assign_to_all': chore.assign_to_all,
+        'disabled': chore.disabled,
+    }
+
+
+def _chore_document_payload(request: HttpRequest, document: dict, selection: FieldSelection = ALL_FIELDS) -> dict:
+    """Build a `ChoreDetailSchema`-shaped payload of the selected fields from a chore detail document."""
+    equipment_location = selection.expands('equipment.location')
+    task_equipment = selection.expands('tasks.equipment')
+    task_equipment_location = selection.expands('tasks.equipment.location')
+    getters = {name: itemgetter(name) for name in CHORE_DETAIL_FIELDS} | {
+        'instructions_video_url': lambda document: _instructions_video_url(
+            request, document['id'], document['instructions_video']
+        ),
+        'equipment': lambda document: [
+            _equipment_document_payload(request, item, equipment_location) for item in document['equipment']
+        ],
+        'tasks': lambda document: [
+            _task_document_payload(request, task, task_equipment, task_equipment_location) for task in document['tasks']
+        ],
+    }
+    return selection.builder(getters, CHORE_DETAIL_RELATIONS)(document)
+
+
+# Read endpoints are async so ASGI deployments serve them without tying up a worker thread
+# per request. Under WSGI Django runs them in a per-request event loop.
+#
+# Chore, assignment and catalog reads accept `fields` and `expand` (see `apps.core.fieldsets`);
+# the selection decides which columns and relations are loaded as well as what is encoded.
+# Sparse responses are built fresh rather than cached, but keep their own ETags.
 @router.get(
     '/children/{child_id}/assignments',
-    response={200: list[AssignmentSummarySchema], 403: AuthErrorSchema, 404: NotFoundSchema},
+    response={200: list[SparseAssignmentSummarySchema], 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
 )
-def list_child_assignments(request: HttpRequest, child_id: int):
+async def list_child_assignments(
+    request: HttpRequest, child_id: int, fields: Optional[str] = None, expand: Optional[str] = None
+):
     """Get all active assignments for a child."""
     user = _get_request_user(request)
     if not user:
         return 403, {'message': 'Unauthorized'}
-    if is_child(user) and user.id != child_id:
+    child_role = await ais_child(user)
+    if child_role and user.id != child_id:
         return 403, {'message': 'Unauthorized'}
-    if not (is_child(user) or is_parent(user)):
+    if not (child_role or await ais_parent(user)):
         return 403, {'message': 'Unauthorized'}
+    try:
+        selection = FieldSelection.parse(
+            fields, expand, ASSIGNMENT_SUMMARY_COLUMNS, ASSIGNMENT_SUMMARY_RELATIONS, key_field='assignment_id'
+        )
+    except FieldSelectionError as error:
+        return 400, {'message': str(error)}
 
-    child = _get_child_or_404(child_id)
+    child = await _aget_child_or_404(child_id)
     if not child:
         return 404, {'message': 'Child not found'}
 
-    assignments = (
-        Assignment.objects.filter(assigned_to=child, closed=False).select_related('chore').order_by('due_date')
+    rows = (
+        Assignment.objects.filter(assigned_to=child, closed=False)
+        .order_by('due_date')
+        .values(*selection.columns(ASSIGNMENT_SUMMARY_COLUMNS, ASSIGNMENT_SUMMARY_RELATIONS))
     )
-    return [_build_assignment_summary(assignment) for assignment in assignments]
+    payload = selection.builder(ASSIGNMENT_SUMMARY_ROW_GETTERS, ASSIGNMENT_SUMMARY_RELATIONS)
+    if isinstance(request, ASGIRequest):
+        # ASGI consumes async streams natively; a sync iterator would be buffered in full.
+        items = (payload(row) async for row in rows.aiterator(STREAMING_CHUNK_SIZE))
+    else:
+        items = (payload(row) for row in rows.iterator(chunk_size=STREAMING_CHUNK_SIZE))
+    return StreamingPrevalidatedResponse(items, request=request)
 
 
-@router.get('/locations', response={200: list[LocationSchema], 403: AuthErrorSchema})
-def list_locations(request: HttpRequest):
+@router.get('/locations', response={200: list[SparseLocationSchema], 304: None, 400: ErrorSchema, 403: AuthErrorSchema})
+async def list_locations(request: HttpRequest, response: HttpResponse, fields: Optional[str] = None):
     """Get all available locations."""
     user = _get_request_user(request)
-    if not user or not (is_child(user) or is_parent(user)):
+    if not user or not await _ais_family_member(user):
         return 403, {'message': 'Unauthorized'}
-
-    locations = Location.objects.order_by('name')
-    return [_build_location_schema(location) for location in locations if location]
+    try:
+        selection = FieldSelection.parse(fields, None, LOCATION_FIELDS)
+    except FieldSelectionError as error:
+        return 400, {'message': str(error)}
+    not_modified = await aapply_catalog_validators(request, response, 'locations', selection.key)
+    if not_modified:
+        return not_modified
+    if selection.is_full:
+        version = await aget_catalog_version()
+        cached = await aget_cached_payload(request, LOCATIONS_CACHE_KEY, version)
+        if cached is not None:
+            return cached
+
+        payload = [_build_location_schema(location) async for location in Location.objects.order_by('name')]
+        await acache_payload(request, LOCATIONS_CACHE_KEY, payload, version)
+        return payload
+
+    locations = Location.objects.order_by('name').values(*selection.selected(LOCATION_FIELDS))
+    return PrevalidatedResponse([row async for row in locations], temporal_response=response, request=request)
 
 
-@router.get('/equipment', response={200: list[EquipmentSchema], 403: AuthErrorSchema})
-def list_equipment(request: HttpRequest):
+@router.get(
+    '/equipment', response={200: list[SparseEquipmentSchema], 304: None, 400: ErrorSchema, 403: AuthErrorSchema}
+)
+async def list_equipment(
+    request: HttpRequest, response: HttpResponse, fields: Optional[str] = None, expand: Optional[str] = None
+):
     """Get all available equipment."""
     user = _get_request_user(request)
-    if not user or not (is_child(user) or is_parent(user)):
+    if not user or not await _ais_family_member(user):
         return 403, {'message': 'Unauthorized'}
-
-    equipment = Equipment.objects.select_related('location').order_by('name')
-    return [_build_equipment_schema(request, item) for item in equipment]
+    try:
+        selection = FieldSelection.parse(fields, expand, EQUIPMENT_LIST_COLUMNS, EQUIPMENT_LIST_RELATIONS)
+    except FieldSelectionError as error:
+        return 400, {'message': str(error)}
+    not_modified = await aapply_catalog_validators(request, response, 'equipment', selection.key)
+    if not_modified:
+        return not_modified
+    version = await aget_catalog_version()
+    if selection.is_full:
+        cached = await aget_cached_payload(request, EQUIPMENT_CACHE_KEY, version)
+        if cached is not None:
+            return PrevalidatedResponse(cached, temporal_response=response, request=request)
+
+    columns = selection.columns(EQUIPMENT_LIST_COLUMNS, EQUIPMENT_LIST_RELATIONS)
+    # Built in full rather than streamed because the list is cached.
+    rows = [row async for row in Equipment.objects.order_by('name').values(*columns)]
+    if 'image' in columns:
+        images = [(row['image'], row.get('image_derivatives')) for row in rows]
+        await _aprime_media_urls(request, Equipment, 'image', images)
+    build = selection.builder(_equipment_row_getters(request), EQUIPMENT_LIST_RELATIONS)
+    payload = [build(row) for row in rows]
+    if selection.is_full:
+        await acache_payload(request, EQUIPMENT_CACHE_KEY, payload, version)
+    return PrevalidatedResponse(payload, temporal_response=response, request=request)
 
 
 @router.get(
     '/chores/{id}',
-    response={200: ChoreDetailSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
+    response={200: SparseChoreDetailSchema, 304: None, 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
 )
-def get_chore_detail(request: HttpRequest, id: int):
-    """Get full chore data including equipment, tasks, and location."""
+async def get_chore_detail(
+    request: HttpRequest, response: HttpResponse, id: int, fields: Optional[str] = None, expand: Optional[str] = None
+):
+    """Get full chore data including equipment, tasks, and location.
+
+    `fields` and `expand` trim the response, e.g. `fields=name,points` or `expand=tasks`.
+    """
     user = _get_request_user(request)
-    if not user or not (is_child(user) or is_parent(user)):
+    if not user or not await _ais_family_member(user):
         return 403, {'message': 'Unauthorized'}
-
-    chore = (
-        Chore.objects.filter(id=id)
-        .select_related('location')
-        .prefetch_related('equipment', 'tasks', 'tasks__equipment')
-        .first()
-    )
+    try:
+        selection = FieldSelection.parse(fields, expand, CHORE_DETAIL_FIELDS, CHORE_DETAIL_RELATIONS)
+    except FieldSelectionError as error:
+        return 400, {'message': str(error)}
+    not_modified = await aapply_catalog_validators(request, response, 'chore', id, selection.key)
+    if not_modified:
+        return not_modified
+    cache_key = chore_detail_cache_key(id)
+    version = await aget_catalog_version()
+    if selection.is_full:
+        cached = await aget_cached_payload(request, cache_key, version)
+        if cached is not None:
+            return cached
+
+    chore = await Chore.objects.only('id', 'detail_document').filter(id=id).afirst()
     if not chore:
         return 404, {'message': 'Chore not found'}
+    document = chore.detail_document
+    if document is None:
+        # Not built yet, or cleared by a write whose rebuild is still queued.
+        chore = await detail_document_queryset().filter(id=id).afirst()
+        if not chore:
+            return 404, {'message': 'Chore not found'}
+        document = build_detail_document(chore)
+        await astore_detail_document(id, document, version)
+
+    await _aprime_media_urls(request, Equipment, 'image', _document_equipment_images(document, selection))
+    if not selection.is_full:
+        return PrevalidatedResponse(
+            _chore_document_payload(request, document, selection), temporal_response=response, request=request
+        )
+    payload = ChoreDetailSchema(**_chore_document_payload(request, document))
+    await acache_payload(request, cache_key, payload, version)
+    return payload
+
+
+@router.get(
+    '/chores/{id}/instructions-video/{path:name}',
+    response={403: AuthErrorSchema, 404: NotFoundSchema},
+    url_name=INSTRUCTIONS_VIDEO_URL_NAME,
+)
+def get_chore_instructions_video(request: HttpRequest, id: int, name: str):
+    """Play a chore's instructions video.
+
+    Answers `Range` requests with 206 Partial Content, so players seek without downloading
+    the video from the start.
+    """
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+
+    # One query checks the role and that `name` is still the chore's video.
+    found = Chore.objects.filter(
+        Q(_has_role(user, 'child')) | Q(_has_role(user, 'parent')), id=id, instructions_video=name
+    ).exists()
+    if not found:
+        return 404, {'message': 'Video not found'}
+    return serve_media(request, Chore._meta.get_field('instructions_video').storage, name)
+
+
+def _dashboard_counts(today_start: datetime, today_end: datetime) -> dict:
+    """Return per-child count annotations for the parent dashboard."""
+    today = {'gte': today_start, 'lt': today_end}
+
+    def during_today(field: str) -> Q:
+        return Q(**{f'chore_assignments__{field}__{lookup}': value for lookup, value in today.items()})
+
+    return {
+        'open_count': Count('chore_assignments', filter=Q(chore_assignments__closed=False)),
+        'pending_approval_count': Count(
+            'chore_assignments', filter=Q(chore_assignments__closed=False, chore_assignments__pending_approval=True)
+        ),
+        'due_today': Count('chore_assignments', filter=during_today('due_date')),
+        'completed_today': Count('chore_assignments', filter=during_today('completed_at')),
+        'approved_today': Count('chore_assignments', filter=during_today('approved_at')),
+        'points_today': Coalesce(Sum('chore_assignments__chore__points', filter=during_today('approved_at')), Value(0)),
+    }
+
+
+@router.get('/dashboard', response={200: DashboardSchema, 403: AuthErrorSchema})
+async def get_parent_dashboard(request: HttpRequest):
+    """Get every child's open assignments with pending-approval counts and today's totals.
+
+    Uses the same number of queries however many children there are.
+    """
+    user = _get_request_user(request)
+    if not user or not await ais_parent(user):
+        return 403, {'message': 'Unauthorized'}
+
+    today = timezone.localdate()
+    today_start = timezone.make_aware(datetime.combine(today, time.min))
+    today_end = today_start + timedelta(days=1)
+    children = User.objects.filter(groups__name='child', is_active=True)
+    counts = _dashboard_counts(today_start, today_end)
+    child_rows = [
+        row async for row in children.annotate(**counts).order_by('id').values('id', 'first_name', 'last_name', *counts)
+    ]
+    assignments = {row['id']: [] for row in child_rows}
+    async for row in (
+        Assignment.objects.filter(assigned_to__in=children, closed=False)
+        .order_by('assigned_to_id', 'due_date')
+        .values('assigned_to_id', *ASSIGNMENT_SUMMARY_FIELDS)
+    ):
+        if row['assigned_to_id'] in assignments:
+            assignments[row['assigned_to_id']].append(_assignment_summary_row_payload(row))
+
+    return PrevalidatedResponse(
+        {'date': today, 'children': [{**row, 'assignments': assignments[row['id']]} for row in child_rows]},
+        request=request,
+    )
+
+
+REVIEW_QUEUE_CURSOR_SALT = 'chores.review-queue'
+REVIEW_QUEUE_FIELDS = (
+    *ASSIGNMENT_SUMMARY_FIELDS,
+    'completed_at',
+    'assigned_to_id',
+    'assigned_to__first_name',
+    'assigned_to__last_name',
+)
+REVIEW_QUEUE_EVIDENCE_FIELDS = ('id', 'assignment_id', 'photo', 'photo_derivatives', 'video', 'created_at')
+
+
+def _review_queue_row_payload(row: dict, evidence: list[dict]) -> dict:
+    """Build a `ReviewQueueItemSchema`-shaped payload from a `REVIEW_QUEUE_FIELDS` row."""
+    payload = _assignment_summary_row_payload(row)
+    payload.update(
+        child_id=row['assigned_to_id'],
+        child_first_name=row['assigned_to__first_name'],
+        child_last_name=row['assigned_to__last_name'],
+        completed_at=row['completed_at'],
+        evidence=evidence,
+    )
+    return payload
+
+
+@router.get('/review-queue', response={200: ReviewQueueSchema, 400: ErrorSchema, 403: AuthErrorSchema})
+async def get_review_queue(request: HttpRequest, cursor: Optional[str] = None, limit: int = REVIEW_QUEUE_PAGE_SIZE):
+    """Get every child's open assignments awaiting approval, earliest due first, with their evidence.
+
+    Pass the returned `next_cursor` as `cursor` to get the next page; it is null on the last
+    page. A page takes two queries however long the queue is: the assignments with their
+    chores and children, then the evidence of all of them.
+    """
+    user = _get_request_user(request)
+    if not user or not await ais_parent(user):
+        return 403, {'message': 'Unauthorized'}
+    if not 1 <= limit <= REVIEW_QUEUE_PAGE_LIMIT:
+        return 400, {'message': f'limit must be between 1 and {REVIEW_QUEUE_PAGE_LIMIT}'}
+
+    # Matches the partial `assignment_review_queue` index.
+    queue = Assignment.objects.filter(pending_approval=True, closed=False)
+    if cursor is not None:
+        position = read_cursor(REVIEW_QUEUE_CURSOR_SALT, cursor)
+        if position is None:
+            return 400, {'message': 'Invalid cursor'}
+        queue = queue.filter(after_cursor('due_date', position))
+    rows = [row async for row in queue.order_by('due_date', 'id').values(*REVIEW_QUEUE_FIELDS)[: limit + 1]]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = make_cursor(REVIEW_QUEUE_CURSOR_SALT, rows[-1]['due_date'], rows[-1]['id'])
+
+    evidence = {row['id']: [] for row in rows}
+    evidence_items = [
+        item
+        async for item in AssignmentEvidence.objects.filter(assignment_id__in=list(evidence))
+        .only(*REVIEW_QUEUE_EVIDENCE_FIELDS)
+        .order_by('id')
+    ]
+    for field_name, images in _evidence_images(evidence_items).items():
+        await _aprime_media_urls(request, AssignmentEvidence, field_name, images)
+    for item in evidence_items:
+        evidence[item.assignment_id].append(_evidence_payload(request, item))
+    return PrevalidatedResponse(
+        {'items': [_review_queue_row_payload(row, evidence[row['id']]) for row in rows], 'next_cursor': next_cursor},
+        request=request,
+    )
+
+
+@router.get('/sync', response={200: SyncSchema, 400: ErrorSchema, 403: AuthErrorSchema, 410: ErrorSchema})
+async def sync_changes(request: HttpRequest, since: Optional[str] = None):
+    """Get assignments, evidence and catalog objects changed or deleted since a sync token.
+
+    Without `since` this is a full sync of open assignments and the whole catalog. Pass the
+    returned `token` as `since` on the next call to receive only what changed, including
+    assignments that were closed since. Apply `deleted` before the changed rows: an
+    assignment moved to another child is reported as deleted to the child it was taken from,
+    and to parents as both deleted and changed.
+    """
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+    child_role = await ais_child(user)
+    if not (child_role or await ais_parent(user)):
+        return 403, {'message': 'Unauthorized'}
+
+    token = make_sync_token(timezone.now())
+    synced_at = None
+    if since is not None:
+        synced_at = read_sync_token(since)
+        if synced_at is None:
+            return 400, {'message': 'Invalid sync token'}
+    try:
+        cutoff = changed_since(synced_at)
+    except SyncTokenExpired:
+        return 410, {'message': 'Sync token expired; sync again without a token'}
+
+    def changed(queryset):
+        return queryset.filter(updated_at__gte=cutoff) if cutoff else queryset
+
+    assignments = changed(Assignment.objects.all())
+    evidence = changed(AssignmentEvidence.objects.all())
+    if cutoff is None:
+        assignments = assignments.filter(closed=False)
+        evidence = evidence.filter(assignment__closed=False)
+    if child_role:
+        assignments = assignments.filter(assigned_to=user)
+        evidence = evidence.filter(assignment__assigned_to=user)
+    equipment_ids = Prefetch('equipment', queryset=Equipment.objects.only('id'))
+    task_ids = Prefetch('tasks', queryset=Task.objects.only('id'))
+
+    assignment_rows = [row async for row in assignments.order_by('id').values(*SYNC_ASSIGNMENT_FIELDS)]
+    evidence_items = [item async for item in evidence.order_by('id')]
+    chores = [item async for item in changed(Chore.objects.prefetch_related(equipment_ids, task_ids)).order_by('id')]
+    equipment_rows = [row async for row in changed(Equipment.objects.order_by('id')).values(*SYNC_EQUIPMENT_FIELDS)]
+    locations = [item async for item in changed(Location.objects.order_by('id'))]
+    tasks = [item async for item in changed(Task.objects.prefetch_related(equipment_ids)).order_by('id')]
+    deleted = await adeleted_since(cutoff, owner_id=user.id if child_role else None)
+
+    for field_name, images in _evidence_images(evidence_items).items():
+        await _aprime_media_urls(request, AssignmentEvidence, field_name, images)
+    await _aprime_media_urls(
+        request, Equipment, 'image', [(row['image'], row['image_derivatives']) for row in equipment_rows]
+    )
+    await _aprime_media_urls(
+        request, Chore, 'instructions_video', [(chore.instructions_video.name, None) for chore in chores]
+    )
+    return PrevalidatedResponse(
+        {
+            'token': token,
+            'full': cutoff is None,
+            'assignments': [_sync_assignment_row_payload(row) for row in assignment_rows],
+            'evidence': [
+                {**_evidence_payload(request, item), 'assignment_id': item.assignment_id} for item in evidence_items
+            ],
+            'chores': [_sync_chore_payload(request, chore) for chore in chores],
+            'equipment': [_sync_equipment_row_payload(request, row) for row in equipment_rows],
+            'locations': [_build_location_schema(location) for location in locations],
+            'tasks': [_sync_task_payload(task) for task in tasks],
+            'deleted': deleted,
+        },
+        request=request,
+    )
+
+
+@router.get('/events', response={403: AuthErrorSchema, 501: ErrorSchema})
+async def stream_assignment_events(request: HttpRequest):
+    """Stream assignment events as server-sent events.
+
+    Children receive events for their own assignments and parents for every child's. Events
+    are not replayed, so after connecting or reconnecting fetch missed changes with `/sync`.
+    """
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+    if await ais_child(user):
+        channels = [child_channel(user.id)]
+    elif await ais_parent(user):
+        channels = [PARENTS_CHANNEL]
+    else:
+        return 403, {'message': 'Unauthorized'}
+    if not isinstance(request, ASGIRequest):
+        # A WSGI worker would hold a thread and buffer the endless stream.
+        return 501, {'message': 'Event streams require the ASGI server'}
+
+    response = StreamingHttpResponse(
+        event_stream(channels, heartbeat=SSE_HEARTBEAT_SECONDS), content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering events.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _transition_assignment(
+    request: HttpRequest, assignment_id: int, action: str, conflict_message: str, owner_id: Optional[int] = None
+):
+    """Apply a guarded transition and return the updated detail or the reason it did not apply.
+
+    When `owner_id` is given the transition only applies to assignments assigned to that user.
+    """
+    queryset = Assignment.objects.filter(id=assignment_id)
+    if owner_id is not None:
+        queryset = queryset.filter(assigned_to_id=owner_id)
+    if apply_transition(queryset, action):
+        # The updated row, its chore and its evidence in one read.
+        rows = list(
+            Assignment.objects.filter(id=assignment_id).order_by('evidence__id').values(*ASSIGNMENT_DETAIL_ROW_FIELDS)
+        )
+        if not rows:
+            return 404, {'message': 'Assignment not found'}
+        publish_assignment_event(TRANSITION_EVENTS[action], [(assignment_id, rows[0]['assigned_to_id'])])
+        return PrevalidatedResponse(_assignment_detail_rows_payload(request, rows), request=request)
+
+    # Nothing matched: work out whether the row is missing, someone else's, or in the wrong state.
+    row = Assignment.objects.filter(id=assignment_id).values('assigned_to_id').first()
+    if not row:
+        return 404, {'message': 'Assignment not found'}
+    if owner_id is not None and row['assigned_to_id'] != owner_id:
+        return 403, {'message': 'Unauthorized'}
+    return 409, {'message': conflict_message}
+
+
+# Registered ahead of the /assignments/{assignment_id} routes so "bulk" is not read as an id.
+@router.post('/assignments/bulk', response={200: BulkAssignmentResultSchema, 403: AuthErrorSchema})
+def bulk_review_assignments(request: HttpRequest, payload: BulkAssignmentActionSchema):
+    """Allow a parent to approve, reset or close many assignments at once."""
+    user = _get_request_user(request)
+    if not user or not is_parent(user):
+        return 403, {'message': 'Unauthorized'}
 
-    return _build_chore_detail(request, chore)
+    assignment_ids = list(dict.fromkeys(payload.assignment_ids))
+    with transaction.atomic():
+        # Lock the requested rows and evaluate the transition guard in the same query.
+        rows = list(
+            Assignment.objects.select_for_update()
+            .filter(id__in=assignment_ids)
+            .annotate(eligible=transition_eligibility(payload.action))
+            .values_list('id', 'assigned_to_id', 'eligible')
+        )
+        eligibility = {assignment_id: eligible for assignment_id, _, eligible in rows}
+        applied = [(assignment_id, child_id) for assignment_id, child_id, eligible in rows if eligible]
+        if applied:
+            apply_transition(Assignment.objects.filter(id__in=[pair[0] for pair in applied]), payload.action)
+            publish_assignment_event(TRANSITION_EVENTS[payload.action], applied)
+
+    results = []
+    for assignment_id in assignment_ids:
+        if assignment_id not in eligibility:
+            outcome = 'not_found'
+        elif eligibility[assignment_id]:
+            outcome = 'applied'
+        else:
+            outcome = 'conflict'
+        results.append({'assignment_id': assignment_id, 'outcome': outcome})
+    return PrevalidatedResponse({'action': payload.action, 'results': results}, request=request)
 
 
 @router.get(
     '/assignments/{assignment_id}',
-    response={200: AssignmentDetailSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
+    response={200: SparseAssignmentDetailSchema, 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
 )
-def get_assignment_detail(request: HttpRequest, assignment_id: int):
+async def get_assignment_detail(
+    request: HttpRequest, assignment_id: int, fields: Optional[str] = None, expand: Optional[str] = None
+):
     """Get the status and details for a specific assignment."""
     user = _get_request_user(request)
     if not user:
         return 403, {'message': 'Unauthorized'}
+    try:
+        selection = FieldSelection.parse(
+            fields, expand, ASSIGNMENT_DETAIL_COLUMNS, ASSIGNMENT_DETAIL_RELATIONS, key_field='assignment_id'
+        )
+    except FieldSelectionError as error:
+        return 400, {'message': str(error)}
 
-    assignment = (
-        Assignment.objects.filter(id=assignment_id)
-        .select_related('chore', 'assigned_to')
-        .prefetch_related('evidence')
-        .first()
-    )
+    assignment = await _assignment_detail_queryset(selection).filter(id=assignment_id).afirst()
     if not assignment:
         return 404, {'message': 'Assignment not found'}
-    if is_child(user) and assignment.assigned_to_id != user.id:
+    child_role = await ais_child(user)
+    if child_role and assignment.assigned_to_id != user.id:
         return 403, {'message': 'Unauthorized'}
-    if not (is_child(user) or is_parent(user)):
+    if not (child_role or await ais_parent(user)):
         return 403, {'message': 'Unauthorized'}
 
-    summary = _build_assignment_summary(assignment)
-    return AssignmentDetailSchema(
-        **summary.dict(),
-        approved_at=assignment.approved_at,
-        completed_at=assignment.completed_at,
-        closed_at=assignment.closed_at,
-        evidence=[_build_evidence_schema(request, item) for item in assignment.evidence.all()],
-    )
+    if selection.expands('evidence'):
+        for field_name, images in _evidence_images(list(assignment.evidence.all())).items():
+            await _aprime_media_urls(request, AssignmentEvidence, field_name, images)
+    return PrevalidatedResponse(_assignment_detail_payload(request, assignment, selection), request=request)
 
 
+# Transitions and evidence uploads accept an `Idempotency-Key` header so retries replay the first response
+# (see `apps.core.idempotency`).
 @router.patch(
     '/assignments/{assignment_id}/ready-for-approval',
     response={200: AssignmentDetailSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
 )
+@decorate_view(idempotent)
 def mark_assignment_ready_for_approval(request: HttpRequest, assignment_id: int):
     """Allow a child to mark an assignment as ready for approval."""
     user = _get_request_user(request)
     if not user or not is_child(user):
         return 403, {'message': 'Unauthorized'}
 
-    assignment = Assignment.objects.filter(id=assignment_id).select_related('assigned_to').first()
-    if not assignment:
-        return 404, {'message': 'Assignment not found'}
-    if assignment.assigned_to_id != user.id:
-        return 403, {'message': 'Unauthorized'}
-    if assignment.closed or assignment.approved:
-        return 409, {'message': 'Assignment is closed or already approved'}
-
-    now = timezone.now()
-    assignment.pending_approval = True
-    assignment.is_completed = True
-    assignment.completed_at = assignment.completed_at or now
-    assignment.save(update_fields=['pending_approval', 'is_completed', 'completed_at', 'updated_at'])
-
-    return get_assignment_detail(request, assignment_id)
+    return _transition_assignment(
+        request, assignment_id, READY_FOR_APPROVAL, 'Assignment is closed or already approved', owner_id=user.id
+    )
 
 
 @router.patch(
     '/assignments/{assignment_id}/mark-incomplete',
     response={200: AssignmentDetailSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
 )
+@decorate_view(idempotent)
 def mark_assignment_incomplete(request: HttpRequest, assignment_id: int):
     """Allow a parent to mark an assignment back to incomplete."""
     user = _get_request_user(request)
     if not user or not is_parent(user):
         return 403, {'message': 'Unauthorized'}
 
-    assignment = Assignment.objects.filter(id=assignment_id).first()
-    if not assignment:
-        return 404, {'message': 'Assignment not found'}
-    if assignment.closed:
-        return 409, {'message': 'Assignment is closed'}
-
-    assignment.pending_approval = False
-    assignment.approved = False
-    assignment.is_completed = False
-    assignment.completed_at = None
-    assignment.approved_at = None
-    assignment.closed = False
-    assignment.closed_at = None
-    assignment.save(
-        update_fields=[
-            'pending_approval',
-            'approved',
-            'is_completed',
-            'completed_at',
-            'approved_at',
-            'closed',
-            'closed_at',
-            'updated_at',
-        ]
-    )
-
-    return get_assignment_detail(request, assignment_id)
+    return _transition_assignment(request, assignment_id, MARK_INCOMPLETE, 'Assignment is closed')
 
 
 @router.patch(
     '/assignments/{assignment_id}/approve',
     response={200: AssignmentDetailSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
 )
+@decorate_view(idempotent)
 def approve_assignment(request: HttpRequest, assignment_id: int):
     """Allow a parent to approve and complete an assignment."""
     user = _get_request_user(request)
     if not user or not is_parent(user):
         return 403, {'message': 'Unauthorized'}
 
-    assignment = Assignment.objects.filter(id=assignment_id).first()
-    if not assignment:
-        return 404, {'message': 'Assignment not found'}
-    if assignment.closed:
-        return 409, {'message': 'Assignment is closed'}
-
-    now = timezone.now()
-    assignment.approved = True
-    assignment.pending_approval = False
-    assignment.is_completed = True
-    assignment.completed_at = assignment.completed_at or now
-    assignment.approved_at = now
-    assignment.closed = True
-    assignment.closed_at = now
-    assignment.save(
-        update_fields=[
-            'approved',
-            'pending_approval',
-            'is_completed',
-            'completed_at',
-            'approved_at',
-            'closed',
-            'closed_at',
-            'updated_at',
-        ]
-    )
-
-    return get_assignment_detail(request, assignment_id)
+    return _transition_assignment(request, assignment_id, APPROVE, 'Assignment is closed')
 
 
 @router.post(
     '/assignments/{assignment_id}/evidence',
     response={201: EvidenceSchema, 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
 )
+@decorate_view(idempotent)
 def upload_assignment_evidence(
     request: HttpRequest,
     assignment_id: int,
@@ -374,14 +1172,51 @@ def upload_assignment_evidence(
     if photo and video:
         return 400, {'message': 'Provide either a photo or a video, not both'}
 
-    evidence = AssignmentEvidence.objects.create(assignment=assignment, photo=photo, video=video)
+    try:
+        evidence = AssignmentEvidence.objects.create(assignment=assignment, photo=photo, video=video)
+    except UnreadableImageError:
+        return 400, {'message': UNREADABLE_PHOTO_MESSAGE}
     return 201, _build_evidence_schema(request, evidence)
 
 
+def _create_evidence_batch(assignment: Assignment, uploads: list[tuple[str, UploadedFile]]) -> list[AssignmentEvidence]:
+    """Push `(field name, file)` uploads to storage in parallel, then insert their rows in one statement.
+
+    Photos are normalized before anything is stored, so an unreadable one raises `UnreadableImageError`
+    with nothing written. Stored files are removed again if the insert fails.
+    """
+    evidence = [AssignmentEvidence(assignment=assignment) for _ in uploads]
+    files = []
+    for item, (field_name, upload) in zip(evidence, uploads):
+        field = AssignmentEvidence._meta.get_field(field_name)
+        if field_name == 'photo':
+            # bulk_create skips pre_save, where single uploads are normalized.
+            upload = normalize_image(upload, AssignmentEvidence._meta.label).file
+        files.append((field.storage, field.generate_filename(item, upload.name), upload))
+    max_length = min(AssignmentEvidence._meta.get_field(name).max_length for name in ('photo', 'video'))
+    names = save_files_concurrently(files, max_length=max_length)
+    for item, (field_name, _), name in zip(evidence, uploads, names):
+        setattr(item, field_name, name)
+
+    try:
+        with transaction.atomic():
+            created = AssignmentEvidence.objects.bulk_create(evidence)
+    except Exception:
+        delete_stored_files((storage, name) for (storage, _, _), name in zip(files, names))
+        raise
+
+    # bulk_create skips post_save, so queue photo derivatives and announce the evidence here.
+    for item in created:
+        schedule_derivatives(item)
+    publish_assignment_event(EVIDENCE_ADDED, [(assignment.id, assignment.assigned_to_id)])
+    return created
+
+
 @router.post(
     '/assignments/{assignment_id}/evidence/batch',
     response={201: list[EvidenceSchema], 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
 )
+@decorate_view(idempotent)
 def upload_assignment_evidence_batch(
     request: HttpRequest,
     assignment_id: int,
@@ -414,13 +1249,280 @@ def upload_assignment_evidence_batch(
     if not photos and not videos:
         return 400, {'message': 'At least one photo or video is required'}
 
-    created = []
-    for photo in photos:
-        created.append(AssignmentEvidence.objects.create(assignment=assignment, photo=photo))
-    for video in videos:
-        created.append(AssignmentEvidence.objects.create(assignment=assignment, video=video))
+    try:
+        created = _create_evidence_batch(
+            assignment, [('photo', item) for item in photos] + [('video', item) for item in videos]
+        )
+    except UnreadableImageError:
+        return 400, {'message': UNREADABLE_PHOTO_MESSAGE}
+    return 201, _evidence_list_payload(request, created)
+
+
+def _get_evidence_upload(request: HttpRequest, assignment_id: int, upload_id: UUID):
+    """Return the caller's upload for this assignment, or an error response tuple."""
+    user = _get_request_user(request)
+    if not user:
+        return None, (403, {'message': 'Unauthorized'})
+    upload = EvidenceUpload.objects.filter(id=upload_id, assignment_id=assignment_id).first()
+    if not upload:
+        return None, (404, {'message': 'Upload not found'})
+    if upload.created_by_id != user.id:
+        return None, (403, {'message': 'Unauthorized'})
+    return upload, None
+
+
+def _evidence_upload_payload(upload: EvidenceUpload) -> dict:
+    """Build an `EvidenceUploadSchema`-shaped payload."""
+    return {
+        'id': upload.id,
+        'offset': upload.received,
+        'size': upload.size,
+        'chunk_size': MAX_CHUNK_SIZE,
+        'expires_at': upload.expires_at,
+        'completed': upload.completed_at is not None,
+    }
 
-    return 201, [_build_evidence_schema(request, item) for item in created]
+
+@router.post(
+    '/assignments/{assignment_id}/evidence/uploads',
+    response={201: EvidenceUploadSchema, 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
+)
+def create_evidence_upload(request: HttpRequest, assignment_id: int, payload: EvidenceUploadCreateSchema):
+    """Start a resumable video evidence upload; send the bytes with PUT requests, then complete it."""
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+
+    assignment = Assignment.objects.filter(id=assignment_id).first()
+    if not assignment:
+        return 404, {'message': 'Assignment not found'}
+    if is_child(user) and assignment.assigned_to_id != user.id:
+        return 403, {'message': 'Unauthorized'}
+    if not (is_child(user) or is_parent(user)):
+        return 403, {'message': 'Unauthorized'}
+    if assignment.closed or assignment.approved:
+        return 409, {'message': 'Assignment is closed or approved'}
+    if payload.size > MAX_UPLOAD_SIZE:
+        return 400, {'message': f'Uploads are limited to {MAX_UPLOAD_SIZE} bytes'}
+
+    upload = EvidenceUpload.objects.create(
+        assignment=assignment,
+        created_by=user,
+        filename=clean_filename(payload.filename),
+        size=payload.size,
+        sha256=(payload.sha256 or '').lower(),
+        expires_at=timezone.now() + UPLOAD_TTL,
+    )
+    create_scratch_file(upload)
+    return 201, _evidence_upload_payload(upload)
+
+
+@router.get(
+    '/assignments/{assignment_id}/evidence/uploads/{upload_id}',
+    response={200: EvidenceUploadSchema, 403: AuthErrorSchema, 404: NotFoundSchema},
+)
+def get_evidence_upload(request: HttpRequest, assignment_id: int, upload_id: UUID):
+    """Report how many bytes of an upload were stored, so an interrupted client can resume."""
+    upload, error = _get_evidence_upload(request, assignment_id, upload_id)
+    if error:
+        return error
+    return _evidence_upload_payload(upload)
+
+
+@router.put(
+    '/assignments/{assignment_id}/evidence/uploads/{upload_id}',
+    response={
+        200: EvidenceUploadSchema,
+        400: ErrorSchema,
+        403: AuthErrorSchema,
+        404: NotFoundSchema,
+        409: EvidenceUploadConflictSchema,
+        410: ErrorSchema,
+        413: ErrorSchema,
+    },
+)
+def put_evidence_upload_chunk(request: HttpRequest, assignment_id: int, upload_id: UUID, offset: int):
+    """Store the raw request body at `offset`.
+
+    `offset` must equal the bytes stored so far; a 409 reports the offset to resume from. An
+    optional `X-Chunk-SHA256` header is verified before the chunk is accepted.
+    """
+    upload, error = _get_evidence_upload(request, assignment_id, upload_id)
+    if error:
+        return error
+    if upload.completed_at or upload.expires_at <= timezone.now():
+        return 410, {'message': 'Upload is no longer accepting data'}
+    if offset != upload.received:
+        return 409, {'message': 'Chunk offset does not match the stored size', 'offset': upload.received}
+
+    length = int(request.META.get('CONTENT_LENGTH') or 0)
+    if length > MAX_CHUNK_SIZE:
+        return 413, {'message': f'Chunks are limited to {MAX_CHUNK_SIZE} bytes'}
+    if not length or offset + length > upload.size:
+        return 400, {'message': 'Chunk is empty or extends past the declared size'}
+
+    try:
+        with locked_scratch_file(upload) as scratch:
+            write_chunk(scratch, offset, request, length, request.headers.get('X-Chunk-SHA256'))
+            # Only the request that still sees the old offset may advance it.
+            advanced = EvidenceUpload.objects.filter(id=upload.id, received=offset).update(
+                received=offset + length, expires_at=timezone.now() + UPLOAD_TTL, updated_at=timezone.now()
+            )
+    except UploadBusy:
+        return 409, {'message': 'Another chunk is being written', 'offset': upload.received}
+    except ScratchFileMissing:
+        upload.delete()
+        return 410, {'message': SCRATCH_FILE_MISSING_MESSAGE}
+    except ChunkError as exc:
+        return 400, {'message': str(exc)}
+    if not advanced:
+        upload.refresh_from_db(fields=['received'])
+        return 409, {'message': 'Chunk offset does not match the stored size', 'offset': upload.received}
+
+    upload.refresh_from_db()
+    return _evidence_upload_payload(upload)
+
+
+@router.post(
+    '/assignments/{assignment_id}/evidence/uploads/{upload_id}/complete',
+    response={
+        201: EvidenceSchema,
+        400: ErrorSchema,
+        403: AuthErrorSchema,
+        404: NotFoundSchema,
+        409: EvidenceUploadConflictSchema,
+        410: ErrorSchema,
+    },
+)
+def complete_evidence_upload(request: HttpRequest, assignment_id: int, upload_id: UUID):
+    """Attach a fully received upload to the assignment as video evidence."""
+    upload, error = _get_evidence_upload(request, assignment_id, upload_id)
+    if error:
+        return error
+    if upload.evidence_id:
+        # Completing twice returns the evidence created the first time.
+        return 201, _build_evidence_schema(request, upload.evidence)
+    if upload.completed_at:
+        return 409, {'message': 'Upload is already being completed', 'offset': upload.received}
+    if upload.expires_at <= timezone.now():
+        return 410, {'message': 'Upload has expired'}
+    if upload.received != upload.size:
+        return 409, {'message': 'Upload is missing data', 'offset': upload.received}
+    assignment = upload.assignment
+    if assignment.closed or assignment.approved:
+        return 409, {'message': 'Assignment is closed or approved', 'offset': upload.received}
+
+    if not EvidenceUpload.objects.filter(id=upload.id, completed_at=None).update(completed_at=timezone.now()):
+        return 409, {'message': 'Upload is already being completed', 'offset': upload.received}
+
+    path = upload_path(upload)
+    try:
+        if upload.sha256 and file_sha256(path) != upload.sha256:
+            discard_scratch_file(upload)
+            upload.delete()
+            return 400, {'message': 'Uploaded file does not match its checksum; start a new upload'}
+        assembled = open(path, 'rb')
+    except FileNotFoundError:
+        upload.delete()
+        return 410, {'message': SCRATCH_FILE_MISSING_MESSAGE}
+
+    evidence = AssignmentEvidence(assignment=assignment)
+    try:
+        with assembled:
+            # Storage backends copy from the open file in chunks.
+            evidence.video.save(upload.filename, DjangoFile(assembled), save=False)
+        with transaction.atomic():
+            evidence.save()
+            EvidenceUpload.objects.filter(id=upload.id).update(evidence=evidence)
+    except Exception:
+        if evidence.video:
+            delete_stored_files([(evidence.video.storage, evidence.video.name)])
+        EvidenceUpload.objects.filter(id=upload.id).update(completed_at=None)
+        raise
+    discard_scratch_file(upload)
+    return 201, _build_evidence_schema(request, evidence)
+
+
+@router.post(
+    '/assignments/{assignment_id}/evidence/direct-uploads',
+    response={
+        201: DirectUploadSchema,
+        400: ErrorSchema,
+        403: AuthErrorSchema,
+        404: NotFoundSchema,
+        409: ErrorSchema,
+        501: ErrorSchema,
+    },
+)
+def create_direct_evidence_upload(request: HttpRequest, assignment_id: int, payload: DirectUploadCreateSchema):
+    """Sign URLs that let the client upload one evidence file straight to object storage."""
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+    storage = evidence_storage(payload.kind)
+    if not supports_direct_uploads(storage):
+        return 501, {'message': 'Direct uploads require S3 storage'}
+
+    assignment = Assignment.objects.filter(id=assignment_id).first()
+    if not assignment:
+        return 404, {'message': 'Assignment not found'}
+    if is_child(user) and assignment.assigned_to_id != user.id:
+        return 403, {'message': 'Unauthorized'}
+    if not (is_child(user) or is_parent(user)):
+        return 403, {'message': 'Unauthorized'}
+    if assignment.closed or assignment.approved:
+        return 409, {'message': 'Assignment is closed or approved'}
+    content_type_prefix, max_size = DIRECT_UPLOAD_KINDS[payload.kind]
+    if not payload.content_type.startswith(content_type_prefix):
+        return 400, {'message': f'A {payload.kind} must have a {content_type_prefix}* content type'}
+    if payload.size > max_size:
+        return 400, {'message': f'A {payload.kind} is limited to {max_size} bytes'}
+
+    name = evidence_object_name(assignment.id, payload.kind, payload.filename)
+    token = sign_upload_token(assignment.id, user.id, payload.kind, name, payload.content_type, payload.size)
+    return 201, {
+        'token': token,
+        'expires_at': upload_expires_at(),
+        **presign_upload(storage, name, payload.content_type, payload.size),
+    }
+
+
+@router.post(
+    '/assignments/{assignment_id}/evidence/direct-uploads/confirm',
+    response={201: EvidenceSchema, 400: ErrorSchema, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
+)
+def confirm_direct_evidence_upload(request: HttpRequest, assignment_id: int, payload: DirectUploadConfirmSchema):
+    """Create evidence for a file the client uploaded with a signed URL."""
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+    claims = load_upload_token(payload.token)
+    if not claims or claims['assignment'] != assignment_id:
+        return 400, {'message': 'Upload token is invalid or expired'}
+    if claims['user'] != user.id:
+        return 403, {'message': 'Unauthorized'}
+
+    assignment = Assignment.objects.filter(id=assignment_id).first()
+    if not assignment:
+        return 404, {'message': 'Assignment not found'}
+    kind, name = claims['kind'], claims['name']
+    existing = AssignmentEvidence.objects.filter(assignment=assignment, **{kind: name}).first()
+    if existing:
+        # Confirming twice returns the evidence created the first time.
+        return 201, _build_evidence_schema(request, existing)
+    if assignment.closed or assignment.approved:
+        return 409, {'message': 'Assignment is closed or approved'}
+
+    try:
+        verify_uploaded_object(evidence_storage(kind), claims)
+    except DirectUploadError as exc:
+        return 400, {'message': str(exc)}
+
+    evidence = AssignmentEvidence.objects.create(assignment=assignment, **{kind: name})
+    if kind == 'photo':
+        # The photo skipped `image_saving`, so its metadata is stripped in the background.
+        transaction.on_commit(partial(normalize_direct_photo.delay, evidence.id))
+    return 201, _build_evidence_schema(request, evidence)
 
 
 @router.get(
@@ -448,6 +1550,37 @@ def get_assignment_evidence(request: HttpRequest, assignment_id: int, evidence_i
     return _build_evidence_schema(request, evidence)
 
 
+@router.get(
+    '/assignments/{assignment_id}/evidence/{evidence_id}/files/{path:name}',
+    response={403: AuthErrorSchema, 404: NotFoundSchema},
+    url_name=EVIDENCE_FILE_URL_NAME,
+)
+def get_evidence_file(request: HttpRequest, assignment_id: int, evidence_id: int, name: str):
+    """Download an evidence photo, photo derivative or video.
+
+    Access is checked with one query; the front proxy then sends the file when `MEDIA_DELIVERY`
+    is set, so the download does not hold a worker.
+    """
+    user = _get_request_user(request)
+    if not user:
+        return 403, {'message': 'Unauthorized'}
+
+    allowed = Q(_has_role(user, 'parent')) | Q(_has_role(user, 'child'), assignment__assigned_to_id=user.id)
+    evidence = (
+        AssignmentEvidence.objects.filter(allowed, id=evidence_id, assignment_id=assignment_id)
+        .values('photo', 'photo_derivatives', 'video')
+        .first()
+    )
+    # Evidence the user may not see is reported as missing rather than revealed.
+    if not evidence:
+        return 404, {'message': 'Evidence not found'}
+    files = {evidence['photo']: 'photo', evidence['video']: 'video'}
+    files.update(dict.fromkeys(current_derivatives(evidence['photo'], evidence['photo_derivatives']).values(), 'photo'))
+    if not name or name not in files:
+        return 404, {'message': 'File not found'}
+    return serve_media(request, evidence_storage(files[name]), name)
+
+
 @router.delete(
     '/assignments/{assignment_id}/evidence/{evidence_id}',
     response={204: None, 403: AuthErrorSchema, 404: NotFoundSchema, 409: ErrorSchema},
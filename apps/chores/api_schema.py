@@ -1,7 +1,14 @@
-from datetime import datetime, time
-from typing import Optional
+from datetime import date, datetime, time
+from typing import Literal, Optional
+from uuid import UUID
 
-from ninja import Schema
+from ninja import Field, Schema
+
+from apps.core.fieldsets import sparse_schema
+
+BULK_ASSIGNMENT_LIMIT = 200
+REVIEW_QUEUE_PAGE_SIZE = 50
+REVIEW_QUEUE_PAGE_LIMIT = 200
 
 
 class ErrorSchema(Schema):
@@ -18,6 +25,8 @@ class ChoreSummarySchema(Schema):
 class EvidenceSchema(Schema):
     id: int
     photo_url: Optional[str]
+    photo_thumbnail_url: Optional[str]
+    photo_medium_url: Optional[str]
     video_url: Optional[str]
     created_at: datetime
 
@@ -39,6 +48,60 @@ class AssignmentDetailSchema(AssignmentSummarySchema):
     evidence: list[EvidenceSchema]
 
 
+class EvidenceUploadCreateSchema(Schema):
+    filename: str = Field(..., min_length=1, max_length=255)
+    size: int = Field(..., gt=0)
+    sha256: Optional[str] = Field(None, pattern=r'^[0-9a-fA-F]{64}$')
+
+
+class EvidenceUploadSchema(Schema):
+    id: UUID
+    offset: int
+    size: int
+    chunk_size: int
+    expires_at: datetime
+    completed: bool
+
+
+class EvidenceUploadConflictSchema(ErrorSchema):
+    offset: int
+
+
+class DirectUploadCreateSchema(Schema):
+    kind: Literal['photo', 'video']
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str = Field(..., max_length=100)
+    size: int = Field(..., gt=0)
+
+
+class DirectUploadSchema(Schema):
+    token: str
+    post_url: str
+    post_fields: dict[str, str]
+    put_url: str
+    put_headers: dict[str, str]
+    expires_at: datetime
+
+
+class DirectUploadConfirmSchema(Schema):
+    token: str
+
+
+class BulkAssignmentActionSchema(Schema):
+    action: Literal['approve', 'mark-incomplete', 'close']
+    assignment_ids: list[int] = Field(..., min_length=1, max_length=BULK_ASSIGNMENT_LIMIT)
+
+
+class BulkAssignmentOutcomeSchema(Schema):
+    assignment_id: int
+    outcome: Literal['applied', 'not_found', 'conflict']
+
+
+class BulkAssignmentResultSchema(Schema):
+    action: str
+    results: list[BulkAssignmentOutcomeSchema]
+
+
 class LocationSchema(Schema):
     id: int
     name: str
@@ -53,6 +116,8 @@ class EquipmentSchema(Schema):
     location: Optional[LocationSchema]
     notes: Optional[dict]
     image_url: Optional[str]
+    image_thumbnail_url: Optional[str]
+    image_medium_url: Optional[str]
 
 
 class TaskSchema(Schema):
@@ -87,3 +152,118 @@ class ChoreDetailSchema(Schema):
     minimum_age: Optional[int]
     assign_to_all: bool
     disabled: bool
+
+
+# Declared by endpoints accepting `fields` and `expand`, whose responses may leave fields out.
+SparseAssignmentSummarySchema = sparse_schema(AssignmentSummarySchema)
+SparseAssignmentDetailSchema = sparse_schema(AssignmentDetailSchema)
+SparseLocationSchema = sparse_schema(LocationSchema)
+SparseEquipmentSchema = sparse_schema(EquipmentSchema)
+SparseChoreDetailSchema = sparse_schema(ChoreDetailSchema)
+
+
+class SyncAssignmentSchema(AssignmentSummarySchema):
+    approved_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    closed_at: Optional[datetime]
+
+
+class SyncEvidenceSchema(EvidenceSchema):
+    assignment_id: int
+
+
+class SyncEquipmentSchema(Schema):
+    id: int
+    name: str
+    description: str
+    location_id: Optional[int]
+    notes: Optional[dict]
+    image_url: Optional[str]
+    image_thumbnail_url: Optional[str]
+    image_medium_url: Optional[str]
+
+
+class SyncTaskSchema(Schema):
+    id: int
+    name: str
+    description: str
+    notes: Optional[dict]
+    steps: Optional[dict]
+    equipment_ids: list[int]
+
+
+class SyncChoreSchema(Schema):
+    id: int
+    name: str
+    description: str
+    points: int
+    penalize_incomplete: bool
+    penalty_amount: int
+    is_recurring: bool
+    recurrence: Optional[str]
+    recurrence_day_of_week: Optional[str]
+    recurrence_day_of_month: Optional[str]
+    instructions_video_url: Optional[str]
+    instructions_video_name: str
+    instructions_video_source: Optional[str]
+    location_id: Optional[int]
+    equipment_ids: list[int]
+    task_ids: list[int]
+    notes: Optional[dict]
+    time_due: Optional[time]
+    age_restricted: bool
+    minimum_age: Optional[int]
+    assign_to_all: bool
+    disabled: bool
+
+
+class SyncDeletedSchema(Schema):
+    assignment: list[int]
+    evidence: list[int]
+    chore: list[int]
+    equipment: list[int]
+    location: list[int]
+    task: list[int]
+
+
+class SyncSchema(Schema):
+    token: str
+    full: bool
+    assignments: list[SyncAssignmentSchema]
+    evidence: list[SyncEvidenceSchema]
+    chores: list[SyncChoreSchema]
+    equipment: list[SyncEquipmentSchema]
+    locations: list[LocationSchema]
+    tasks: list[SyncTaskSchema]
+    deleted: SyncDeletedSchema
+
+
+class DashboardChildSchema(Schema):
+    id: int
+    first_name: str
+    last_name: str
+    open_count: int
+    pending_approval_count: int
+    due_today: int
+    completed_today: int
+    approved_today: int
+    points_today: int
+    assignments: list[AssignmentSummarySchema]
+
+
+class DashboardSchema(Schema):
+    date: date
+    children: list[DashboardChildSchema]
+
+
+class ReviewQueueItemSchema(AssignmentSummarySchema):
+    child_id: int
+    child_first_name: str
+    child_last_name: str
+    completed_at: Optional[datetime]
+    evidence: list[EvidenceSchema]
+
+
+class ReviewQueueSchema(Schema):
+    items: list[ReviewQueueItemSchema]
+    next_cursor: Optional[str]
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ChoresConfig(AppConfig):
     name = 'apps.chores'
+
+    def ready(self) -> None:
+        from apps.chores.signals import connect_signals
+
+        connect_signals()
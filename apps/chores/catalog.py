@@ -0,0 +1,144 @@
+"""Catalog versioning and payload caching for chore catalog endpoints.
+
+Chores, tasks, equipment and locations change rarely, so a single version token
+stored in the cache is enough to validate client copies. The token is the
+nanosecond timestamp of the last catalog write, which doubles as the
+Last-Modified value and never repeats after a cache eviction.
+"""
+
+import hashlib
+import time
+from typing import Any, Optional
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from apps.core.media import signing_window_start
+from apps.core.renderers import negotiate_renderer
+
+CATALOG_VERSION_KEY = 'chores:catalog-version'
+
+
+def get_catalog_version() -> int:
+    """Return the current catalog version, initializing it if the cache is cold."""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # add() keeps concurrent initializers from overwriting each other.
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+async def aget_catalog_version() -> int:
+    """Async `get_catalog_version` for async views."""
+    version = await cache.aget(CATALOG_VERSION_KEY)
+    if version is None:
+        await cache.aadd(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version() -> int:
+    """Record a catalog write and return the new version."""
+    version = time.time_ns()
+    cache.set(CATALOG_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def catalog_etag(request: HttpRequest, version: int, *parts: object) -> str:
+    """Build a strong ETag for a catalog representation.
+
+    Payloads embed absolute media URLs, so the request host is part of the tag, as is the
+    negotiated response encoding. Signed media URLs expire, so with a signing storage the
+    tag also changes with each signing window and clients do not revalidate dead URLs.
+    """
+    media_type = negotiate_renderer(request).media_type
+    window = signing_window_start(default_storage)
+    source = ':'.join([request.get_host(), media_type, str(version), str(window), *(str(part) for part in parts)])
+    return f'"{hashlib.blake2b(source.encode(), digest_size=16).hexdigest()}"'
+
+
+def _evaluate_validators(
+    request: HttpRequest, response: HttpResponse, version: int, parts: tuple
+) -> Optional[HttpResponseBase]:
+    etag = catalog_etag(request, version, *parts)
+    # A new signing window changes the payload as much as a catalog write does.
+    last_modified = max(version // 1_000_000_000, signing_window_start(default_storage) or 0)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Clients may store the payload but must revalidate before reusing it.
+    patch_cache_control(response, private=True, no_cache=True)
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=last_modified, response=response)
+    if conditional is response:
+        return None
+    return conditional
+
+
+def apply_catalog_validators(
+    request: HttpRequest, response: HttpResponse, *parts: object
+) -> Optional[HttpResponseBase]:
+    """Stamp ETag and Last-Modified on `response` and evaluate request preconditions.
+
+    Returns a 304 (or 412) response when the client's copy is current, otherwise None
+    so the caller can go on to build the payload.
+    """
+    return _evaluate_validators(request, response, get_catalog_version(), parts)
+
+
+async def aapply_catalog_validators(
+    request: HttpRequest, response: HttpResponse, *parts: object
+) -> Optional[HttpResponseBase]:
+    """Async `apply_catalog_validators` for async views."""
+    return _evaluate_validators(request, response, await aget_catalog_version(), parts)
+
+
+# Serialized catalog payloads are cached per object, with one entry per catalog version and
+# request host: media URLs are absolute, and a catalog write retires every entry at once by
+# bumping the version. Payloads are cached before encoding, so one entry serves every response
+# encoding. Keep the timeout well under the signed media URL lifetime used by S3 storage.
+CATALOG_CACHE_TIMEOUT = 60 * 15
+LOCATIONS_CACHE_KEY = 'chores:catalog:locations'
+EQUIPMENT_CACHE_KEY = 'chores:catalog:equipment'
+
+
+def chore_detail_cache_key(chore_id: int) -> str:
+    """Return the cache key prefix of a chore's serialized detail payloads."""
+    return f'chores:catalog:chore:{chore_id}'
+
+
+def _payload_key(request: HttpRequest, key: str, version: int) -> str:
+    return f'{key}:{version}:{request.scheme}://{request.get_host()}'
+
+
+def get_cached_payload(request: HttpRequest, key: str, version: int) -> Optional[Any]:
+    """Return the payload for `key` cached at catalog `version` for this request's host, if any."""
+    return cache.get(_payload_key(request, key, version))
+
+
+async def aget_cached_payload(request: HttpRequest, key: str, version: int) -> Optional[Any]:
+    """Async `get_cached_payload` for async views."""
+    return await cache.aget(_payload_key(request, key, version))
+
+
+def cache_payload(request: HttpRequest, key: str, payload: Any, version: int) -> None:
+    """Cache `payload`, built from the catalog at `version`, for this request's host.
+
+    A payload built while a write committed is stored under the old version, which
+    readers stop asking for once the write has bumped it.
+    """
+    cache.set(_payload_key(request, key, version), payload, CATALOG_CACHE_TIMEOUT)
+
+
+async def acache_payload(request: HttpRequest, key: str, payload: Any, version: int) -> None:
+    """Async `cache_payload` for async views."""
+    await cache.aset(_payload_key(request, key, version), payload, CATALOG_CACHE_TIMEOUT)
+
+
+def invalidate_catalog() -> None:
+    """Retire every cached payload and client validator by bumping the catalog version."""
+    bump_catalog_version()
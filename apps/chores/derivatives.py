@@ -0,0 +1,88 @@
+"""Resized copies of evidence photos and equipment images.
+
+Derivatives are written beside the original and recorded in a JSON field together with the
+name of the source they were built from, so a replaced image never serves stale copies.
+"""
+
+import os
+from functools import partial
+from io import BytesIO
+from typing import Optional
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Model
+from PIL import Image, ImageOps, features
+
+# Longest edge in pixels for each derivative size. Smaller images are never upscaled.
+DERIVATIVE_SIZES = {'thumbnail': 320, 'medium': 1280}
+
+# Model label -> (source image field, JSON field recording its derivatives).
+IMAGE_DERIVATIVE_FIELDS = {
+    'chores.AssignmentEvidence': ('photo', 'photo_derivatives'),
+    'chores.Equipment': ('image', 'image_derivatives'),
+}
+
+DERIVATIVE_QUALITY = 80
+
+
+def derivative_format() -> tuple[str, str]:
+    """Return the Pillow format and file extension used for derivatives."""
+    if features.check('webp'):
+        return 'WEBP', '.webp'
+    return 'JPEG', '.jpg'
+
+
+def derivative_name(source_name: str, size: str, extension: str) -> str:
+    """Return the storage name for a derivative stored beside `source_name`."""
+    root, _ = os.path.splitext(source_name)
+    return f'{root}.{size}{extension}'
+
+
+def render_derivative(image: Image.Image, max_edge: int, image_format: str) -> bytes:
+    """Encode a copy of `image` whose longest edge is at most `max_edge` pixels."""
+    resized = image.copy()
+    resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    if image_format == 'JPEG' and resized.mode not in ('RGB', 'L'):
+        resized = resized.convert('RGB')
+    buffer = BytesIO()
+    resized.save(buffer, format=image_format, quality=DERIVATIVE_QUALITY)
+    return buffer.getvalue()
+
+
+def build_derivatives(field_file) -> dict:
+    """Write every derivative size for `field_file` and return the record to store on the row."""
+    image_format, extension = derivative_format()
+    with field_file.open('rb') as source:
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            image.load()
+
+    storage = field_file.storage
+    record = {'source': field_file.name}
+    for size, max_edge in DERIVATIVE_SIZES.items():
+        name = derivative_name(field_file.name, size, extension)
+        record[size] = storage.save(name, ContentFile(render_derivative(image, max_edge, image_format)))
+    return record
+
+
+def current_derivatives(source_name: Optional[str], record: Optional[dict]) -> dict:
+    """Return `{size: name}` for derivatives built from `source_name`, or an empty dict."""
+    if not source_name or not record or record.get('source') != source_name:
+        return {}
+    return {size: record[size] for size in DERIVATIVE_SIZES if record.get(size)}
+
+
+def needs_derivatives(instance: Model) -> bool:
+    """Whether `instance` has an image whose derivatives have not been built yet."""
+    source_field, record_field = IMAGE_DERIVATIVE_FIELDS[instance._meta.label]
+    source = getattr(instance, source_field)
+    return bool(source) and not current_derivatives(source.name, getattr(instance, record_field))
+
+
+def schedule_derivatives(instance: Model) -> None:
+    """Queue derivative generation for `instance` once the current transaction commits."""
+    from apps.chores.tasks import generate_image_derivatives
+
+    if needs_derivatives(instance):
+        transaction.on_commit(partial(generate_image_derivatives.delay, instance._meta.label, instance.pk))
@@ -0,0 +1,160 @@
+"""Presigned direct-to-S3 evidence uploads.
+
+The API signs a POST form and a PUT URL for one object key under the assignment's evidence
+prefix, and hands the client a signed token describing what it may upload. Once the client
+has sent the file to the bucket, confirming the token checks the object and creates the
+evidence row, so web workers never handle file bodies.
+
+Confirmed photos are normalized by a background task, since they never pass through the upload
+path that strips their metadata. Objects that are uploaded but never confirmed are removed by
+the periodic `purge_direct_uploads` task.
+"""
+
+import posixpath
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from botocore.exceptions import ClientError
+from django.core import signing
+from django.core.files.storage import Storage
+from django.utils import timezone
+from storages.backends.s3 import S3Storage
+
+from apps.chores.models import AssignmentEvidence
+from apps.chores.uploads import MAX_UPLOAD_SIZE, clean_filename
+
+DIRECT_UPLOAD_TTL = timedelta(minutes=15)
+TOKEN_SALT = 'chores.direct-upload'
+MAX_PHOTO_SIZE = 25 * 1024 * 1024
+# Tokens are accepted for twice the upload window; the rest leaves time for a confirm in flight.
+UNCONFIRMED_OBJECT_AGE = DIRECT_UPLOAD_TTL * 3
+
+# Evidence field -> (accepted content type prefix, maximum size in bytes).
+DIRECT_UPLOAD_KINDS = {
+    'photo': ('image/', MAX_PHOTO_SIZE),
+    'video': ('video/', MAX_UPLOAD_SIZE),
+}
+
+
+class DirectUploadError(ValueError):
+    """The uploaded object is missing or does not match what was signed."""
+
+
+def evidence_storage(kind: str) -> Storage:
+    return AssignmentEvidence._meta.get_field(kind).storage
+
+
+def supports_direct_uploads(storage: Storage) -> bool:
+    return isinstance(storage, S3Storage)
+
+
+def evidence_object_name(assignment_id: int, kind: str, filename: str) -> str:
+    """Return a fresh storage name under the evidence field's upload prefix for this assignment."""
+    field = AssignmentEvidence._meta.get_field(kind)
+    filename = field.storage.get_valid_name(clean_filename(filename))
+    return posixpath.join(field.upload_to, str(assignment_id), uuid.uuid4().hex, filename)
+
+
+def presign_upload(storage: S3Storage, name: str, content_type: str, size: int) -> dict:
+    """Sign a POST form and a PUT URL that only accept `size` bytes of `content_type` at `name`."""
+    client = storage.connection.meta.client
+    key = storage._normalize_name(name)
+    expires_in = int(DIRECT_UPLOAD_TTL.total_seconds())
+    post = client.generate_presigned_post(
+        storage.bucket_name,
+        key,
+        Fields={'Content-Type': content_type},
+        Conditions=[{'Content-Type': content_type}, ['content-length-range', size, size]],
+        ExpiresIn=expires_in,
+    )
+    put_url = client.generate_presigned_url(
+        'put_object',
+        Params={'Bucket': storage.bucket_name, 'Key': key, 'ContentType': content_type},
+        ExpiresIn=expires_in,
+    )
+    return {
+        'post_url': post['url'],
+        'post_fields': post['fields'],
+        'put_url': put_url,
+        'put_headers': {'Content-Type': content_type},
+    }
+
+
+def sign_upload_token(assignment_id: int, user_id: int, kind: str, name: str, content_type: str, size: int) -> str:
+    return signing.dumps(
+        {
+            'assignment': assignment_id,
+            'user': user_id,
+            'kind': kind,
+            'name': name,
+            'content_type': content_type,
+            'size': size,
+        },
+        salt=TOKEN_SALT,
+    )
+
+
+def load_upload_token(token: str) -> Optional[dict]:
+    """Return the claims of a token issued within the upload window, or None."""
+    try:
+        # Allow the client the full window to upload, plus time to call confirm.
+        return signing.loads(token, salt=TOKEN_SALT, max_age=DIRECT_UPLOAD_TTL * 2)
+    except signing.BadSignature:
+        return None
+
+
+def upload_expires_at() -> datetime:
+    return timezone.now() + DIRECT_UPLOAD_TTL
+
+
+def verify_uploaded_object(storage: S3Storage, claims: dict) -> None:
+    """Check the object exists with the signed size and content type, deleting it if it does not match."""
+    client = storage.connection.meta.client
+    try:
+        head = client.head_object(Bucket=storage.bucket_name, Key=storage._normalize_name(claims['name']))
+    except ClientError as exc:
+        if exc.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            raise DirectUploadError('Uploaded file was not found') from exc
+        raise
+    if head['ContentLength'] != claims['size'] or head.get('ContentType') != claims['content_type']:
+        storage.delete(claims['name'])
+        raise DirectUploadError('Uploaded file does not match the declared size or content type')
+
+
+def _storage_name(storage: S3Storage, key: str) -> str:
+    return posixpath.relpath(key, storage.location) if storage.location else key
+
+
+def purge_unconfirmed_uploads(storage: S3Storage, kind: str) -> int:
+    """Delete directly uploaded objects of `kind` that no evidence references and return how many.
+
+    Each direct upload gets its own `<upload_to>/<assignment id>/<random>/` directory, which
+    later also holds the normalized copy and derivatives. A directory is kept while an evidence
+    row names a file in it; otherwise its objects are deleted once their token can no longer
+    be confirmed.
+    """
+    upload_to = AssignmentEvidence._meta.get_field(kind).upload_to
+    cutoff = timezone.now() - UNCONFIRMED_OBJECT_AGE
+    candidates: dict[str, list[str]] = {}
+    paginator = storage.connection.meta.client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=storage._normalize_name(upload_to)):
+        for item in page.get('Contents', []):
+            name = _storage_name(storage, item['Key'])
+            assignment_id, *rest = name.removeprefix(upload_to).split('/')
+            if len(rest) != 2 or not assignment_id.isdigit() or item['LastModified'] > cutoff:
+                continue
+            candidates.setdefault(posixpath.dirname(name), []).append(name)
+    if not candidates:
+        return 0
+
+    assignment_ids = {int(directory.removeprefix(upload_to).split('/')[0]) for directory in candidates}
+    referenced = {
+        posixpath.dirname(name)
+        for name in AssignmentEvidence.objects.filter(assignment_id__in=assignment_ids).values_list(kind, flat=True)
+        if name
+    }
+    abandoned = [name for directory, names in candidates.items() if directory not in referenced for name in names]
+    for name in abandoned:
+        storage.delete(name)
+    return len(abandoned)
@@ -0,0 +1,138 @@
+"""Materialized chore detail documents.
+
+A chore's detail embeds its location, equipment and tasks, and each task's equipment with
+its location. Loading all of that takes several queries, so every chore keeps a denormalized
+copy in `Chore.detail_document` that the detail endpoint serves with a single query.
+
+Media are stored as storage names rather than URLs, which depend on the request host and
+expire on S3; the API resolves them when serving. A write to the chore or to anything it
+embeds clears the affected documents within its transaction and, once committed, queues one
+batched rebuild for all of them. Readers that find no document build and store it themselves,
+so a stale copy is never served.
+"""
+
+from itertools import batched
+from typing import Iterable, Optional
+
+from django.db.models import Prefetch, QuerySet
+
+from apps.chores.catalog import aget_catalog_version, get_catalog_version
+from apps.chores.models import Chore, Equipment, Location, Task
+
+# Chores rebuilt per round of queries; a location shared by many chores fans out to all of them.
+DETAIL_DOCUMENT_BATCH_SIZE = 200
+
+
+def detail_document_queryset() -> QuerySet:
+    """Return chores with everything their detail document embeds loaded in four queries."""
+    equipment = Equipment.objects.select_related('location')
+    return Chore.objects.select_related('location').prefetch_related(
+        Prefetch('equipment', queryset=equipment), 'tasks', Prefetch('tasks__equipment', queryset=equipment)
+    )
+
+
+def location_document(location: Optional[Location]) -> Optional[dict]:
+    """Build a `LocationSchema`-shaped payload."""
+    if not location:
+        return None
+    return {'id': location.id, 'name': location.name, 'description': location.description, 'notes': location.notes}
+
+
+def equipment_document(equipment: Equipment) -> dict:
+    """Build an equipment document: `EquipmentSchema` fields with the image name and derivatives in place of URLs."""
+    return {
+        'id': equipment.id,
+        'name': equipment.name,
+        'description': equipment.description,
+        'location': location_document(equipment.location),
+        'notes': equipment.notes,
+        'image': equipment.image.name or None,
+        'image_derivatives': equipment.image_derivatives,
+    }
+
+
+def _task_document(task: Task) -> dict:
+    return {
+        'id': task.id,
+        'name': task.name,
+        'description': task.description,
+        'notes': task.notes,
+        'steps': task.steps,
+        'equipment': [equipment_document(item) for item in task.equipment.all()],
+    }
+
+
+def build_detail_document(chore: Chore) -> dict:
+    """Build the detail document of a `detail_document_queryset` chore.
+
+    Holds the `ChoreDetailSchema` fields, with the instructions video name in place of its URL.
+    """
+    return {
+        'id': chore.id,
+        'name': chore.name,
+        'description': chore.description,
+        'points': chore.points,
+        'penalize_incomplete': chore.penalize_incomplete,
+        'penalty_amount': chore.penalty_amount,
+        'is_recurring': chore.is_recurring,
+        'recurrence': chore.recurrence,
+        'recurrence_day_of_week': chore.recurrence_day_of_week,
+        'recurrence_day_of_month': chore.recurrence_day_of_month,
+        'instructions_video': chore.instructions_video.name or None,
+        'instructions_video_name': chore.instructions_video_name,
+        'instructions_video_source': chore.instructions_video_source,
+        'location': location_document(chore.location),
+        'equipment': [equipment_document(item) for item in chore.equipment.all()],
+        'tasks': [_task_document(task) for task in chore.tasks.all()],
+        'notes': chore.notes,
+        'time_due': chore.time_due.isoformat() if chore.time_due is not None else None,
+        'age_restricted': chore.age_restricted,
+        'minimum_age': chore.minimum_age,
+        'assign_to_all': chore.assign_to_all,
+        'disabled': chore.disabled,
+    }
+
+
+def clear_detail_documents(chore_ids: Iterable[int]) -> None:
+    """Drop the detail documents of `chore_ids` so readers rebuild them instead of serving stale data."""
+    chore_ids = list(chore_ids)
+    if chore_ids:
+        Chore.objects.filter(pk__in=chore_ids).update(detail_document=None)
+
+
+def rebuild_detail_documents(chore_ids: Optional[Iterable[int]] = None) -> int:
+    """Rebuild the detail documents of `chore_ids`, or of every chore missing one, and return how many were stored.
+
+    Each batch is loaded with the same four queries however many chores it holds. A batch built
+    while another catalog write committed is cleared rather than stored; that write queues its
+    own rebuild.
+    """
+    if chore_ids is None:
+        chore_ids = Chore.objects.filter(detail_document__isnull=True).values_list('id', flat=True)
+    rebuilt = 0
+    for batch in batched(sorted(chore_ids), DETAIL_DOCUMENT_BATCH_SIZE):
+        version = get_catalog_version()
+        chores = list(detail_document_queryset().filter(pk__in=batch))
+        for chore in chores:
+            chore.detail_document = build_detail_document(chore)
+        if get_catalog_version() != version:
+            clear_detail_documents(batch)
+            continue
+        Chore.objects.bulk_update(chores, ['detail_document'])
+        rebuilt += len(chores)
+    return rebuilt
+
+
+async def astore_detail_document(chore_id: int, document: dict, version: int) -> None:
+    """Store a document a reader built, unless the catalog changed since `version` was read."""
+    if await aget_catalog_version() == version:
+        await Chore.objects.filter(pk=chore_id).aupdate(detail_document=document)
+
+
+def schedule_detail_rebuild(chore_ids: Iterable[int]) -> None:
+    """Queue one rebuild for the detail documents of `chore_ids`."""
+    from apps.chores.tasks import rebuild_chore_detail_documents
+
+    chore_ids = sorted(chore_ids)
+    if chore_ids:
+        rebuild_chore_detail_documents.delay(chore_ids)
@@ -0,0 +1,51 @@
+"""Assignment events pushed to parents and children over server-sent event streams.
+
+A child's stream carries events for their own assignments; every parent's stream carries
+events for all children. Events are published after the transaction commits, so a client
+reacting to one reads the committed state.
+"""
+
+import logging
+from functools import partial
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.chores.transitions import APPROVE, CLOSE, MARK_INCOMPLETE, READY_FOR_APPROVAL
+from apps.core.events import get_event_broker
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_ADDED = 'evidence-added'
+TRANSITION_EVENTS = {
+    READY_FOR_APPROVAL: 'ready-for-approval',
+    APPROVE: 'approved',
+    MARK_INCOMPLETE: 'incomplete',
+    CLOSE: 'closed',
+}
+PARENTS_CHANNEL = 'assignments:parents'
+
+
+def child_channel(child_id: int) -> str:
+    return f'assignments:child:{child_id}'
+
+
+def _publish(event: str, assignments: list[tuple[int, int]]) -> None:
+    broker = get_event_broker()
+    at = timezone.now().isoformat()
+    try:
+        for assignment_id, child_id in assignments:
+            message = {'event': event, 'assignment_id': assignment_id, 'child_id': child_id, 'at': at}
+            broker.publish(child_channel(child_id), message)
+            broker.publish(PARENTS_CHANNEL, message)
+    except Exception:
+        # The change is already committed; clients that miss the event pick it up on their next sync.
+        logger.exception(f'Could not publish {event} events for {len(assignments)} assignments.')
+
+
+def publish_assignment_event(event: str, assignments: Iterable[tuple[int, int]]) -> None:
+    """Publish `event` for `(assignment_id, child_id)` pairs once the current transaction commits."""
+    assignments = list(assignments)
+    if assignments:
+        transaction.on_commit(partial(_publish, event, assignments))
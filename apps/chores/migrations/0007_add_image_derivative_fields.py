@@ -0,0 +1,23 @@
+# Generated by Django 6.0.9 on 2026-10-19 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chores', '0006_chore_disabled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assignmentevidence',
+            name='photo_derivatives',
+            field=models.JSONField(blank=True, editable=False, help_text='Resized copies of the photo keyed by size, generated in the background.', null=True),
+        ),
+        migrations.AddField(
+            model_name='equipment',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, editable=False, help_text='Resized copies of the image keyed by size, generated in the background.', null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.9 on 2026-10-19 19:25
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chores', '0007_add_image_derivative_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvidenceUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(help_text='Original file name reported by the client.', max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='Total size of the file in bytes.')),
+                ('received', models.PositiveBigIntegerField(default=0, help_text='Bytes stored so far; the next chunk offset.')),
+                ('sha256', models.CharField(blank=True, help_text='Optional SHA-256 of the whole file to verify.', max_length=64)),
+                ('expires_at', models.DateTimeField(help_text='Abandoned uploads are discarded after this time.')),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('assignment', models.ForeignKey(help_text='Assignment being evidenced.', on_delete=django.db.models.deletion.CASCADE, related_name='evidence_uploads', to='chores.assignment')),
+                ('created_by', models.ForeignKey(help_text='User who started the upload; only they may send chunks.', on_delete=django.db.models.deletion.CASCADE, related_name='evidence_uploads', to=settings.AUTH_USER_MODEL)),
+                ('evidence', models.OneToOneField(blank=True, help_text='Evidence created when the upload was completed.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload', to='chores.assignmentevidence')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.9 on 2026-10-19 20:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chores', '0009_add_sync_indexes_and_tombstones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chore',
+            name='detail_document',
+            field=models.JSONField(blank=True, editable=False, help_text='Denormalized detail payload with embedded relations, rebuilt in the background after changes.', null=True),
+        ),
+    ]
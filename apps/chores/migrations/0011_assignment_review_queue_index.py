@@ -0,0 +1,19 @@
+# Generated by Django 6.0.9 on 2026-10-19 20:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chores', '0010_chore_detail_document'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('closed', False), ('pending_approval', True)), fields=['due_date', 'id'], name='assignment_review_queue'),
+        ),
+    ]
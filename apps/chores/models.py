@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.core.validators import MinValueValidator
 # Create your models here.
@@ -83,8 +85,14 @@ class Chore(models.Model):
     disabled = models.BooleanField(
         default=False, help_text='Whether this chore is currently disabled and should not be assigned.'
     )
+    detail_document = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='Denormalized detail payload with embedded relations, rebuilt in the background after changes.',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         constraints = [
@@ -146,8 +154,14 @@ class Equipment(models.Model):
     image = models.ImageField(
         upload_to='chore/equipment/images/', null=True, blank=True, help_text='Optional photo of the equipment.'
     )
+    image_derivatives = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='Resized copies of the image keyed by size, generated in the background.',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self) -> str:
         return f'{self.name}'
@@ -158,7 +172,7 @@ class Location(models.Model):
     description = models.TextField(blank=True, help_text='Optional details about the location.')
     notes = models.JSONField(blank=True, null=True, help_text='Optional structured metadata for the location.')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self) -> str:
         return f'{self.name}'
@@ -173,7 +187,7 @@ class Task(models.Model):
     steps = models.JSONField(blank=True, null=True, help_text='Optional structured steps and media links.')
     notes = models.JSONField(blank=True, null=True, help_text='Optional structured metadata for the task.')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self) -> str:
         return f'{self.name}'
@@ -189,11 +203,18 @@ class AssignmentEvidence(models.Model):
     photo = models.ImageField(
         upload_to='chore/evidence/photos/', null=True, blank=True, help_text='Optional photo evidence.'
     )
+    photo_derivatives = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='Resized copies of the photo keyed by size, generated in the background.',
+    )
     video = models.FileField(
         upload_to='chore/evidence/videos/', null=True, blank=True, help_text='Optional video evidence.'
     )
     notes = models.JSONField(blank=True, null=True, help_text='Optional structured metadata for the evidence.')
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self) -> str:
         return f'Evidence for assignment {self.assignment.id} created at {self.created_at}'
@@ -219,8 +240,82 @@ class Assignment(models.Model):
     closed = models.BooleanField(default=False, help_text='Closed assignments cannot be completed or approved.')
     closed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Only the handful of open assignments awaiting approval, in the order the review queue pages them.
+            models.Index(
+                fields=['due_date', 'id'],
+                condition=models.Q(pending_approval=True, closed=False),
+                name='assignment_review_queue',
+            ),
+        ]
 
     def __str__(self) -> str:
         chore_name = self.chore.name if self.chore else 'Unknown'
         return f'Assignment of chore {chore_name} due on {self.due_date}'
+
+
+class EvidenceUpload(models.Model):
+    """A resumable video evidence upload assembled from chunks before it becomes evidence."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    assignment = models.ForeignKey(
+        Assignment, on_delete=models.CASCADE, related_name='evidence_uploads', help_text='Assignment being evidenced.'
+    )
+    created_by = models.ForeignKey(
+        'users.User',
+        on_delete=models.CASCADE,
+        related_name='evidence_uploads',
+        help_text='User who started the upload; only they may send chunks.',
+    )
+    filename = models.CharField(max_length=255, help_text='Original file name reported by the client.')
+    size = models.PositiveBigIntegerField(help_text='Total size of the file in bytes.')
+    received = models.PositiveBigIntegerField(default=0, help_text='Bytes stored so far; the next chunk offset.')
+    sha256 = models.CharField(max_length=64, blank=True, help_text='Optional SHA-256 of the whole file to verify.')
+    evidence = models.OneToOneField(
+        AssignmentEvidence,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='upload',
+        help_text='Evidence created when the upload was completed.',
+    )
+    expires_at = models.DateTimeField(help_text='Abandoned uploads are discarded after this time.')
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f'Upload of {self.filename} for assignment {self.assignment_id} ({self.received}/{self.size} bytes)'
+
+
+class SyncTombstone(models.Model):
+    """Records a deleted assignment, evidence or catalog object so delta sync can report it."""
+
+    ASSIGNMENT = 'assignment'
+    EVIDENCE = 'evidence'
+    CHORE = 'chore'
+    EQUIPMENT = 'equipment'
+    LOCATION = 'location'
+    TASK = 'task'
+    KIND_CHOICES = (
+        (ASSIGNMENT, 'Assignment'),
+        (EVIDENCE, 'Evidence'),
+        (CHORE, 'Chore'),
+        (EQUIPMENT, 'Equipment'),
+        (LOCATION, 'Location'),
+        (TASK, 'Task'),
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField(help_text='Primary key of the deleted object.')
+    # Not a foreign key: the tombstone must outlive the user when their data is deleted with them.
+    owner_id = models.PositiveBigIntegerField(
+        null=True, blank=True, help_text='Child the deleted assignment or evidence belonged to; empty for catalog.'
+    )
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f'Deleted {self.kind} {self.object_id} at {self.deleted_at}'
@@ -0,0 +1,192 @@
+"""Upload-time normalization for evidence photos and equipment images.
+
+Phone photos arrive at full sensor resolution with EXIF metadata (including GPS). Before an
+image is stored it is rotated upright, stripped of metadata, capped to
+`IMAGE_UPLOAD_MAX_EDGE` and re-encoded at `IMAGE_UPLOAD_QUALITY`. When re-encoding would not
+make a JPEG or PNG that is already within the cap any smaller, the original is kept with its
+metadata segments removed instead. Uploads Pillow cannot decode, such as HEIC, are rejected
+because their metadata cannot be stripped.
+"""
+
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Optional
+
+import sentry_sdk
+from django.conf import settings
+from django.core.files import File
+from PIL import ExifTags, Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Encoded output stays in memory up to this size, then spills to a temporary file.
+SPOOL_MAX_MEMORY = 2 * 1024 * 1024
+# Unreadable or truncated files, formats Pillow has no plugin for, and decompression bombs.
+DECODE_ERRORS = (OSError, Image.DecompressionBombError)
+# Largest image decoded in full, about 200 MB as RGBA. JPEGs are measured after `draft` scaling.
+MAX_DECODED_PIXELS = 50_000_000
+
+# APP1 (EXIF, XMP), APP3-APP13 (including IPTC), APP15 and comments. APP0 (JFIF), APP2 (ICC
+# profile) and APP14 (Adobe colour transform) are needed to display the image correctly.
+JPEG_METADATA_MARKERS = frozenset({0xE1, *range(0xE3, 0xEE), 0xEF, 0xFE})
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_METADATA_CHUNKS = frozenset({b'eXIf', b'tEXt', b'zTXt', b'iTXt', b'tIME'})
+
+
+class UnreadableImageError(ValueError):
+    """The upload is not an image Pillow can decode, so its metadata cannot be stripped."""
+
+
+@dataclass(frozen=True)
+class NormalizedImage:
+    file: File
+    original_size: int
+    size: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_size - self.size
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def _orientation_exif(orientation: int) -> bytes:
+    """Return an EXIF block holding only `orientation`, or nothing when the image is already upright."""
+    if orientation == 1:
+        return b''
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = orientation
+    return exif.tobytes()
+
+
+def _strip_jpeg(data: bytes, exif: bytes) -> Optional[bytes]:
+    """Drop metadata segments from a JPEG, keeping `exif` in their place; None if it cannot be parsed."""
+    if data[:2] != b'\xff\xd8':
+        return None
+    parts = [data[:2]]
+    if exif:
+        parts.append(b'\xff\xe1' + (len(exif) + 2).to_bytes(2, 'big') + exif)
+    position = 2
+    while position + 4 <= len(data):
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        if marker == 0xFF:
+            position += 1
+            continue
+        if marker in (0xDA, 0xD9):
+            # Entropy-coded data follows the start of scan; it carries no metadata.
+            parts.append(data[position:])
+            return b''.join(parts)
+        end = position + 2 + int.from_bytes(data[position + 2 : position + 4], 'big')
+        if marker not in JPEG_METADATA_MARKERS:
+            parts.append(data[position:end])
+        position = end
+    return None
+
+
+def _strip_png(data: bytes, exif: bytes) -> Optional[bytes]:
+    """Drop metadata chunks from a PNG, keeping `exif` in their place; None if it cannot be parsed."""
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+    parts = [PNG_SIGNATURE]
+    # The eXIf chunk holds the TIFF structure without the JPEG-style header.
+    exif = exif.removeprefix(b'Exif\x00\x00')
+    position = len(PNG_SIGNATURE)
+    while position + 12 <= len(data):
+        length = int.from_bytes(data[position : position + 4], 'big')
+        chunk_type = data[position + 4 : position + 8]
+        end = position + 12 + length
+        if chunk_type == b'IDAT' and exif:
+            crc = zlib.crc32(b'eXIf' + exif).to_bytes(4, 'big')
+            parts.append(len(exif).to_bytes(4, 'big') + b'eXIf' + exif + crc)
+            exif = b''
+        if chunk_type not in PNG_METADATA_CHUNKS:
+            parts.append(data[position:end])
+        if chunk_type == b'IEND':
+            return b''.join(parts)
+        position = end
+    return None
+
+
+STRIPPERS = {'JPEG': _strip_jpeg, 'PNG': _strip_png}
+
+
+def _stripped_original(upload: File, image_format: str, orientation: int) -> Optional[bytes]:
+    upload.seek(0)
+    try:
+        return STRIPPERS[image_format](upload.read(), _orientation_exif(orientation))
+    finally:
+        upload.seek(0)
+
+
+def normalize_image(upload: File, source: str) -> NormalizedImage:
+    """Return an upright, metadata-free, size-capped copy of `upload`.
+
+    Raises `UnreadableImageError` when Pillow cannot decode the upload (for example HEIC) or
+    it is too large to decode safely. `source` labels the reported metrics.
+    """
+    max_edge = settings.IMAGE_UPLOAD_MAX_EDGE
+    original_size = upload.size
+    upload.seek(0)
+    try:
+        with Image.open(upload) as image:
+            image_format = image.format
+            within_cap = max(image.size) <= max_edge
+            orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+            icc_profile = image.info.get('icc_profile')
+            if image_format == 'JPEG':
+                # Let the decoder scale down by a power of two so full-size pixels are never held in memory.
+                image.draft('RGB', (max_edge, max_edge))
+            if image.width * image.height > MAX_DECODED_PIXELS:
+                raise Image.DecompressionBombError(f'{image.width}x{image.height} is too large to decode')
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    except DECODE_ERRORS as error:
+        logger.warning(f'Rejected {source} upload {upload.name}; it could not be decoded.')
+        raise UnreadableImageError(f'{upload.name} is not a readable image') from error
+    finally:
+        upload.seek(0)
+
+    output = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    # EXIF and other metadata are only written when passed explicitly, so saving drops them.
+    if _has_alpha(image):
+        extension = '.png'
+        image.save(output, format='PNG', optimize=True, icc_profile=icc_profile)
+    else:
+        extension = '.jpg'
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        image.save(
+            output,
+            format='JPEG',
+            quality=settings.IMAGE_UPLOAD_QUALITY,
+            optimize=True,
+            progressive=True,
+            icc_profile=icc_profile,
+        )
+    size = output.tell()
+    output.seek(0)
+    name = os.path.splitext(os.path.basename(upload.name))[0] + extension
+    normalized = File(output, name=name)
+
+    if size >= original_size and within_cap and image_format in STRIPPERS:
+        # Re-encoding an already small or well-compressed file only makes it bigger.
+        stripped = _stripped_original(upload, image_format, orientation)
+        if stripped is not None:
+            output.close()
+            size = len(stripped)
+            normalized = File(BytesIO(stripped), name=os.path.basename(upload.name))
+
+    result = NormalizedImage(file=normalized, original_size=original_size, size=size)
+    sentry_sdk.metrics.distribution(
+        'uploads.image.bytes_saved', result.bytes_saved, unit='byte', attributes={'source': source}
+    )
+    logger.info(f'Normalized {source} upload {upload.name}: {original_size} -> {size} bytes.')
+    return result
@@ -0,0 +1,150 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+
+from apps.chores.catalog import invalidate_catalog
+from apps.chores.derivatives import IMAGE_DERIVATIVE_FIELDS, schedule_derivatives
+from apps.chores.documents import clear_detail_documents, schedule_detail_rebuild
+from apps.chores.events import EVIDENCE_ADDED, publish_assignment_event
+from apps.chores.models import Assignment, AssignmentEvidence, Chore, Equipment, Location, Task
+from apps.chores.normalization import normalize_image
+from apps.chores.sync import TOMBSTONE_KINDS, record_reassignment, record_tombstone
+
+CATALOG_MODELS = (Chore, Equipment, Location, Task)
+CATALOG_RELATIONS = (Chore.equipment.through, Chore.tasks.through, Task.equipment.through)
+IMAGE_MODELS = (AssignmentEvidence, Equipment)
+
+
+def _chore_ids(chore_filter: Q) -> set[int]:
+    return set(Chore.objects.filter(chore_filter).values_list('id', flat=True).distinct())
+
+
+def affected_chore_ids(instance) -> set[int]:
+    """Return the ids of the chores whose detail embeds `instance`."""
+    if isinstance(instance, Chore):
+        return {instance.pk}
+    if isinstance(instance, Task):
+        return _chore_ids(Q(tasks=instance.pk))
+    if isinstance(instance, Equipment):
+        return _chore_ids(Q(equipment=instance.pk) | Q(tasks__equipment=instance.pk))
+    if isinstance(instance, Location):
+        return _chore_ids(
+            Q(location=instance.pk) | Q(equipment__location=instance.pk) | Q(tasks__equipment__location=instance.pk)
+        )
+    return set()
+
+
+def _relation_owner_ids(sender, instance, pk_set, reverse: bool) -> set[int]:
+    """Return the ids of the chores or tasks owning the relation rows that changed."""
+    if reverse and pk_set is None:
+        # Clearing from the reverse side: resolve the owners before the rows go away.
+        related_name = 'tasks' if sender is Task.equipment.through else 'chores'
+        pk_set = set(getattr(instance, related_name).values_list('id', flat=True))
+    return pk_set if reverse else {instance.pk}
+
+
+def _relation_chore_ids(sender, owner_ids: set[int]) -> set[int]:
+    """Return the ids of the chores affected by a catalog many-to-many change."""
+    if sender is Task.equipment.through:
+        return _chore_ids(Q(tasks__in=owner_ids))
+    return set(owner_ids)
+
+
+def _refresh_catalog(chore_ids: set[int]) -> None:
+    invalidate_catalog()
+    schedule_detail_rebuild(chore_ids)
+
+
+def refresh_catalog_on_commit(chore_ids: set[int]) -> None:
+    """Clear the chores' detail documents now and, once committed, retire cached payloads and queue one rebuild.
+
+    Invalidating before commit would let a concurrent reader re-cache the old rows.
+    """
+    clear_detail_documents(chore_ids)
+    transaction.on_commit(partial(_refresh_catalog, chore_ids))
+
+
+def _refresh_for(instance) -> None:
+    refresh_catalog_on_commit(affected_chore_ids(instance))
+
+
+def catalog_saved(sender, instance, **kwargs) -> None:
+    """Refresh the cached payloads and detail documents that embed a saved catalog object."""
+    _refresh_for(instance)
+
+
+def catalog_deleting(sender, instance, **kwargs) -> None:
+    """Refresh the cached payloads and detail documents that embed a catalog object about to be deleted.
+
+    Runs before the delete so relations that will be cleared or nulled can still be followed.
+    """
+    _refresh_for(instance)
+
+
+def catalog_relation_changed(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    """Refresh cached payloads and detail documents when a catalog many-to-many relation changes."""
+    # Clears are handled before the rows are removed so reverse-side owners can be resolved.
+    if action in ('post_add', 'post_remove', 'pre_clear'):
+        owner_ids = _relation_owner_ids(sender, instance, pk_set, reverse)
+        # Relation rows have no timestamp of their own; touch the owners so delta sync sends them.
+        owner_model = Task if sender is Task.equipment.through else Chore
+        owner_model.objects.filter(pk__in=owner_ids).update(updated_at=timezone.now())
+        chore_ids = _relation_chore_ids(sender, owner_ids)
+        refresh_catalog_on_commit(chore_ids)
+
+
+def image_saving(sender, instance, **kwargs) -> None:
+    """Normalize a newly uploaded photo or image before it is written to storage.
+
+    Raises `UnreadableImageError` for uploads that cannot be decoded, so nothing is stored.
+    """
+    source_field, _ = IMAGE_DERIVATIVE_FIELDS[instance._meta.label]
+    field_file = getattr(instance, source_field)
+    if field_file and not field_file._committed:
+        setattr(instance, source_field, normalize_image(field_file.file, instance._meta.label).file)
+
+
+def image_saved(sender, instance, **kwargs) -> None:
+    """Queue derivative generation when a saved photo or image has none yet."""
+    schedule_derivatives(instance)
+
+
+def evidence_saved(sender, instance, created: bool, **kwargs) -> None:
+    """Tell the child's and parents' event streams about new evidence."""
+    if created:
+        publish_assignment_event(EVIDENCE_ADDED, [(instance.assignment_id, instance.assignment.assigned_to_id)])
+
+
+def synced_deleted(sender, instance, **kwargs) -> None:
+    """Leave a tombstone so delta sync can tell clients about the deletion."""
+    record_tombstone(instance)
+
+
+def assignment_saving(sender, instance, update_fields=None, **kwargs) -> None:
+    """Leave tombstones for the previous child when an assignment is moved to another child."""
+    if instance.pk is None or (update_fields is not None and 'assigned_to' not in update_fields):
+        return
+    previous_owner_id = Assignment.objects.filter(pk=instance.pk).values_list('assigned_to_id', flat=True).first()
+    if previous_owner_id is not None and previous_owner_id != instance.assigned_to_id:
+        record_reassignment(instance.pk, previous_owner_id)
+
+
+def connect_signals() -> None:
+    """Connect catalog change, image upload, assignment event and sync tombstone receivers."""
+    for model in CATALOG_MODELS:
+        post_save.connect(catalog_saved, sender=model, dispatch_uid=f'chores-catalog-save-{model.__name__}')
+        pre_delete.connect(catalog_deleting, sender=model, dispatch_uid=f'chores-catalog-delete-{model.__name__}')
+    for through in CATALOG_RELATIONS:
+        m2m_changed.connect(
+            catalog_relation_changed, sender=through, dispatch_uid=f'chores-catalog-m2m-{through.__name__}'
+        )
+    for model in IMAGE_MODELS:
+        pre_save.connect(image_saving, sender=model, dispatch_uid=f'chores-image-normalize-{model.__name__}')
+        post_save.connect(image_saved, sender=model, dispatch_uid=f'chores-image-save-{model.__name__}')
+    post_save.connect(evidence_saved, sender=AssignmentEvidence, dispatch_uid='chores-evidence-added')
+    for model in TOMBSTONE_KINDS:
+        post_delete.connect(synced_deleted, sender=model, dispatch_uid=f'chores-sync-delete-{model.__name__}')
+    pre_save.connect(assignment_saving, sender=Assignment, dispatch_uid='chores-sync-reassign')
@@ -0,0 +1,122 @@
+"""Delta sync for mobile clients.
+
+A sync token records when the client last synced. Changed rows are found through the
+indexed `updated_at` columns and deletions through `SyncTombstone`, so a poll costs what
+changed since the token rather than what exists. Rows are matched from `SYNC_OVERLAP_SECONDS`
+before the token, so a write whose transaction committed up to that long after its timestamp
+was read is sent on the next poll; clients apply changes by id and may see a row twice. A
+transaction running longer than the overlap can be missed, so keep the setting above the
+longest transaction that writes synced rows.
+
+An assignment moved to another child leaves a tombstone for the previous child, so clients
+apply deletions before changes.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.chores.models import Assignment, AssignmentEvidence, Chore, Equipment, Location, SyncTombstone, Task
+
+TOKEN_SALT = 'chores.sync'
+# Tombstones are kept this long; older tokens must sync from scratch.
+TOMBSTONE_TTL = timedelta(days=30)
+
+TOMBSTONE_KINDS = {
+    Assignment: SyncTombstone.ASSIGNMENT,
+    AssignmentEvidence: SyncTombstone.EVIDENCE,
+    Chore: SyncTombstone.CHORE,
+    Equipment: SyncTombstone.EQUIPMENT,
+    Location: SyncTombstone.LOCATION,
+    Task: SyncTombstone.TASK,
+}
+
+
+def sync_overlap() -> timedelta:
+    return timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+
+
+class SyncTokenExpired(Exception):
+    """The token predates the retained tombstones, so deletions since then are unknown."""
+
+
+def make_sync_token(synced_at: datetime) -> str:
+    return signing.dumps(synced_at.isoformat(), salt=TOKEN_SALT)
+
+
+def read_sync_token(token: str) -> Optional[datetime]:
+    """Return the time a token was issued for, or None if it is not a valid token."""
+    try:
+        value = signing.loads(token, salt=TOKEN_SALT)
+    except signing.BadSignature:
+        return None
+    synced_at = parse_datetime(value) if isinstance(value, str) else None
+    return synced_at if synced_at and timezone.is_aware(synced_at) else None
+
+
+def changed_since(synced_at: Optional[datetime]) -> Optional[datetime]:
+    """Return the `updated_at` lower bound for a sync, or None for a full sync.
+
+    Raises `SyncTokenExpired` when tombstones for the period may already be purged.
+    """
+    if synced_at is None:
+        return None
+    if synced_at < timezone.now() - TOMBSTONE_TTL:
+        raise SyncTokenExpired()
+    return synced_at - sync_overlap()
+
+
+def tombstone_owner_id(instance) -> Optional[int]:
+    """Return the child a deleted assignment or evidence row belonged to."""
+    if isinstance(instance, Assignment):
+        return instance.assigned_to_id
+    if isinstance(instance, AssignmentEvidence):
+        return Assignment.objects.filter(pk=instance.assignment_id).values_list('assigned_to_id', flat=True).first()
+    return None
+
+
+def record_tombstone(instance) -> None:
+    SyncTombstone.objects.create(
+        kind=TOMBSTONE_KINDS[type(instance)], object_id=instance.pk, owner_id=tombstone_owner_id(instance)
+    )
+
+
+def record_reassignment(assignment_id: int, previous_owner_id: int) -> None:
+    """Leave tombstones so the previous child's devices drop a reassigned assignment and its evidence."""
+    evidence_ids = AssignmentEvidence.objects.filter(assignment_id=assignment_id).values_list('id', flat=True)
+    SyncTombstone.objects.bulk_create(
+        [
+            SyncTombstone(kind=SyncTombstone.ASSIGNMENT, object_id=assignment_id, owner_id=previous_owner_id),
+            *(
+                SyncTombstone(kind=SyncTombstone.EVIDENCE, object_id=evidence_id, owner_id=previous_owner_id)
+                for evidence_id in evidence_ids
+            ),
+        ]
+    )
+
+
+async def adeleted_since(since: Optional[datetime], owner_id: Optional[int] = None) -> dict[str, list[int]]:
+    """Return `{kind: [ids]}` deleted since `since`, limited to `owner_id`'s rows when given.
+
+    A full sync reports no deletions; the client replaces its copy instead.
+    """
+    deleted = {kind: [] for kind, _ in SyncTombstone.KIND_CHOICES}
+    if since is None:
+        return deleted
+    tombstones = SyncTombstone.objects.filter(deleted_at__gte=since)
+    if owner_id is not None:
+        tombstones = tombstones.filter(Q(owner_id__isnull=True) | Q(owner_id=owner_id))
+    async for kind, object_id in tombstones.order_by('deleted_at').values_list('kind', 'object_id'):
+        deleted[kind].append(object_id)
+    return deleted
+
+
+def purge_tombstones() -> int:
+    """Delete tombstones no valid token can still need and return how many were removed."""
+    deleted, _ = SyncTombstone.objects.filter(deleted_at__lt=timezone.now() - TOMBSTONE_TTL - sync_overlap()).delete()
+    return deleted
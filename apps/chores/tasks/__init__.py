@@ -1,5 +1,19 @@
 from .close_chores import close_days_chores
 from .assign_chores import assign_chores
+from .image_derivatives import generate_image_derivatives
+from .expire_uploads import expire_evidence_uploads
+from .purge_tombstones import purge_sync_tombstones
+from .detail_documents import rebuild_chore_detail_documents
+from .direct_uploads import normalize_direct_photo, purge_direct_uploads
 import random  # noqa F401: imported for tests but not used directly
 
-__all__ = ['close_days_chores', 'assign_chores']
+__all__ = [
+    'close_days_chores',
+    'assign_chores',
+    'generate_image_derivatives',
+    'expire_evidence_uploads',
+    'purge_sync_tombstones',
+    'rebuild_chore_detail_documents',
+    'normalize_direct_photo',
+    'purge_direct_uploads',
+]
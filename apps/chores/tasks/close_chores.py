@@ -1,7 +1,10 @@
 from django.db.models import Q
 from config.celery import app
 from datetime import datetime, timezone
+from apps.chores.events import TRANSITION_EVENTS, publish_assignment_event
 from apps.chores.models import Assignment
+from apps.chores.transitions import CLOSE
+from django.db import transaction
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,10 +22,14 @@ def close_days_chores() -> None:
     # Only close assignments that are open and either have no due_date or whose
     # due_date is in the past or now. This prevents closing chores scheduled
     # for future dates accidentally.
-    open_chores = (
-        Assignment.objects.filter(closed=False, closed_at=None)
-        .filter(Q(due_date__lte=now) | Q(due_date__isnull=True))
-        .update(closed=True, closed_at=now)
+    due = Assignment.objects.filter(closed=False, closed_at=None).filter(
+        Q(due_date__lte=now) | Q(due_date__isnull=True)
     )
+    with transaction.atomic():
+        closing = list(due.select_for_update().values_list('id', 'assigned_to_id'))
+        open_chores = Assignment.objects.filter(id__in=[pair[0] for pair in closing]).update(
+            closed=True, closed_at=now, updated_at=now
+        )
+        publish_assignment_event(TRANSITION_EVENTS[CLOSE], closing)
     # TODO: We probably want to create a report of which chores were closed each time this runs, and log it somewhere.
     logger.info(f'Closed {open_chores} chores.')
@@ -0,0 +1,14 @@
+import logging
+from typing import Optional
+
+from apps.chores.documents import rebuild_detail_documents
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(name='chores.tasks.rebuild_chore_detail_documents')
+def rebuild_chore_detail_documents(chore_ids: Optional[list[int]] = None) -> None:
+    """Rebuild the detail documents of the given chores, or of every chore missing one."""
+    rebuilt = rebuild_detail_documents(chore_ids)
+    logger.info(f'Rebuilt {rebuilt} chore detail documents.')
@@ -0,0 +1,74 @@
+import logging
+import posixpath
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.chores.derivatives import current_derivatives
+from apps.chores.direct_uploads import (
+    DIRECT_UPLOAD_KINDS,
+    evidence_storage,
+    purge_unconfirmed_uploads,
+    supports_direct_uploads,
+)
+from apps.chores.models import AssignmentEvidence
+from apps.chores.normalization import UnreadableImageError, normalize_image
+from apps.chores.tasks.image_derivatives import generate_image_derivatives
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def normalize_direct_photo(pk: int) -> None:
+    """Replace a directly uploaded evidence photo with its normalized copy, then build its derivatives.
+
+    Until this finishes the stored object still carries the client's metadata. Photos that
+    cannot be decoded are deleted together with their evidence row.
+    """
+    label = AssignmentEvidence._meta.label
+    evidence = AssignmentEvidence.objects.filter(pk=pk).only('photo').first()
+    if evidence is None or not evidence.photo:
+        return
+    source = evidence.photo
+    storage = source.storage
+    try:
+        with source.open('rb'):
+            normalized = normalize_image(source, label)
+            # A new name, so derivatives still being built from the original never overwrite its copies.
+            root, _ = posixpath.splitext(source.name)
+            _, extension = posixpath.splitext(normalized.file.name)
+            name = storage.save(f'{root}.normalized{extension}', normalized.file)
+    except UnreadableImageError:
+        AssignmentEvidence.objects.filter(pk=pk, photo=source.name).delete()
+        storage.delete(source.name)
+        return
+
+    with transaction.atomic():
+        records = list(
+            AssignmentEvidence.objects.select_for_update()
+            .filter(pk=pk, photo=source.name)
+            .values_list('photo_derivatives', flat=True)
+        )
+        if records:
+            AssignmentEvidence.objects.filter(pk=pk).update(
+                photo=name, photo_derivatives=None, updated_at=timezone.now()
+            )
+    if not records:
+        # The photo was replaced or deleted while it was being normalized.
+        storage.delete(name)
+        return
+    for stale in (source.name, *current_derivatives(source.name, records[0]).values()):
+        storage.delete(stale)
+    logger.info(f'Normalized direct upload for {label} {pk}.')
+    generate_image_derivatives(label, pk)
+
+
+@app.task(name='chores.tasks.purge_direct_uploads')
+def purge_direct_uploads() -> None:
+    """Delete objects uploaded with signed URLs that were never confirmed as evidence."""
+    for kind in DIRECT_UPLOAD_KINDS:
+        storage = evidence_storage(kind)
+        if supports_direct_uploads(storage):
+            deleted = purge_unconfirmed_uploads(storage, kind)
+            logger.info(f'Purged {deleted} unconfirmed direct {kind} uploads.')
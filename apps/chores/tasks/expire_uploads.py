@@ -0,0 +1,19 @@
+import logging
+
+from django.utils import timezone
+
+from apps.chores.models import EvidenceUpload
+from apps.chores.uploads import discard_scratch_file
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(name='chores.tasks.expire_evidence_uploads')
+def expire_evidence_uploads() -> None:
+    """Delete resumable uploads past their expiry along with any partially received bytes."""
+    expired = list(EvidenceUpload.objects.filter(expires_at__lte=timezone.now()).only('id'))
+    for upload in expired:
+        discard_scratch_file(upload)
+    EvidenceUpload.objects.filter(id__in=[upload.id for upload in expired]).delete()
+    logger.info(f'Expired {len(expired)} evidence uploads.')
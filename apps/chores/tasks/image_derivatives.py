@@ -0,0 +1,46 @@
+import logging
+
+from django.apps import apps
+from django.utils import timezone
+
+from apps.chores.derivatives import IMAGE_DERIVATIVE_FIELDS, build_derivatives, current_derivatives
+from apps.chores.signals import CATALOG_MODELS, affected_chore_ids, refresh_catalog_on_commit
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def generate_image_derivatives(model_label: str, pk: int) -> None:
+    """Build thumbnail and medium copies of an evidence photo or equipment image.
+
+    Until this finishes the API serves the original file in place of the derivatives.
+    """
+    model = apps.get_model(model_label)
+    source_field, record_field = IMAGE_DERIVATIVE_FIELDS[model_label]
+    instance = model.objects.filter(pk=pk).only(source_field, record_field).first()
+    if instance is None:
+        return
+    source = getattr(instance, source_field)
+    if not source or current_derivatives(source.name, getattr(instance, record_field)):
+        return
+
+    try:
+        record = build_derivatives(source)
+    except OSError:
+        # Includes UnidentifiedImageError for uploads that are not decodable images.
+        logger.exception(f'Could not build image derivatives for {model_label} {pk}.')
+        return
+
+    # Only attach the derivatives if the image was not replaced while they were being built.
+    updated = model.objects.filter(pk=pk, **{source_field: source.name}).update(
+        **{record_field: record, 'updated_at': timezone.now()}
+    )
+    if not updated:
+        for size in current_derivatives(source.name, record).values():
+            source.storage.delete(size)
+        return
+    if model in CATALOG_MODELS:
+        # update() skips post_save, so refresh cached payloads and detail documents that embed this image.
+        refresh_catalog_on_commit(affected_chore_ids(instance))
+    logger.info(f'Built image derivatives for {model_label} {pk}.')
@@ -0,0 +1,13 @@
+import logging
+
+from apps.chores.sync import purge_tombstones
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(name='chores.tasks.purge_sync_tombstones')
+def purge_sync_tombstones() -> None:
+    """Delete sync tombstones older than any sync token still accepted."""
+    purged = purge_tombstones()
+    logger.info(f'Purged {purged} sync tombstones.')
@@ -1,12 +1,41 @@
+import hashlib
+from datetime import timedelta
+from io import BytesIO
+from urllib.parse import urlparse
+
+import orjson
 import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from botocore.stub import Stubber
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
 from django.contrib.auth.models import Group
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import RequestFactory
+from django.http import HttpResponse
+from django.test import AsyncClient, AsyncRequestFactory, RequestFactory
+from django.urls import resolve
+from PIL import Image
+from pydantic import TypeAdapter
 from django.utils import timezone
 
-from apps.chores import api
-from apps.chores.models import Assignment, AssignmentEvidence, Chore
+from apps.chores import api, catalog, direct_uploads, sync, tasks
+from apps.chores.api_schema import (
+    AssignmentDetailSchema,
+    AssignmentSummarySchema,
+    BulkAssignmentActionSchema,
+    DashboardSchema,
+    DirectUploadConfirmSchema,
+    DirectUploadCreateSchema,
+    EquipmentSchema,
+    EvidenceUploadCreateSchema,
+    ReviewQueueSchema,
+)
+from apps.chores.documents import rebuild_detail_documents
+from apps.chores.models import Assignment, AssignmentEvidence, Chore, Equipment, EvidenceUpload, Location, Task
+from apps.core import media
 from apps.users.models import User
+from config.api import api_v1
 
 pytestmark = pytest.mark.django_db
 
@@ -41,6 +70,23 @@ def parent_user(groups) -> User:
     return user
 
 
+def _streamed_json(response) -> list:
+    """Decode a streamed JSON array response."""
+    return orjson.loads(b"".join(response.streaming_content))
+
+
+async def _collect_async_stream(response) -> bytes:
+    """Read a streaming response served by the ASGI handler."""
+    return b"".join([chunk async for chunk in response.streaming_content])
+
+
+def _photo_upload(name: str = "photo.jpg", color: str = "blue") -> SimpleUploadedFile:
+    """Build a small JPEG upload that passes image normalization."""
+    buffer = BytesIO()
+    Image.new("RGB", (32, 24), color).save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
 def _create_assignment(child: User) -> Assignment:
     """Create a basic assignment for the provided child."""
     chore = Chore.objects.create(name="Clean room", disabled=False, is_recurring=False)
@@ -53,11 +99,60 @@ def test_list_child_assignments_as_child(request_factory: RequestFactory, child_
     request = request_factory.get("/api/v1/chores/children/{}/assignments".format(child_user.id))
     request.auth = child_user
 
-    result = api.list_child_assignments(request, child_user.id)
+    result = async_to_sync(api.list_child_assignments)(request, child_user.id)
+
+    payload = _streamed_json(result)
+
+    assert result.status_code == 200
+    assert payload[0]["assignment_id"] == assignment.id
+    assert payload[0]["chore"]["id"] == assignment.chore_id
+
+
+def test_prevalidated_assignment_payloads_match_schemas(
+    request_factory: RequestFactory, parent_user: User, child_user: User, settings, tmp_path
+):
+    """Keep plain-dict assignment payloads in step with their declared response schemas."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    AssignmentEvidence.objects.create(
+        assignment=assignment,
+        photo=_photo_upload(),
+    )
+    request = request_factory.get("/api/v1/chores/children/{}/assignments".format(child_user.id))
+    request.auth = parent_user
+
+    summaries = _streamed_json(async_to_sync(api.list_child_assignments)(request, child_user.id))
+    detail = async_to_sync(api.get_assignment_detail)(request, assignment.id).data
+
+    validated = TypeAdapter(list[AssignmentSummarySchema]).validate_python(summaries)
+    assert validated[0].assignment_id == assignment.id
+    assert validated[0].chore.name == assignment.chore.name
+    assert AssignmentDetailSchema.model_validate(detail).model_dump() == detail
+
+
+# The ASGI handler runs database work on its own per-request thread and connection.
+@pytest.mark.django_db(transaction=True)
+def test_async_read_endpoints_serve_asgi_requests():
+    """Authenticate session tokens and stream assignments through the ASGI handler."""
+    # Built here because the shared fixtures request the non-transactional `db` fixture.
+    child_user = User.objects.create_user(username="asgi-child", password="pass")
+    child_user.groups.add(Group.objects.get_or_create(name="child")[0])
+    assignment = _create_assignment(child_user)
+    session = SessionStore()
+    session[SESSION_KEY] = str(child_user.pk)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = child_user.get_session_auth_hash()
+    session.create()
+    url = "/api/v1/chores/children/{}/assignments".format(child_user.id)
+
+    response = async_to_sync(AsyncClient().get)(url, headers={"X-Session-Token": session.session_key})
+    content = async_to_sync(_collect_async_stream)(response)
+    denied = async_to_sync(AsyncClient().get)(url)
 
-    assert isinstance(result, list)
-    assert result[0].assignment_id == assignment.id
-    assert result[0].chore.id == assignment.chore_id
+    assert response.status_code == 200
+    assert response.is_async
+    assert orjson.loads(content)[0]["assignment_id"] == assignment.id
+    assert denied.status_code == 401
 
 
 def test_list_child_assignments_for_other_child_denied(
@@ -70,29 +165,30 @@ def test_list_child_assignments_for_other_child_denied(
     request = request_factory.get("/api/v1/chores/children/{}/assignments".format(other_child.id))
     request.auth = child_user
 
-    result = api.list_child_assignments(request, other_child.id)
+    result = async_to_sync(api.list_child_assignments)(request, other_child.id)
 
     assert result[0] == 403
 
 
 def test_get_assignment_detail_includes_evidence(
-    request_factory: RequestFactory, parent_user: User, child_user: User
+    request_factory: RequestFactory, parent_user: User, child_user: User, settings, tmp_path
 ):
     """Include evidence URLs in the assignment detail response."""
+    settings.MEDIA_ROOT = tmp_path
     assignment = _create_assignment(child_user)
     evidence = AssignmentEvidence.objects.create(
         assignment=assignment,
-        photo=SimpleUploadedFile("photo.jpg", b"photo-bytes", content_type="image/jpeg"),
+        photo=_photo_upload(),
     )
 
     request = request_factory.get("/api/v1/chores/assignments/{}".format(assignment.id))
     request.auth = parent_user
 
-    result = api.get_assignment_detail(request, assignment.id)
+    result = async_to_sync(api.get_assignment_detail)(request, assignment.id)
 
-    assert result.assignment_id == assignment.id
-    assert result.evidence[0].id == evidence.id
-    assert "/chore/evidence/photos/" in (result.evidence[0].photo_url or "")
+    assert result.data["assignment_id"] == assignment.id
+    assert result.data["evidence"][0]["id"] == evidence.id
+    assert "/chore/evidence/photos/" in (result.data["evidence"][0]["photo_url"] or "")
 
 
 def test_child_marks_ready_for_approval(request_factory: RequestFactory, child_user: User):
@@ -106,7 +202,7 @@ def test_child_marks_ready_for_approval(request_factory: RequestFactory, child_u
     result = api.mark_assignment_ready_for_approval(request, assignment.id)
     assignment.refresh_from_db()
 
-    assert result.pending_approval is True
+    assert result.data["pending_approval"] is True
     assert assignment.is_completed is True
 
 
@@ -126,7 +222,7 @@ def test_parent_marks_incomplete(request_factory: RequestFactory, parent_user: U
     result = api.mark_assignment_incomplete(request, assignment.id)
     assignment.refresh_from_db()
 
-    assert result.is_completed is False
+    assert result.data["is_completed"] is False
     assert assignment.pending_approval is False
     assert assignment.completed_at is None
 
@@ -141,8 +237,129 @@ def test_parent_approves_assignment(request_factory: RequestFactory, parent_user
     result = api.approve_assignment(request, assignment.id)
     assignment.refresh_from_db()
 
-    assert result.approved is True
+    assert result.data["approved"] is True
+    assert assignment.closed is True
+
+
+def test_second_approval_conflicts(
+    request_factory: RequestFactory, parent_user: User, child_user: User, django_assert_num_queries
+):
+    """Let only the first of two approvals apply; the second sees the closed row and gets 409."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.patch("/api/v1/chores/assignments/{}/approve".format(assignment.id))
+    request.auth = parent_user
+
+    # Role check, conditional update and one read of the assignment with its chore and evidence.
+    with django_assert_num_queries(3):
+        first = api.approve_assignment(request, assignment.id)
+    second = api.approve_assignment(request, assignment.id)
+
+    assert first.data["closed"] is True
+    assert second[0] == 409
+
+
+def test_transition_returns_evidence_from_one_read(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries, settings, tmp_path
+):
+    """Build the transitioned detail, evidence included, from a single read after the update."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    evidence = [
+        AssignmentEvidence.objects.create(
+            assignment=assignment,
+            photo=_photo_upload(),
+        )
+        for _ in range(2)
+    ]
+    request = request_factory.patch("/api/v1/chores/assignments/{}/ready-for-approval".format(assignment.id))
+    request.auth = child_user
+
+    # Role check, conditional update and the joined read.
+    with django_assert_num_queries(3):
+        result = api.mark_assignment_ready_for_approval(request, assignment.id)
+
+    assert [item["id"] for item in result.data["evidence"]] == [item.id for item in evidence]
+    assert result.data["chore"]["id"] == assignment.chore_id
+    assert AssignmentDetailSchema.model_validate(result.data).model_dump() == result.data
+
+
+def test_ready_for_approval_preserves_completed_at(request_factory: RequestFactory, child_user: User):
+    """Keep the original completion time when an assignment is marked ready again."""
+    assignment = _create_assignment(child_user)
+    completed_at = timezone.now() - timedelta(hours=1)
+    assignment.completed_at = completed_at
+    assignment.save(update_fields=["completed_at"])
+    request = request_factory.patch(
+        "/api/v1/chores/assignments/{}/ready-for-approval".format(assignment.id)
+    )
+    request.auth = child_user
+
+    api.mark_assignment_ready_for_approval(request, assignment.id)
+    assignment.refresh_from_db()
+
+    assert assignment.completed_at == completed_at
+    assert assignment.pending_approval is True
+
+
+def test_ready_for_approval_distinguishes_failures(request_factory: RequestFactory, child_user: User):
+    """Report missing, foreign and closed assignments with distinct status codes."""
+    other_child = User.objects.create_user(username="other-child", password="pass")
+    foreign = _create_assignment(other_child)
+    closed = _create_assignment(child_user)
+    closed.closed = True
+    closed.save(update_fields=["closed"])
+    request = request_factory.patch("/api/v1/chores/assignments/0/ready-for-approval")
+    request.auth = child_user
+
+    assert api.mark_assignment_ready_for_approval(request, 0)[0] == 404
+    assert api.mark_assignment_ready_for_approval(request, foreign.id)[0] == 403
+    assert api.mark_assignment_ready_for_approval(request, closed.id)[0] == 409
+    foreign.refresh_from_db()
+    assert foreign.pending_approval is False
+
+
+def test_bulk_review_reports_per_assignment_outcomes(
+    request_factory: RequestFactory, parent_user: User, child_user: User, django_assert_max_num_queries
+):
+    """Approve eligible assignments in one update and report missing and closed ids."""
+    pending = [_create_assignment(child_user) for _ in range(3)]
+    closed = _create_assignment(child_user)
+    closed.closed = True
+    closed.save(update_fields=["closed"])
+    assignment_ids = [item.id for item in pending] + [closed.id, 0]
+    request = request_factory.post("/api/v1/chores/assignments/bulk")
+    request.auth = parent_user
+    payload = BulkAssignmentActionSchema(action="approve", assignment_ids=assignment_ids)
+
+    # Role check, locking read and one update, plus the transaction's savepoint statements.
+    with django_assert_max_num_queries(5):
+        result = api.bulk_review_assignments(request, payload)
+
+    outcomes = {item["assignment_id"]: item["outcome"] for item in result.data["results"]}
+    assert outcomes == {
+        **{item.id: "applied" for item in pending},
+        closed.id: "conflict",
+        0: "not_found",
+    }
+    assert Assignment.objects.filter(id__in=[item.id for item in pending], approved=True).count() == 3
+
+
+def test_bulk_review_close_and_parent_only(request_factory: RequestFactory, parent_user: User, child_user: User):
+    """Close assignments in bulk and refuse the request from a child."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/bulk")
+    payload = BulkAssignmentActionSchema(action="close", assignment_ids=[assignment.id])
+
+    request.auth = child_user
+    assert api.bulk_review_assignments(request, payload)[0] == 403
+
+    request.auth = parent_user
+    result = api.bulk_review_assignments(request, payload)
+    assignment.refresh_from_db()
+
+    assert result.data["results"] == [{"assignment_id": assignment.id, "outcome": "applied"}]
     assert assignment.closed is True
+    assert assignment.approved is False
 
 
 def test_upload_evidence_requires_file(request_factory: RequestFactory, child_user: User):
@@ -164,7 +381,7 @@ def test_upload_evidence_rejects_photo_and_video(
     request = request_factory.post("/api/v1/chores/assignments/{}/evidence".format(assignment.id))
     request.auth = child_user
 
-    photo = SimpleUploadedFile("photo.jpg", b"photo-bytes", content_type="image/jpeg")
+    photo = _photo_upload()
     video = SimpleUploadedFile("video.mp4", b"video-bytes", content_type="video/mp4")
 
     result = api.upload_assignment_evidence(request, assignment.id, photo=photo, video=video)
@@ -172,14 +389,35 @@ def test_upload_evidence_rejects_photo_and_video(
     assert result[0] == 400
 
 
+def test_upload_evidence_rejects_undecodable_photos(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path
+):
+    """Refuse photos whose metadata cannot be stripped, for single and batch uploads, storing nothing."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence".format(assignment.id))
+    request.auth = child_user
+
+    def heic():
+        return SimpleUploadedFile("photo.heic", b"heic-bytes", content_type="image/heic")
+
+    single = api.upload_assignment_evidence(request, assignment.id, photo=heic(), video=None)
+    batch = api.upload_assignment_evidence_batch(request, assignment.id, photos=[_photo_upload(), heic()], videos=None)
+
+    assert single == batch == (400, {"message": api.UNREADABLE_PHOTO_MESSAGE})
+    assert not AssignmentEvidence.objects.exists()
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
 def test_delete_evidence_blocked_after_completion(
-    request_factory: RequestFactory, parent_user: User, child_user: User
+    request_factory: RequestFactory, parent_user: User, child_user: User, settings, tmp_path
 ):
     """Prevent evidence deletion after completion."""
+    settings.MEDIA_ROOT = tmp_path
     assignment = _create_assignment(child_user)
     evidence = AssignmentEvidence.objects.create(
         assignment=assignment,
-        photo=SimpleUploadedFile("photo.jpg", b"photo-bytes", content_type="image/jpeg"),
+        photo=_photo_upload(),
     )
     assignment.is_completed = True
     assignment.save(update_fields=["is_completed"])
@@ -209,9 +447,10 @@ def test_upload_evidence_batch_requires_files(request_factory: RequestFactory, c
 
 
 def test_upload_evidence_batch_adds_multiple_files(
-    request_factory: RequestFactory, child_user: User
+    request_factory: RequestFactory, child_user: User, settings, tmp_path
 ):
     """Create evidence records for multiple uploaded files."""
+    settings.MEDIA_ROOT = tmp_path
     assignment = _create_assignment(child_user)
     request = request_factory.post(
         "/api/v1/chores/assignments/{}/evidence/batch".format(assignment.id)
@@ -219,8 +458,8 @@ def test_upload_evidence_batch_adds_multiple_files(
     request.auth = child_user
 
     photos = [
-        SimpleUploadedFile("photo-1.jpg", b"photo-1", content_type="image/jpeg"),
-        SimpleUploadedFile("photo-2.jpg", b"photo-2", content_type="image/jpeg"),
+        _photo_upload("photo-1.jpg", "red"),
+        _photo_upload("photo-2.jpg", "green"),
     ]
     videos = [
         SimpleUploadedFile("video-1.mp4", b"video-1", content_type="video/mp4"),
@@ -237,3 +476,888 @@ def test_upload_evidence_batch_adds_multiple_files(
     assert result[0] == 201
     assert len(result[1]) == 3
     assert AssignmentEvidence.objects.filter(assignment=assignment).count() == 3
+
+
+def test_upload_evidence_batch_removes_files_when_insert_fails(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path, monkeypatch
+):
+    """Delete files already pushed to storage when the evidence rows cannot be inserted."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/batch".format(assignment.id))
+    request.auth = child_user
+
+    def failing_bulk_create(*args, **kwargs):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(AssignmentEvidence.objects, "bulk_create", failing_bulk_create)
+    photos = [_photo_upload() for _ in range(2)]
+
+    with pytest.raises(RuntimeError):
+        api.upload_assignment_evidence_batch(request, assignment.id, photos=photos, videos=None)
+
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+    assert not AssignmentEvidence.objects.exists()
+
+
+def test_upload_evidence_batch_queues_photo_derivatives(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path, django_capture_on_commit_callbacks
+):
+    """Build photo derivatives for batch uploads once the rows are committed."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/batch".format(assignment.id))
+    request.auth = child_user
+    buffer = BytesIO()
+    Image.new("RGB", (800, 600), "blue").save(buffer, format="JPEG")
+    photos = [SimpleUploadedFile("photo.jpg", buffer.getvalue(), content_type="image/jpeg")]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        result = api.upload_assignment_evidence_batch(request, assignment.id, photos=photos, videos=None)
+
+    evidence = AssignmentEvidence.objects.get(assignment=assignment)
+    assert result[1][0]["photo_thumbnail_url"] == result[1][0]["photo_url"]
+    assert set(evidence.photo_derivatives) == {"source", "thumbnail", "medium"}
+
+
+def _put_chunk(request_factory: RequestFactory, user: User, upload_id, offset: int, body: bytes, **headers):
+    request = request_factory.put(
+        "/api/v1/chores/assignments/uploads/{}?offset={}".format(upload_id, offset),
+        data=body,
+        content_type="application/octet-stream",
+        **headers,
+    )
+    request.auth = user
+    return request
+
+
+def test_resumable_upload_assembles_video_evidence(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path
+):
+    """Store chunks by offset, resume after a mismatch, and attach the assembled video."""
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.EVIDENCE_UPLOAD_DIR = tmp_path / "uploads"
+    assignment = _create_assignment(child_user)
+    video = b"0123456789" * 10
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/uploads".format(assignment.id))
+    request.auth = child_user
+    payload = EvidenceUploadCreateSchema(
+        filename="clip.mp4", size=len(video), sha256=hashlib.sha256(video).hexdigest()
+    )
+
+    status, created = api.create_evidence_upload(request, assignment.id, payload)
+    upload_id = created["id"]
+    assert status == 201
+
+    first = _put_chunk(request_factory, child_user, upload_id, 0, video[:60])
+    assert api.put_evidence_upload_chunk(first, assignment.id, upload_id, 0)["offset"] == 60
+
+    # A retry from a stale offset is told where to resume.
+    stale = _put_chunk(request_factory, child_user, upload_id, 0, video[:60])
+    status, conflict = api.put_evidence_upload_chunk(stale, assignment.id, upload_id, 0)
+    assert (status, conflict["offset"]) == (409, 60)
+
+    corrupt = _put_chunk(request_factory, child_user, upload_id, 60, video[60:], HTTP_X_CHUNK_SHA256="0" * 64)
+    assert api.put_evidence_upload_chunk(corrupt, assignment.id, upload_id, 60)[0] == 400
+
+    checksum = hashlib.sha256(video[60:]).hexdigest()
+    last = _put_chunk(request_factory, child_user, upload_id, 60, video[60:], HTTP_X_CHUNK_SHA256=checksum)
+    assert api.put_evidence_upload_chunk(last, assignment.id, upload_id, 60)["offset"] == len(video)
+
+    status, evidence = api.complete_evidence_upload(request, assignment.id, upload_id)
+
+    assert status == 201
+    stored = AssignmentEvidence.objects.get(id=evidence.id)
+    assert stored.video.read() == video
+    assert not any((tmp_path / "uploads").iterdir())
+
+
+def test_resumable_upload_rejects_early_completion_and_other_users(
+    request_factory: RequestFactory, child_user: User, parent_user: User, settings, tmp_path
+):
+    """Refuse to complete a partial upload and hide uploads from other users."""
+    settings.EVIDENCE_UPLOAD_DIR = tmp_path
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/uploads".format(assignment.id))
+    request.auth = child_user
+    _, created = api.create_evidence_upload(
+        request, assignment.id, EvidenceUploadCreateSchema(filename="clip.mp4", size=100)
+    )
+
+    status, conflict = api.complete_evidence_upload(request, assignment.id, created["id"])
+    assert (status, conflict["offset"]) == (409, 0)
+
+    request.auth = parent_user
+    assert api.get_evidence_upload(request, assignment.id, created["id"])[0] == 403
+
+
+def test_resumable_upload_without_scratch_file_asks_for_a_new_upload(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path
+):
+    """Answer 410 when the scratch file is on another host or was cleaned up, for chunks and completion."""
+    settings.EVIDENCE_UPLOAD_DIR = tmp_path
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/uploads".format(assignment.id))
+    request.auth = child_user
+    schema = EvidenceUploadCreateSchema(filename="clip.mp4", size=4)
+    chunk_upload = api.create_evidence_upload(request, assignment.id, schema)[1]["id"]
+    complete_upload = api.create_evidence_upload(request, assignment.id, schema)[1]["id"]
+    chunk = _put_chunk(request_factory, child_user, complete_upload, 0, b"clip")
+    api.put_evidence_upload_chunk(chunk, assignment.id, complete_upload, 0)
+    for path in tmp_path.iterdir():
+        path.unlink()
+
+    chunk = _put_chunk(request_factory, child_user, chunk_upload, 0, b"clip")
+    status, body = api.put_evidence_upload_chunk(chunk, assignment.id, chunk_upload, 0)
+    assert (status, body["message"]) == (410, api.SCRATCH_FILE_MISSING_MESSAGE)
+    status, body = api.complete_evidence_upload(request, assignment.id, complete_upload)
+    assert (status, body["message"]) == (410, api.SCRATCH_FILE_MISSING_MESSAGE)
+    assert not EvidenceUpload.objects.exists()
+
+
+def test_resumable_upload_removes_stored_video_when_insert_fails(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path, monkeypatch
+):
+    """Delete the stored video and reopen the upload for completion when the evidence row cannot be saved."""
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.EVIDENCE_UPLOAD_DIR = tmp_path / "uploads"
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/uploads".format(assignment.id))
+    request.auth = child_user
+    upload_id = api.create_evidence_upload(
+        request, assignment.id, EvidenceUploadCreateSchema(filename="clip.mp4", size=4)
+    )[1]["id"]
+    chunk = _put_chunk(request_factory, child_user, upload_id, 0, b"clip")
+    api.put_evidence_upload_chunk(chunk, assignment.id, upload_id, 0)
+
+    def failing_save(*args, **kwargs):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(AssignmentEvidence, "save", failing_save)
+    with pytest.raises(RuntimeError):
+        api.complete_evidence_upload(request, assignment.id, upload_id)
+
+    assert not any(path.is_file() for path in (tmp_path / "media").rglob("*"))
+    assert EvidenceUpload.objects.get(id=upload_id).completed_at is None
+
+
+@pytest.fixture()
+def s3_storage(settings):
+    """Point media storage at an S3 bucket; requests to S3 itself must be stubbed."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "bucket_name": "evidence",
+                "access_key": "test-key",
+                "secret_key": "test-secret",
+                "region_name": "us-east-1",
+            },
+        },
+    }
+    return AssignmentEvidence._meta.get_field("video").storage
+
+
+def test_direct_upload_signs_urls_and_confirms_object(
+    request_factory: RequestFactory, child_user: User, s3_storage
+):
+    """Sign an upload scoped to the assignment and create evidence once the object checks out."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/direct-uploads".format(assignment.id))
+    request.auth = child_user
+    payload = DirectUploadCreateSchema(kind="video", filename="clip.mp4", content_type="video/mp4", size=2048)
+
+    status, signed = api.create_direct_evidence_upload(request, assignment.id, payload)
+
+    assert status == 201
+    key = signed["post_fields"]["key"]
+    assert key.startswith("chore/evidence/videos/{}/".format(assignment.id))
+    assert "Signature=" in signed["put_url"]
+
+    confirm = DirectUploadConfirmSchema(token=signed["token"])
+    with Stubber(s3_storage.connection.meta.client) as stubber:
+        stubber.add_response(
+            "head_object",
+            {"ContentLength": 2048, "ContentType": "video/mp4"},
+            {"Bucket": "evidence", "Key": key},
+        )
+        status, evidence = api.confirm_direct_evidence_upload(request, assignment.id, confirm)
+
+    assert status == 201
+    assert AssignmentEvidence.objects.get(id=evidence.id).video.name == key
+
+
+def test_direct_upload_confirm_rejects_mismatched_object(
+    request_factory: RequestFactory, child_user: User, parent_user: User, s3_storage
+):
+    """Delete an object that does not match what was signed and refuse other users' tokens."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/direct-uploads".format(assignment.id))
+    request.auth = child_user
+    payload = DirectUploadCreateSchema(kind="photo", filename="photo.jpg", content_type="image/jpeg", size=100)
+    _, signed = api.create_direct_evidence_upload(request, assignment.id, payload)
+    key = signed["post_fields"]["key"]
+    confirm = DirectUploadConfirmSchema(token=signed["token"])
+
+    request.auth = parent_user
+    assert api.confirm_direct_evidence_upload(request, assignment.id, confirm)[0] == 403
+
+    request.auth = child_user
+    with Stubber(s3_storage.connection.meta.client) as stubber:
+        stubber.add_response("head_object", {"ContentLength": 5_000_000, "ContentType": "image/jpeg"})
+        stubber.add_response("delete_object", {}, {"Bucket": "evidence", "Key": key})
+        status, _ = api.confirm_direct_evidence_upload(request, assignment.id, confirm)
+
+    assert status == 400
+    assert not AssignmentEvidence.objects.exists()
+
+
+def test_direct_photo_confirmation_queues_normalization(
+    request_factory: RequestFactory, child_user: User, s3_storage, django_capture_on_commit_callbacks
+):
+    """Strip a confirmed direct photo in the background, since it never passed through the upload path."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/direct-uploads".format(assignment.id))
+    request.auth = child_user
+    payload = DirectUploadCreateSchema(kind="photo", filename="photo.jpg", content_type="image/jpeg", size=100)
+    _, signed = api.create_direct_evidence_upload(request, assignment.id, payload)
+
+    with Stubber(s3_storage.connection.meta.client) as stubber, django_capture_on_commit_callbacks() as callbacks:
+        stubber.add_response("head_object", {"ContentLength": 100, "ContentType": "image/jpeg"})
+        _, evidence = api.confirm_direct_evidence_upload(
+            request, assignment.id, DirectUploadConfirmSchema(token=signed["token"])
+        )
+
+    queued = [callback.args for callback in callbacks if callback.func == tasks.normalize_direct_photo.delay]
+    assert queued == [(evidence.id,)]
+
+
+def test_purge_direct_uploads_deletes_unconfirmed_objects(child_user: User, s3_storage):
+    """Delete expired direct uploads no evidence references, keeping confirmed, recent and other objects."""
+    assignment = _create_assignment(child_user)
+    prefix = "chore/evidence/photos/{}/".format(assignment.id)
+    AssignmentEvidence.objects.create(assignment=assignment, photo=prefix + "kept/photo.normalized.jpg")
+    old = timezone.now() - direct_uploads.UNCONFIRMED_OBJECT_AGE - timedelta(minutes=1)
+    objects = {
+        prefix + "kept/photo.jpg": old,
+        prefix + "kept/photo.normalized.thumbnail.webp": old,
+        prefix + "abandoned/photo.jpg": old,
+        prefix + "recent/photo.jpg": timezone.now(),
+        "chore/evidence/photos/legacy.jpg": old,
+    }
+
+    with Stubber(s3_storage.connection.meta.client) as stubber:
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": key, "LastModified": modified} for key, modified in objects.items()]},
+            {"Bucket": "evidence", "Prefix": "chore/evidence/photos/"},
+        )
+        stubber.add_response("delete_object", {}, {"Bucket": "evidence", "Key": prefix + "abandoned/photo.jpg"})
+        stubber.add_response("list_objects_v2", {}, {"Bucket": "evidence", "Prefix": "chore/evidence/videos/"})
+        tasks.purge_direct_uploads()
+        stubber.assert_no_pending_responses()
+
+
+def test_direct_upload_requires_s3_storage(request_factory: RequestFactory, child_user: User):
+    """Report that direct uploads are unavailable with local media storage."""
+    assignment = _create_assignment(child_user)
+    request = request_factory.post("/api/v1/chores/assignments/{}/evidence/direct-uploads".format(assignment.id))
+    request.auth = child_user
+    payload = DirectUploadCreateSchema(kind="video", filename="clip.mp4", content_type="video/mp4", size=10)
+
+    assert api.create_direct_evidence_upload(request, assignment.id, payload)[0] == 501
+
+
+def test_get_chore_detail_sets_validators(request_factory: RequestFactory, child_user: User):
+    """Stamp ETag and Last-Modified on chore detail responses."""
+    chore = Chore.objects.create(name="Dishes", disabled=False, is_recurring=False)
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    response = HttpResponse()
+
+    result = async_to_sync(api.get_chore_detail)(request, response, chore.id)
+
+    assert result.id == chore.id
+    assert response["ETag"].startswith('"')
+    assert "Last-Modified" in response
+
+
+def test_get_chore_detail_not_modified_for_matching_etag(
+    request_factory: RequestFactory, child_user: User, django_assert_max_num_queries
+):
+    """Short-circuit to 304 without loading the chore when the client copy is current."""
+    chore = Chore.objects.create(name="Dishes", disabled=False, is_recurring=False)
+    first = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    first.auth = child_user
+    first_response = HttpResponse()
+    async_to_sync(api.get_chore_detail)(first, first_response, chore.id)
+
+    request = request_factory.get(
+        "/api/v1/chores/chores/{}".format(chore.id), HTTP_IF_NONE_MATCH=first_response["ETag"]
+    )
+    request.auth = child_user
+
+    # Only the role checks may hit the database.
+    with django_assert_max_num_queries(2):
+        result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert result.status_code == 304
+    assert result["ETag"] == first_response["ETag"]
+
+
+def test_catalog_write_invalidates_etag(
+    request_factory: RequestFactory, child_user: User, django_capture_on_commit_callbacks
+):
+    """Return fresh data after a catalog write even when the old ETag is sent."""
+    first = request_factory.get("/api/v1/chores/locations")
+    first.auth = child_user
+    first_response = HttpResponse()
+    async_to_sync(api.list_locations)(first, first_response)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Location.objects.create(name="Garage")
+
+    request = request_factory.get("/api/v1/chores/locations", HTTP_IF_NONE_MATCH=first_response["ETag"])
+    request.auth = child_user
+    response = HttpResponse()
+
+    result = async_to_sync(api.list_locations)(request, response)
+
+    assert [location.name for location in result] == ["Garage"]
+    assert response["ETag"] != first_response["ETag"]
+
+
+def test_catalog_etag_changes_with_signing_window(
+    request_factory: RequestFactory, child_user: User, settings, monkeypatch
+):
+    """Stop answering 304 once the signed media URLs in the client's copy may have expired."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {"bucket_name": "media", "access_key": "key", "secret_key": "secret"},
+        },
+    }
+    clock = {"now": 1_800_000_000.0}
+    monkeypatch.setattr(media.time, "time", lambda: clock["now"])
+
+    def etag(**headers) -> tuple[str, object]:
+        request = request_factory.get("/api/v1/chores/locations", **headers)
+        request.auth = child_user
+        response = HttpResponse()
+        result = async_to_sync(api.list_locations)(request, response)
+        return response["ETag"], result
+
+    first, _ = etag()
+    assert etag(HTTP_IF_NONE_MATCH=first)[1].status_code == 304
+
+    clock["now"] += 1800
+    second, result = etag(HTTP_IF_NONE_MATCH=first)
+    assert second != first
+    assert result == []
+
+
+def _create_catalog_chore() -> Chore:
+    """Create a chore whose tasks reference equipment stored in a location."""
+    garage = Location.objects.create(name="Garage")
+    chore = Chore.objects.create(name="Wash car", disabled=False, is_recurring=False, location=garage)
+    for index in range(2):
+        equipment = Equipment.objects.create(name="Sponge {}".format(index), location=garage)
+        task = Task.objects.create(name="Scrub {}".format(index))
+        task.equipment.add(equipment)
+        chore.tasks.add(task)
+        chore.equipment.add(equipment)
+    return chore
+
+
+def test_get_chore_detail_prefetches_nested_locations(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries
+):
+    """Build a missing detail document without a query per equipment item, then serve it from the chore row."""
+    chore = _create_catalog_chore()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+
+    # Role check, document lookup, chore, equipment, tasks, task equipment and storing the document.
+    with django_assert_num_queries(7):
+        result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert result.tasks[0].equipment[0].location.name == "Garage"
+    chore.refresh_from_db()
+    assert chore.detail_document["tasks"][0]["equipment"][0]["location"]["name"] == "Garage"
+    cache.clear()
+
+    # Role check and the document.
+    with django_assert_num_queries(2):
+        result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert result.tasks[0].equipment[0].location.name == "Garage"
+
+
+def test_get_chore_detail_cache_hit_skips_database(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries
+):
+    """Serve a cached chore detail without touching the catalog tables."""
+    chore = _create_catalog_chore()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    # Only the role check remains.
+    with django_assert_num_queries(1):
+        result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert result.id == chore.id
+
+
+def test_cached_payloads_are_kept_per_host_and_version(request_factory: RequestFactory):
+    """Cache each host's payload under its own key so fills for different hosts never overwrite each other."""
+    first = request_factory.get("/api/v1/chores/locations", HTTP_HOST="one.example")
+    second = request_factory.get("/api/v1/chores/locations", HTTP_HOST="two.example")
+    version = catalog.get_catalog_version()
+
+    catalog.cache_payload(first, catalog.LOCATIONS_CACHE_KEY, ["one"], version)
+    catalog.cache_payload(second, catalog.LOCATIONS_CACHE_KEY, ["two"], version)
+
+    assert catalog.get_cached_payload(first, catalog.LOCATIONS_CACHE_KEY, version) == ["one"]
+    assert catalog.get_cached_payload(second, catalog.LOCATIONS_CACHE_KEY, version) == ["two"]
+    catalog.invalidate_catalog()
+    assert catalog.get_cached_payload(first, catalog.LOCATIONS_CACHE_KEY, catalog.get_catalog_version()) is None
+
+
+def test_location_change_invalidates_dependent_chore_detail(
+    request_factory: RequestFactory, child_user: User, django_capture_on_commit_callbacks
+):
+    """Rebuild cached chore details after a location they embed is renamed."""
+    chore = _create_catalog_chore()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        location = Location.objects.get(name="Garage")
+        location.name = "Shed"
+        location.save()
+
+    result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert result.location.name == "Shed"
+    assert result.tasks[0].equipment[0].location.name == "Shed"
+
+
+def test_removing_task_from_chore_invalidates_chore_detail(
+    request_factory: RequestFactory, child_user: User, django_capture_on_commit_callbacks
+):
+    """Rebuild cached chore details after a reverse-side relation change."""
+    chore = _create_catalog_chore()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Task.objects.get(name="Scrub 0").chores.remove(chore)
+
+    result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id)
+
+    assert [task.name for task in result.tasks] == ["Scrub 1"]
+
+
+def test_list_equipment_projects_location_fields(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries
+):
+    """List equipment with nested locations from a single projected query."""
+    _create_catalog_chore()
+    Equipment.objects.create(name="Loose rag")
+    request = request_factory.get("/api/v1/chores/equipment")
+    request.auth = child_user
+    response = HttpResponse()
+
+    # Role check and one projected equipment query.
+    with django_assert_num_queries(2):
+        result = async_to_sync(api.list_equipment)(request, response)
+
+    names = [item["name"] for item in result.data]
+    assert names == ["Loose rag", "Sponge 0", "Sponge 1"]
+    assert result.data[0]["location"] is None
+    assert result.data[1]["location"]["name"] == "Garage"
+    assert result["ETag"] == response["ETag"]
+    TypeAdapter(list[EquipmentSchema]).validate_python(result.data)
+
+
+def test_get_chore_detail_sparse_fields_skip_relations(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries
+):
+    """Return only the requested chore fields when relations are not selected."""
+    chore = _create_catalog_chore()
+    rebuild_detail_documents([chore.id])
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id), {"fields": "name,points"})
+    request.auth = child_user
+
+    # Role check and the chore's document; no location join and no relation prefetches.
+    with django_assert_num_queries(2) as captured:
+        result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id, fields="name,points")
+
+    assert result.data == {"id": chore.id, "name": "Wash car", "points": chore.points}
+    chore_sql = captured.captured_queries[-1]["sql"]
+    assert "description" not in chore_sql
+    assert "chores_location" not in chore_sql
+
+
+def test_get_chore_detail_expand_limits_nested_relations(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries
+):
+    """Embed only the expanded relations and give the sparse response its own ETag."""
+    chore = _create_catalog_chore()
+    full_response = HttpResponse()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    async_to_sync(api.get_chore_detail)(request, full_response, chore.id)
+    response = HttpResponse()
+
+    # Role check and the document the full request stored.
+    with django_assert_num_queries(2):
+        result = async_to_sync(api.get_chore_detail)(request, response, chore.id, expand="tasks")
+
+    assert "location" not in result.data
+    assert "equipment" not in result.data
+    assert [task["name"] for task in result.data["tasks"]] == ["Scrub 0", "Scrub 1"]
+    assert "equipment" not in result.data["tasks"][0]
+    assert response["ETag"] != full_response["ETag"]
+
+    nested = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id, expand="tasks.equipment")
+    assert "location" not in nested.data["tasks"][0]["equipment"][0]
+
+
+def test_sparse_endpoints_only_require_identifying_fields():
+    """Let generated clients accept responses trimmed by `fields` and `expand`."""
+    openapi = api_v1.get_openapi_schema()
+    schemas = openapi["components"]["schemas"]
+    chore = openapi["paths"]["/api/v1/chores/chores/{id}"]["get"]["responses"][200]
+
+    assert chore["content"]["application/json"]["schema"]["$ref"].endswith("/SparseChoreDetailSchema")
+    assert schemas["SparseChoreDetailSchema"]["required"] == ["id"]
+    assert schemas["SparseTaskSchema"]["required"] == ["id"]
+    assert schemas["SparseEquipmentSchema"]["required"] == ["id"]
+    assert schemas["SparseAssignmentDetailSchema"]["required"] == ["assignment_id"]
+    assert "default" not in schemas["SparseChoreDetailSchema"]["properties"]["name"]
+
+
+def test_sparse_fieldsets_reject_unknown_names(request_factory: RequestFactory, child_user: User):
+    """Reject fields and relations the endpoint does not have."""
+    chore = _create_catalog_chore()
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+
+    fields_result = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id, fields="name,secret")
+    expand_result = async_to_sync(api.list_equipment)(request, HttpResponse(), expand="tasks")
+
+    assert fields_result == (400, {"message": "Unknown fields: secret"})
+    assert expand_result == (400, {"message": "Unknown relations: tasks"})
+
+
+def test_get_assignment_detail_sparse_fields_skip_evidence(
+    request_factory: RequestFactory, child_user: User, django_assert_num_queries, settings, tmp_path
+):
+    """Skip the chore join and evidence prefetch when only status fields are requested."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    AssignmentEvidence.objects.create(
+        assignment=assignment,
+        photo=_photo_upload(),
+    )
+    request = request_factory.get("/api/v1/chores/assignments/{}".format(assignment.id))
+    request.auth = child_user
+
+    # The assignment row and the role check.
+    with django_assert_num_queries(2):
+        result = async_to_sync(api.get_assignment_detail)(request, assignment.id, fields="pending_approval")
+
+    assert result.data == {"assignment_id": assignment.id, "pending_approval": False}
+
+
+def test_list_endpoints_project_sparse_fields(request_factory: RequestFactory, child_user: User):
+    """Project list rows down to the requested fields."""
+    _create_catalog_chore()
+    _create_assignment(child_user)
+    request = request_factory.get("/api/v1/chores/equipment")
+    request.auth = child_user
+
+    equipment = async_to_sync(api.list_equipment)(request, HttpResponse(), fields="name,location", expand="")
+    locations = async_to_sync(api.list_locations)(request, HttpResponse(), fields="name")
+    assignments = _streamed_json(
+        async_to_sync(api.list_child_assignments)(request, child_user.id, fields="due_date,chore")
+    )
+
+    assert equipment.data[0] == {"id": equipment.data[0]["id"], "name": "Sponge 0"}
+    assert locations.data == [{"id": Location.objects.get().id, "name": "Garage"}]
+    assert set(assignments[0]) == {"assignment_id", "due_date", "chore"}
+
+
+def test_sync_returns_changes_and_deletions_since_token(
+    request_factory: RequestFactory, child_user: User, django_assert_max_num_queries
+):
+    """Send everything on a full sync, then only what changed since the returned token."""
+    assignment = _create_assignment(child_user)
+    other_child = User.objects.create_user(username="sync-other", password="pass")
+    other_child.groups.add(Group.objects.get(name="child"))
+    hidden = _create_assignment(other_child)
+    location = Location.objects.create(name="Garage")
+    request = request_factory.get("/api/v1/chores/sync")
+    request.auth = child_user
+
+    full = async_to_sync(api.sync_changes)(request).data
+
+    assert full["full"] is True
+    assert [item["assignment_id"] for item in full["assignments"]] == [assignment.id]
+    assert [item.id for item in full["locations"]] == [location.id]
+
+    # Move the token's timestamp past the overlap window so untouched rows drop out.
+    token = sync.make_sync_token(timezone.now() + sync.sync_overlap())
+    Assignment.objects.filter(id=assignment.id).update(updated_at=timezone.now() - sync.sync_overlap() * 2)
+    Location.objects.filter(id=location.id).update(updated_at=timezone.now() - sync.sync_overlap() * 2)
+    with django_assert_max_num_queries(10):
+        quiet = async_to_sync(api.sync_changes)(request, token).data
+    assert quiet["assignments"] == [] and quiet["locations"] == []
+    assert quiet["deleted"]["assignment"] == []
+
+    api.apply_transition(Assignment.objects.filter(id=assignment.id), api.READY_FOR_APPROVAL)
+    location_id = location.id
+    hidden.delete()
+    location.delete()
+    delta = async_to_sync(api.sync_changes)(request, token).data
+
+    assert [item["assignment_id"] for item in delta["assignments"]] == [assignment.id]
+    assert delta["assignments"][0]["pending_approval"] is True
+    assert delta["deleted"]["assignment"] == []
+    assert delta["deleted"]["location"] == [location_id]
+    assert delta["full"] is False
+
+
+def test_sync_tells_previous_child_about_reassignment(
+    request_factory: RequestFactory, parent_user: User, child_user: User, settings, tmp_path
+):
+    """Report a reassigned assignment and its evidence as deleted to the child it was taken from."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    evidence = AssignmentEvidence.objects.create(
+        assignment=assignment,
+        photo=_photo_upload(),
+    )
+    other_child = User.objects.create_user(username="sync-new-owner", password="pass")
+    other_child.groups.add(Group.objects.get(name="child"))
+    token = sync.make_sync_token(timezone.now())
+
+    assignment.assigned_to = other_child
+    assignment.save()
+
+    previous = request_factory.get("/api/v1/chores/sync")
+    previous.auth = child_user
+    current = request_factory.get("/api/v1/chores/sync")
+    current.auth = other_child
+    taken = async_to_sync(api.sync_changes)(previous, token).data
+    received = async_to_sync(api.sync_changes)(current, token).data
+
+    assert taken["assignments"] == []
+    assert taken["deleted"]["assignment"] == [assignment.id]
+    assert taken["deleted"]["evidence"] == [evidence.id]
+    assert [item["assignment_id"] for item in received["assignments"]] == [assignment.id]
+    assert received["deleted"]["assignment"] == []
+
+
+def test_sync_rejects_invalid_and_expired_tokens(request_factory: RequestFactory, parent_user: User):
+    """Reject forged tokens and ask for a full sync once tombstones may be gone."""
+    request = request_factory.get("/api/v1/chores/sync")
+    request.auth = parent_user
+    expired = sync.make_sync_token(timezone.now() - sync.TOMBSTONE_TTL - timedelta(days=1))
+
+    assert async_to_sync(api.sync_changes)(request, "not-a-token")[0] == 400
+    assert async_to_sync(api.sync_changes)(request, expired)[0] == 410
+
+
+def test_event_stream_pushes_transitions_to_child_and_parents(
+    request_factory: RequestFactory, child_user: User, parent_user: User, django_capture_on_commit_callbacks
+):
+    """Push committed transitions to the child's stream and to parents' streams."""
+    assignment = _create_assignment(child_user)
+    wsgi_request = request_factory.get("/api/v1/chores/events")
+    wsgi_request.auth = child_user
+
+    def mark_ready():
+        request = request_factory.patch("/api/v1/chores/assignments/{}/ready-for-approval".format(assignment.id))
+        request.auth = child_user
+        with django_capture_on_commit_callbacks(execute=True):
+            api.mark_assignment_ready_for_approval(request, assignment.id)
+
+    async def scenario():
+        streams = []
+        for user in (child_user, parent_user):
+            request = AsyncRequestFactory().get("/api/v1/chores/events")
+            request.auth = user
+            response = await api.stream_assignment_events(request)
+            stream = response.streaming_content
+            assert await anext(stream) == b": connected\n\n"
+            streams.append(stream)
+        await sync_to_async(mark_ready)()
+        events = [await anext(stream) for stream in streams]
+        for stream in streams:
+            await stream.aclose()
+        return events
+
+    events = async_to_sync(scenario)()
+
+    assert async_to_sync(api.stream_assignment_events)(wsgi_request)[0] == 501
+    for event in events:
+        name, data = event.decode().strip().split("\n")
+        assert name == "event: ready-for-approval"
+        assert orjson.loads(data.removeprefix("data: "))["assignment_id"] == assignment.id
+
+
+def test_parent_dashboard_uses_constant_queries(
+    request_factory: RequestFactory, parent_user: User, child_user: User, django_assert_num_queries
+):
+    """Summarize every child from the same number of queries however many children exist."""
+    assignment = _create_assignment(child_user)
+    api.apply_transition(Assignment.objects.filter(id=assignment.id), api.READY_FOR_APPROVAL)
+    request = request_factory.get("/api/v1/chores/dashboard")
+    request.auth = parent_user
+
+    # Role check, annotated children and open assignments.
+    with django_assert_num_queries(3):
+        single = async_to_sync(api.get_parent_dashboard)(request).data
+    for index in range(3):
+        sibling = User.objects.create_user(username="sibling-{}".format(index), password="pass")
+        sibling.groups.add(Group.objects.get(name="child"))
+        _create_assignment(sibling)
+    with django_assert_num_queries(3):
+        several = async_to_sync(api.get_parent_dashboard)(request).data
+
+    child = single["children"][0]
+    assert child["id"] == child_user.id
+    assert child["open_count"] == 1 and child["pending_approval_count"] == 1
+    assert child["due_today"] == 1 and child["completed_today"] == 1 and child["points_today"] == 0
+    assert child["assignments"][0]["assignment_id"] == assignment.id
+    assert [item["open_count"] for item in several["children"]] == [1, 1, 1, 1]
+    DashboardSchema.model_validate(several)
+
+
+def test_review_queue_pages_pending_assignments_with_evidence(
+    request_factory: RequestFactory,
+    parent_user: User,
+    child_user: User,
+    settings,
+    tmp_path,
+    django_assert_num_queries,
+):
+    """Page through open assignments awaiting approval in two queries per page."""
+    settings.MEDIA_ROOT = tmp_path
+    now = timezone.now()
+    chore = Chore.objects.create(name="Dishes", disabled=False, is_recurring=False)
+    pending = [
+        Assignment.objects.create(
+            chore=chore, assigned_to=child_user, due_date=now + timedelta(hours=hours), pending_approval=True
+        )
+        for hours in (2, 1, 3)
+    ]
+    Assignment.objects.create(chore=chore, assigned_to=child_user, due_date=now, pending_approval=True, closed=True)
+    Assignment.objects.create(chore=chore, assigned_to=child_user, due_date=now)
+    for assignment in pending[:2]:
+        AssignmentEvidence.objects.create(
+            assignment=assignment,
+            photo=_photo_upload(),
+        )
+    request = request_factory.get("/api/v1/chores/review-queue")
+    request.auth = parent_user
+
+    # Role check, the assignments and their evidence.
+    with django_assert_num_queries(3):
+        first = async_to_sync(api.get_review_queue)(request, limit=2).data
+    second = async_to_sync(api.get_review_queue)(request, cursor=first["next_cursor"], limit=2).data
+
+    assert [item["assignment_id"] for item in first["items"]] == [pending[1].id, pending[0].id]
+    assert first["items"][0]["child_id"] == child_user.id
+    assert first["items"][0]["chore"]["name"] == "Dishes"
+    assert first["items"][0]["evidence"][0]["photo_thumbnail_url"].endswith(".jpg")
+    assert [item["assignment_id"] for item in second["items"]] == [pending[2].id]
+    assert second["items"][0]["evidence"] == []
+    assert second["next_cursor"] is None
+    TypeAdapter(ReviewQueueSchema).validate_python(first)
+
+    child_request = request_factory.get("/api/v1/chores/review-queue")
+    child_request.auth = child_user
+    assert async_to_sync(api.get_review_queue)(child_request)[0] == 403
+    assert async_to_sync(api.get_review_queue)(request, cursor="forged")[0] == 400
+
+
+def test_evidence_files_are_delivered_only_to_family_members(
+    request_factory: RequestFactory, parent_user: User, child_user: User, settings, tmp_path, django_assert_num_queries
+):
+    """Serve local evidence through the authorized endpoint, offloading the transfer to the proxy when configured."""
+    settings.MEDIA_ROOT = tmp_path
+    assignment = _create_assignment(child_user)
+    evidence = AssignmentEvidence.objects.create(
+        assignment=assignment,
+        photo=_photo_upload(),
+    )
+    request = request_factory.get("/api/v1/chores/assignments/{}".format(assignment.id))
+    request.auth = parent_user
+    photo_url = async_to_sync(api.get_assignment_detail)(request, assignment.id).data["evidence"][0]["photo_url"]
+    match = resolve(urlparse(photo_url).path)
+    assert match.url_name == api.EVIDENCE_FILE_URL_NAME
+    assert match.kwargs["name"] == evidence.photo.name
+
+    def download(user: User, name: str = evidence.photo.name):
+        request = request_factory.get(urlparse(photo_url).path)
+        request.auth = user
+        return api.get_evidence_file(request, assignment.id, evidence.id, name)
+
+    with django_assert_num_queries(1):
+        response = download(parent_user)
+    assert b"".join(response.streaming_content) == (tmp_path / evidence.photo.name).read_bytes()
+    assert "private" in response["Cache-Control"]
+
+    other_child = User.objects.create_user(username="other-child", password="pass")
+    other_child.groups.add(Group.objects.get(name="child"))
+    assert download(other_child)[0] == 404
+    assert download(child_user, "chore/evidence/photos/other.jpg")[0] == 404
+
+    settings.MEDIA_DELIVERY = "x-accel-redirect"
+    response = download(child_user)
+    assert response["X-Accel-Redirect"] == "/protected-media/" + evidence.photo.name
+    assert response["Content-Type"] == "image/jpeg"
+    assert response.content == b""
+
+    settings.MEDIA_DELIVERY = "x-sendfile"
+    assert download(child_user)["X-Sendfile"] == str(tmp_path / evidence.photo.name)
+
+
+def test_instructions_video_is_served_in_ranges(
+    request_factory: RequestFactory, child_user: User, settings, tmp_path, django_assert_num_queries
+):
+    """Serve local instructions videos through an endpoint that answers range requests."""
+    settings.MEDIA_ROOT = tmp_path
+    video = bytes(range(256)) * 100
+    chore = Chore.objects.create(
+        name="Vacuum",
+        is_recurring=False,
+        instructions_video=SimpleUploadedFile("vacuum.mp4", video, content_type="video/mp4"),
+    )
+    request = request_factory.get("/api/v1/chores/chores/{}".format(chore.id))
+    request.auth = child_user
+    video_url = async_to_sync(api.get_chore_detail)(request, HttpResponse(), chore.id).instructions_video_url
+    path = urlparse(video_url).path
+    assert resolve(path).kwargs["name"] == chore.instructions_video.name
+
+    request = request_factory.get(path, HTTP_RANGE="bytes=20000-")
+    request.auth = child_user
+    with django_assert_num_queries(1):
+        response = api.get_chore_instructions_video(request, chore.id, chore.instructions_video.name)
+    assert response.status_code == 206
+    assert response["Content-Range"] == "bytes 20000-25599/25600"
+    assert b"".join(response.streaming_content) == video[20000:]
+
+    outsider = User.objects.create_user(username="outsider", password="pass")
+    request.auth = outsider
+    assert api.get_chore_instructions_video(request, chore.id, chore.instructions_video.name)[0] == 404
+    request.auth = child_user
+    assert api.get_chore_instructions_video(request, chore.id, "chore/instruction/videos/old.mp4")[0] == 404
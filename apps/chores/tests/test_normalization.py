@@ -0,0 +1,98 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from apps.chores.models import Equipment
+from apps.chores.normalization import MAX_DECODED_PIXELS, UnreadableImageError, normalize_image
+
+pytestmark = pytest.mark.django_db
+
+
+def _rotated_jpeg(width: int, height: int) -> bytes:
+    """Encode a JPEG whose EXIF says it must be rotated 90 degrees, with a GPS tag attached."""
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise
+    exif[0x8825] = {1: "N", 2: (51.0, 30.0, 0.0)}  # GPS info
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "green").save(buffer, format="JPEG", exif=exif, quality=100)
+    return buffer.getvalue()
+
+
+def test_normalize_image_rotates_caps_and_strips_metadata(settings):
+    settings.IMAGE_UPLOAD_MAX_EDGE = 1000
+    upload = SimpleUploadedFile("phone.jpeg", _rotated_jpeg(3000, 2000), content_type="image/jpeg")
+
+    result = normalize_image(upload, "test")
+
+    assert result.file.name == "phone.jpg"
+    assert result.bytes_saved > 0
+    with Image.open(result.file) as image:
+        assert image.size == (667, 1000)
+        assert not image.getexif()
+
+
+def test_normalize_image_rejects_undecodable_uploads():
+    upload = SimpleUploadedFile("photo.heic", b"not-decodable", content_type="image/heic")
+
+    with pytest.raises(UnreadableImageError):
+        normalize_image(upload, "test")
+
+
+def test_normalize_image_rejects_images_too_large_to_decode():
+    width = MAX_DECODED_PIXELS // 1000 + 1
+    buffer = BytesIO()
+    Image.new("1", (width, 1000)).save(buffer, format="PNG")
+    upload = SimpleUploadedFile("huge.png", buffer.getvalue(), content_type="image/png")
+
+    with pytest.raises(UnreadableImageError):
+        normalize_image(upload, "test")
+
+
+def _tagged_exif() -> Image.Exif:
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise
+    exif[0x8825] = {1: "N", 2: (51.0, 30.0, 0.0)}  # GPS info
+    return exif
+
+
+def _assert_stripped_original(upload: SimpleUploadedFile, image_format: str):
+    result = normalize_image(upload, "test")
+
+    assert result.file.name == upload.name
+    assert result.bytes_saved > 0
+    with Image.open(result.file) as image:
+        assert image.format == image_format
+        assert image.size == (300, 200)
+        assert dict(image.getexif()) == {0x0112: 6}
+        image.load()
+
+
+def test_normalize_image_keeps_stripped_jpeg_when_reencoding_grows_it(settings):
+    settings.IMAGE_UPLOAD_MAX_EDGE = 1000
+    settings.IMAGE_UPLOAD_QUALITY = 95
+    buffer = BytesIO()
+    Image.effect_noise((300, 200), 64).convert("RGB").save(buffer, format="JPEG", exif=_tagged_exif(), quality=20)
+
+    _assert_stripped_original(SimpleUploadedFile("small.jpeg", buffer.getvalue()), "JPEG")
+
+
+def test_normalize_image_keeps_stripped_png_when_reencoding_grows_it(settings):
+    settings.IMAGE_UPLOAD_MAX_EDGE = 1000
+    buffer = BytesIO()
+    Image.new("RGB", (300, 200), "green").save(buffer, format="PNG", exif=_tagged_exif())
+
+    _assert_stripped_original(SimpleUploadedFile("small.png", buffer.getvalue()), "PNG")
+
+
+def test_saving_equipment_stores_normalized_image(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    settings.IMAGE_UPLOAD_MAX_EDGE = 500
+    upload = SimpleUploadedFile("mop.jpg", _rotated_jpeg(1200, 800), content_type="image/jpeg")
+
+    equipment = Equipment.objects.create(name="Mop", image=upload)
+
+    with Image.open(equipment.image.path) as image:
+        assert image.size == (333, 500)
+        assert not image.getexif()
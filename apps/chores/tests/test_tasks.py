@@ -1,10 +1,26 @@
 import pytest
+from io import BytesIO
 from datetime import datetime, timezone, timedelta, time as dt_time, date
 from unittest.mock import patch
 
 from django.contrib.auth.models import Group
-
-from apps.chores.models import Chore, Assignment
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+from PIL import Image
+
+from apps.chores.api import _build_equipment_schema
+from apps.chores.derivatives import DERIVATIVE_SIZES
+from apps.chores.models import (
+    Chore,
+    Assignment,
+    AssignmentEvidence,
+    Equipment,
+    EvidenceUpload,
+    Location,
+    SyncTombstone,
+    Task,
+)
+from apps.chores.uploads import create_scratch_file, upload_path
 import apps.chores.tasks as tasks
 from apps.chores.utils import get_due_date_from_time_due
 from apps.users.models import User
@@ -213,3 +229,149 @@ def test_previous_day_completed_boundary_behavior(create_child):
         is_completed=True, completed_at__gte=prev_start, completed_at__lt=prev_end, assigned_to=c1
     ).count()
     assert counted_after == 1
+
+
+def _png_bytes(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_generate_image_derivatives_builds_sizes_and_updates_payload(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    equipment = Equipment.objects.create(
+        name="Mop", image=SimpleUploadedFile("mop.png", _png_bytes(2000, 1000), content_type="image/png")
+    )
+    request = RequestFactory().get("/api/v1/chores/equipment")
+
+    # The original is served until the derivatives exist.
+    before = _build_equipment_schema(request, equipment)
+    assert before.image_thumbnail_url == before.image_url
+
+    tasks.generate_image_derivatives("chores.Equipment", equipment.id)
+    equipment.refresh_from_db()
+
+    record = equipment.image_derivatives
+    assert record["source"] == equipment.image.name
+    with Image.open(equipment.image.storage.open(record["thumbnail"])) as thumbnail:
+        assert max(thumbnail.size) == DERIVATIVE_SIZES["thumbnail"]
+    with Image.open(equipment.image.storage.open(record["medium"])) as medium:
+        assert max(medium.size) == DERIVATIVE_SIZES["medium"]
+    after = _build_equipment_schema(request, equipment)
+    assert after.image_thumbnail_url.endswith(record["thumbnail"])
+
+
+def test_generate_image_derivatives_ignores_undecodable_files(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    # Files stored before uploads were normalized, or written around the model, may not decode.
+    equipment = Equipment.objects.create(name="Broom")
+    (tmp_path / "broom.png").write_bytes(b"not-an-image")
+    Equipment.objects.filter(id=equipment.id).update(image="broom.png")
+
+    tasks.generate_image_derivatives("chores.Equipment", equipment.id)
+    equipment.refresh_from_db()
+
+    assert equipment.image_derivatives is None
+
+
+def _direct_photo(child: User, tmp_path, content: bytes) -> AssignmentEvidence:
+    """Store `content` where a direct upload would put it and confirm it as evidence."""
+    chore = Chore.objects.create(name="Sweep", is_recurring=False)
+    assignment = Assignment.objects.create(chore=chore, assigned_to=child, due_date=datetime.now(timezone.utc))
+    name = "chore/evidence/photos/{}/0123abcd/photo.jpg".format(assignment.id)
+    (tmp_path / name).parent.mkdir(parents=True)
+    (tmp_path / name).write_bytes(content)
+    return AssignmentEvidence.objects.create(assignment=assignment, photo=name)
+
+
+def test_normalize_direct_photo_replaces_original_and_builds_derivatives(create_child, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    exif = Image.Exif()
+    exif[0x8825] = {1: "N", 2: (51.0, 30.0, 0.0)}  # GPS info
+    buffer = BytesIO()
+    Image.new("RGB", (4000, 3000), "red").save(buffer, format="JPEG", exif=exif)
+    evidence = _direct_photo(create_child("photographer"), tmp_path, buffer.getvalue())
+    original = evidence.photo.name
+
+    tasks.normalize_direct_photo(evidence.id)
+    evidence.refresh_from_db()
+
+    assert evidence.photo.name == original.replace("photo.jpg", "photo.normalized.jpg")
+    assert not (tmp_path / original).exists()
+    with Image.open(evidence.photo.path) as image:
+        assert max(image.size) == settings.IMAGE_UPLOAD_MAX_EDGE
+        assert not image.getexif()
+    assert evidence.photo_derivatives["source"] == evidence.photo.name
+
+
+def test_normalize_direct_photo_deletes_undecodable_evidence(create_child, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    evidence = _direct_photo(create_child("photographer"), tmp_path, b"heic-bytes")
+
+    tasks.normalize_direct_photo(evidence.id)
+
+    assert not AssignmentEvidence.objects.filter(id=evidence.id).exists()
+    assert not (tmp_path / evidence.photo.name).exists()
+
+
+def test_expire_evidence_uploads_removes_abandoned_uploads(create_child, settings, tmp_path):
+    settings.EVIDENCE_UPLOAD_DIR = tmp_path
+    child = create_child("uploader")
+    now = datetime.now(timezone.utc)
+    chore = Chore.objects.create(name="film", is_recurring=False)
+    assignment = Assignment.objects.create(chore=chore, assigned_to=child, due_date=now)
+    abandoned = EvidenceUpload.objects.create(
+        assignment=assignment, created_by=child, filename="a.mp4", size=10, expires_at=now - timedelta(minutes=1)
+    )
+    active = EvidenceUpload.objects.create(
+        assignment=assignment, created_by=child, filename="b.mp4", size=10, expires_at=now + timedelta(hours=1)
+    )
+    for upload in (abandoned, active):
+        create_scratch_file(upload)
+
+    tasks.expire_evidence_uploads()
+
+    assert list(EvidenceUpload.objects.values_list("id", flat=True)) == [active.id]
+    assert not upload_path(abandoned).exists()
+    assert upload_path(active).exists()
+
+
+def test_purge_sync_tombstones_keeps_recent_deletions(create_child):
+    child = create_child("tombstoned")
+    chore = Chore.objects.create(name="sweep", is_recurring=False)
+    for _ in range(2):
+        Assignment.objects.create(chore=chore, assigned_to=child, due_date=datetime.now(timezone.utc)).delete()
+    old, recent = SyncTombstone.objects.order_by("id")
+    SyncTombstone.objects.filter(id=old.id).update(deleted_at=datetime.now(timezone.utc) - timedelta(days=60))
+
+    tasks.purge_sync_tombstones()
+
+    assert list(SyncTombstone.objects.values_list("id", "owner_id")) == [(recent.id, child.id)]
+
+
+def test_location_change_rebuilds_dependent_detail_documents_in_one_batch(django_capture_on_commit_callbacks):
+    garage = Location.objects.create(name="Garage")
+    sponge = Equipment.objects.create(name="Sponge", location=garage)
+    scrub = Task.objects.create(name="Scrub")
+    scrub.equipment.add(sponge)
+    parked = Chore.objects.create(name="Park", is_recurring=False, location=garage)
+    washed = Chore.objects.create(name="Wash", is_recurring=False)
+    washed.equipment.add(sponge)
+    scrubbed = Chore.objects.create(name="Scrub car", is_recurring=False, time_due=dt_time(7, 30))
+    scrubbed.tasks.add(scrub)
+    unrelated = Chore.objects.create(name="Read", is_recurring=False)
+    tasks.rebuild_chore_detail_documents()
+    assert Chore.objects.get(id=scrubbed.id).detail_document["time_due"] == "07:30:00"
+
+    delay = tasks.rebuild_chore_detail_documents.delay
+    with patch.object(tasks.rebuild_chore_detail_documents, "delay", wraps=delay) as queued:
+        with django_capture_on_commit_callbacks(execute=True):
+            garage.name = "Shed"
+            garage.save()
+
+    queued.assert_called_once_with(sorted([parked.id, washed.id, scrubbed.id]))
+    documents = dict(Chore.objects.values_list("id", "detail_document"))
+    assert documents[parked.id]["location"]["name"] == "Shed"
+    assert documents[washed.id]["equipment"][0]["location"]["name"] == "Shed"
+    assert documents[scrubbed.id]["tasks"][0]["equipment"][0]["location"]["name"] == "Shed"
+    assert documents[unrelated.id]["name"] == "Read"
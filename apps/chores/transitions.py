@@ -0,0 +1,69 @@
+"""Guarded assignment state transitions.
+
+Each transition is a single conditional UPDATE: the guard is part of the WHERE clause, so
+of two concurrent requests only the first one to commit changes the row and the other sees
+zero rows updated.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from django.db.models import BooleanField, DateTimeField, ExpressionWrapper, F, Q, QuerySet, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+READY_FOR_APPROVAL = 'ready-for-approval'
+MARK_INCOMPLETE = 'mark-incomplete'
+APPROVE = 'approve'
+CLOSE = 'close'
+
+TRANSITION_GUARDS = {
+    READY_FOR_APPROVAL: Q(closed=False, approved=False),
+    MARK_INCOMPLETE: Q(closed=False),
+    APPROVE: Q(closed=False),
+    CLOSE: Q(closed=False),
+}
+
+
+def transition_values(action: str, now: datetime) -> dict:
+    """Return the column values written by `action`."""
+    # Keep the first completion time when an assignment is completed more than once.
+    completed_at = Coalesce(F('completed_at'), Value(now), output_field=DateTimeField())
+    if action == READY_FOR_APPROVAL:
+        return {'pending_approval': True, 'is_completed': True, 'completed_at': completed_at, 'updated_at': now}
+    if action == MARK_INCOMPLETE:
+        return {
+            'pending_approval': False,
+            'approved': False,
+            'is_completed': False,
+            'completed_at': None,
+            'approved_at': None,
+            'closed': False,
+            'closed_at': None,
+            'updated_at': now,
+        }
+    if action == APPROVE:
+        return {
+            'approved': True,
+            'pending_approval': False,
+            'is_completed': True,
+            'completed_at': completed_at,
+            'approved_at': now,
+            'closed': True,
+            'closed_at': now,
+            'updated_at': now,
+        }
+    if action == CLOSE:
+        return {'closed': True, 'closed_at': now, 'updated_at': now}
+    raise ValueError(f'Unknown assignment transition: {action}')
+
+
+def transition_eligibility(action: str) -> ExpressionWrapper:
+    """Return a boolean expression telling whether a row currently passes the guard for `action`."""
+    return ExpressionWrapper(TRANSITION_GUARDS[action], output_field=BooleanField())
+
+
+def apply_transition(queryset: QuerySet, action: str, now: Optional[datetime] = None) -> int:
+    """Apply `action` to the rows of `queryset` that still pass its guard and return the count changed."""
+    now = now or timezone.now()
+    return queryset.filter(TRANSITION_GUARDS[action]).update(**transition_values(action, now))
@@ -0,0 +1,121 @@
+"""Resumable, chunked video evidence uploads.
+
+A client creates an upload with the file's size, sends its bytes in order with PUT requests
+carrying the byte offset, then completes it. Chunks are written to a scratch file under
+`EVIDENCE_UPLOAD_DIR`, so a dropped connection only loses the chunk in flight, and the
+assembled file is streamed to media storage once.
+
+The scratch file lives on the filesystem of the host that created the upload. Web workers on
+several hosts must share `EVIDENCE_UPLOAD_DIR` on one volume; otherwise a chunk that reaches
+another host finds no scratch file and the client has to start a new upload.
+"""
+
+import fcntl
+import hashlib
+import os
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+from django.conf import settings
+
+from apps.chores.models import EvidenceUpload
+
+# Uploads idle for longer than this are discarded.
+UPLOAD_TTL = timedelta(hours=24)
+MAX_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+# Bytes copied per read while streaming chunks and hashing.
+COPY_BLOCK_SIZE = 64 * 1024
+
+
+class ChunkError(ValueError):
+    """A chunk was truncated or did not match its checksum; nothing was stored."""
+
+
+class UploadBusy(Exception):
+    """Another request is writing to the same upload."""
+
+
+class ScratchFileMissing(Exception):
+    """The scratch file is gone: it was created on another host or removed by temporary file cleanup."""
+
+
+def upload_path(upload: EvidenceUpload) -> Path:
+    """Return the scratch file holding the bytes received so far."""
+    return Path(settings.EVIDENCE_UPLOAD_DIR) / f'{upload.id}.part'
+
+
+def create_scratch_file(upload: EvidenceUpload) -> None:
+    path = upload_path(upload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+
+
+def discard_scratch_file(upload: EvidenceUpload) -> None:
+    upload_path(upload).unlink(missing_ok=True)
+
+
+@contextmanager
+def locked_scratch_file(upload: EvidenceUpload) -> Iterator[BinaryIO]:
+    """Open the scratch file for writing, holding an exclusive lock.
+
+    Raises `UploadBusy` when another request holds the lock and `ScratchFileMissing` when the
+    file does not exist.
+    """
+    try:
+        scratch = open(upload_path(upload), 'r+b')
+    except FileNotFoundError as exc:
+        raise ScratchFileMissing() from exc
+    with scratch:
+        try:
+            fcntl.flock(scratch, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            raise UploadBusy() from exc
+        try:
+            yield scratch
+        finally:
+            fcntl.flock(scratch, fcntl.LOCK_UN)
+
+
+def write_chunk(scratch: BinaryIO, offset: int, stream: BinaryIO, length: int, sha256: Optional[str] = None) -> None:
+    """Copy `length` bytes from `stream` into `scratch` at `offset`, verifying `sha256` if given.
+
+    Writing at an explicit offset makes a retried chunk overwrite its earlier attempt. On
+    failure the file is cut back to `offset`.
+    """
+    digest = hashlib.sha256()
+    scratch.seek(offset)
+    remaining = length
+    while remaining:
+        block = stream.read(min(COPY_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        scratch.write(block)
+        digest.update(block)
+        remaining -= len(block)
+
+    if remaining:
+        error = ChunkError(f'Chunk ended {remaining} bytes early')
+    elif sha256 and digest.hexdigest() != sha256.lower():
+        error = ChunkError('Chunk checksum does not match')
+    else:
+        error = None
+    scratch.truncate(offset if error else offset + length)
+    if error:
+        raise error
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file without loading it into memory."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        while block := source.read(COPY_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def clean_filename(filename: str) -> str:
+    """Keep only the base name of a client-supplied path."""
+    return os.path.basename(filename.replace('\\', '/')) or 'video'
@@ -0,0 +1,18 @@
+from django.http import HttpRequest
+from ninja import Router
+
+from apps.core.api_schema import BatchRequestSchema, BatchResponseSchema
+from apps.core.batch import BATCH_PATH, run_batch
+from apps.core.renderers import PrevalidatedResponse
+
+router = Router(tags=['Batch'])
+
+
+@router.post(BATCH_PATH, response={200: BatchResponseSchema})
+async def run_batch_operations(request: HttpRequest, payload: BatchRequestSchema):
+    """Run several API operations in one request.
+
+    Operations run in order as the authenticated user, and each result carries its own
+    status code, headers and body.
+    """
+    return PrevalidatedResponse({'results': await run_batch(request, payload.operations)}, request=request)
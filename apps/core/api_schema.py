@@ -1,4 +1,8 @@
-from ninja import Schema
+from typing import Any, Literal
+
+from ninja import Field, Schema
+
+BATCH_OPERATION_LIMIT = 20
 
 
 class AuthErrorSchema(Schema):
@@ -7,3 +11,25 @@ class AuthErrorSchema(Schema):
 
 class NotFoundSchema(Schema):
     message: str
+
+
+class BatchOperationSchema(Schema):
+    method: Literal['GET', 'POST', 'PUT', 'PATCH', 'DELETE'] = 'GET'
+    # Relative to the API root, with any query string, e.g. `chores/chores/3?fields=name`.
+    path: str = Field(..., min_length=1, max_length=2000)
+    body: Any = None
+    headers: dict[str, str] = {}
+
+
+class BatchRequestSchema(Schema):
+    operations: list[BatchOperationSchema] = Field(..., min_length=1, max_length=BATCH_OPERATION_LIMIT)
+
+
+class BatchResultSchema(Schema):
+    status: int
+    headers: dict[str, str]
+    body: Any
+
+
+class BatchResponseSchema(Schema):
+    results: list[BatchResultSchema]
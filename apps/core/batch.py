@@ -0,0 +1,137 @@
+"""Run several API requests in one round trip.
+
+Each operation names a method and a path relative to the API root, with an optional JSON
+body and headers such as If-None-Match. Operations run in order, in process, as requests
+cloned from the batch request: they skip authentication (the batch request was already
+authenticated) and share one role cache. Every operation gets its own status, headers and
+body, and commits or fails on its own; a failed operation does not undo earlier ones.
+"""
+
+import copy
+import logging
+from typing import Any, Iterable
+
+import orjson
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpRequest, QueryDict
+from django.http.response import HttpResponseBase
+from django.urls import Resolver404, ResolverMatch, resolve
+
+from apps.core.renderers import negotiate_renderer, renderer
+from apps.core.utils import shared_role_cache
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = '/batch'
+# Operations are authenticated as the batch request's user, stored under this attribute.
+BATCH_AUTH_ATTRIBUTE = 'batch_auth'
+# Headers of the batch request that describe its own body, format or preconditions, not an operation's.
+_REQUEST_SPECIFIC_META = ('CONTENT_TYPE', 'CONTENT_LENGTH', 'HTTP_ACCEPT', 'HTTP_IF_')
+_OMITTED_RESPONSE_HEADERS = {'content-type', 'content-length'}
+
+
+def _operation_request(
+    request: HttpRequest, method: str, path_info: str, body: Any, headers: dict[str, str]
+) -> HttpRequest:
+    """Clone `request` as a JSON request for one operation, asking for a JSON response.
+
+    Cloning keeps the request class, so the scheme, host and ASGI detection match the batch request.
+    """
+    path_info, _, query = path_info.partition('?')
+    content = orjson.dumps(body) if body is not None else b''
+    sub = copy.copy(request)
+    # Drop cached state derived from the batch request's body and headers.
+    for attribute in ('_post', '_files', '_stream', 'headers'):
+        sub.__dict__.pop(attribute, None)
+    sub.META = {key: value for key, value in request.META.items() if not key.startswith(_REQUEST_SPECIFIC_META)}
+    for name, value in headers.items():
+        sub.META[f'HTTP_{name.upper().replace("-", "_")}'] = value
+    sub.META.update(
+        REQUEST_METHOD=method,
+        PATH_INFO=path_info,
+        QUERY_STRING=query,
+        CONTENT_TYPE='application/json',
+        CONTENT_LENGTH=str(len(content)),
+        HTTP_ACCEPT='application/json',
+    )
+    sub.method = method
+    sub.path_info = path_info
+    sub.path = request.path.removesuffix(request.path_info) + path_info
+    sub.GET = QueryDict(query)
+    sub.content_type = 'application/json'
+    sub.content_params = {}
+    sub._body = content
+    setattr(sub, BATCH_AUTH_ATTRIBUTE, request.auth)
+    return sub
+
+
+async def _read_content(response: HttpResponseBase) -> bytes:
+    if not response.streaming:
+        return response.content
+    if response.is_async:
+        return b''.join([chunk async for chunk in response.streaming_content])
+    return await sync_to_async(b''.join)(response.streaming_content)
+
+
+async def _result(response: HttpResponseBase, embed_json: bool) -> dict:
+    """Turn an operation's response into a batch result.
+
+    With `embed_json` JSON bodies are embedded as they are, for a batch response that is JSON too.
+    """
+    if response.get('Content-Type', '').startswith('text/event-stream'):
+        response.close()
+        return _error_result(400, 'Event streams cannot be batched')
+    content = await _read_content(response)
+    response.close()
+    if not content:
+        body = None
+    elif response.get('Content-Type', '').startswith('application/json'):
+        body = orjson.Fragment(content) if embed_json else orjson.loads(content)
+    else:
+        body = content.decode(response.charset, errors='replace')
+    headers = {name: value for name, value in response.items() if name.lower() not in _OMITTED_RESPONSE_HEADERS}
+    return {'status': response.status_code, 'headers': headers, 'body': body}
+
+
+def _error_result(status: int, message: str) -> dict:
+    return {'status': status, 'headers': {}, 'body': {'message': message}}
+
+
+async def _run_operation(
+    request: HttpRequest, api_root: str, batch_match: ResolverMatch, embed_json: bool, operation: Any
+) -> dict:
+    path = api_root + operation.path.lstrip('/')
+    sub = _operation_request(request, operation.method, path, operation.body, operation.headers)
+    try:
+        match = resolve(sub.path_info)
+    except Resolver404:
+        return _error_result(404, 'Not found')
+    if match.namespace != batch_match.namespace:
+        return _error_result(404, 'Not found')
+    if match.func == batch_match.func:
+        return _error_result(400, 'Batches cannot be nested')
+    sub.resolver_match = match
+    try:
+        if iscoroutinefunction(match.func):
+            response = await match.func(sub, *match.args, **match.kwargs)
+        else:
+            response = await sync_to_async(match.func)(sub, *match.args, **match.kwargs)
+        return await _result(response, embed_json)
+    except Exception:
+        logger.exception(f'Batch operation {operation.method} {operation.path} failed.')
+        return _error_result(500, 'Internal server error')
+
+
+async def run_batch(request: HttpRequest, operations: Iterable[Any]) -> list[dict]:
+    """Run `operations` (each with `method`, `path`, `body` and `headers`) and return their results in order.
+
+    Paths are relative to the API root, the directory holding the batch endpoint.
+    """
+    api_root = request.path_info.removesuffix(BATCH_PATH) + '/'
+    batch_match = resolve(request.path_info)
+    embed_json = negotiate_renderer(request) is renderer
+    results = []
+    with shared_role_cache():
+        for operation in operations:
+            results.append(await _run_operation(request, api_root, batch_match, embed_json, operation))
+    return results
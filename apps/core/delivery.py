@@ -0,0 +1,166 @@
+"""Delivery of media files that are only served to authorized users.
+
+Protected media such as assignment evidence is not published under `MEDIA_URL`. Views check
+access and then hand the file over with `serve_media`, which keeps the transfer itself out of
+Python where it can:
+
+- Local storage behind nginx (`MEDIA_DELIVERY = 'x-accel-redirect'`) or Apache/lighttpd
+  (`'x-sendfile'`): the response only carries a header naming the file and the proxy sends it.
+- Local storage without a proxy: the file is streamed with `FileResponse`.
+- Remote storage: the client is redirected to the storage URL, which is signed on S3.
+
+Every path answers range requests, so video players can seek without downloading from byte
+zero: nginx, Apache and S3 handle `Range`, `If-Range` and the other conditional headers
+themselves, and the streamed fallback implements single byte ranges with the same validators.
+"""
+
+import mimetypes
+import os
+import re
+from typing import IO, Iterator, Optional
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage, Storage
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+
+from apps.core.media import media_url
+
+MEDIA_DELIVERY_STREAM = ''
+MEDIA_DELIVERY_ACCEL_REDIRECT = 'x-accel-redirect'
+MEDIA_DELIVERY_SENDFILE = 'x-sendfile'
+MEDIA_DELIVERY_MODES = (MEDIA_DELIVERY_STREAM, MEDIA_DELIVERY_ACCEL_REDIRECT, MEDIA_DELIVERY_SENDFILE)
+RANGE_CHUNK_SIZE = 64 * 1024
+
+_BYTE_RANGE = re.compile(r'bytes=(\d*)-(\d*)')
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested range starts past the end of the file."""
+
+
+def parse_byte_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Return the inclusive `(start, end)` of a single-range `Range` header for a file of `size` bytes.
+
+    Returns None for headers to ignore, which are answered with the whole file: malformed ones and
+    multiple ranges, which players do not send.
+    """
+    match = _BYTE_RANGE.fullmatch(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        if int(last) == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def is_local_storage(storage: Storage) -> bool:
+    """Whether files in `storage` can only reach clients through this app or its proxy."""
+    return isinstance(storage, FileSystemStorage)
+
+
+def _delivery_mode() -> str:
+    mode = settings.MEDIA_DELIVERY.lower()
+    if mode not in MEDIA_DELIVERY_MODES:
+        raise ImproperlyConfigured(f'MEDIA_DELIVERY must be one of {MEDIA_DELIVERY_MODES}, not {mode!r}.')
+    return mode
+
+
+def _offloaded_response(storage: FileSystemStorage, name: str, mode: str) -> HttpResponse:
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    response = HttpResponse(content_type=content_type)
+    if mode == MEDIA_DELIVERY_ACCEL_REDIRECT:
+        response['X-Accel-Redirect'] = f'{settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/")}/{quote(name)}'
+    else:
+        response['X-Sendfile'] = storage.path(name)
+    return response
+
+
+def _if_range_matches(request: HttpRequest, etag: str, last_modified: int) -> bool:
+    """Whether a `Range` may be honoured: `If-Range` is absent or still names this version of the file."""
+    value = request.headers.get('If-Range')
+    if value is None:
+        return True
+    if value.startswith('"'):
+        return value == etag
+    return not value.startswith('W/') and parse_http_date_safe(value) == last_modified
+
+
+def _read_range(file: IO[bytes], start: int, length: int) -> Iterator[bytes]:
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def _file_response(
+    request: HttpRequest, storage: FileSystemStorage, name: str, size: int, etag: str, last_modified: int
+) -> HttpResponseBase:
+    if 'Range' not in request.headers or not _if_range_matches(request, etag, last_modified):
+        return FileResponse(storage.open(name, 'rb'))
+    try:
+        byte_range = parse_byte_range(request.headers['Range'], size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    if byte_range is None:
+        return FileResponse(storage.open(name, 'rb'))
+
+    start, end = byte_range
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    response = StreamingHttpResponse(
+        _read_range(storage.open(name, 'rb'), start, end - start + 1), status=206, content_type=content_type
+    )
+    response['Content-Length'] = end - start + 1
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return response
+
+
+def _stream_file(request: HttpRequest, storage: FileSystemStorage, name: str) -> HttpResponseBase:
+    """Stream a local file, answering conditional and single-range requests."""
+    try:
+        stat = os.stat(storage.path(name))
+    except FileNotFoundError:
+        raise Http404('File not found') from None
+    last_modified = int(stat.st_mtime)
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified) or _file_response(
+        request, storage, name, stat.st_size, etag, last_modified
+    )
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def serve_media(request: HttpRequest, storage: Storage, name: str) -> HttpResponseBase:
+    """Return a response delivering the stored file `name` to a client already allowed to read it."""
+    if not is_local_storage(storage):
+        return HttpResponseRedirect(media_url(storage, name, request))
+
+    mode = _delivery_mode()
+    if mode == MEDIA_DELIVERY_STREAM:
+        response = _stream_file(request, storage, name)
+    else:
+        # The proxy answers 404 itself when the file is missing.
+        response = _offloaded_response(storage, name, mode)
+    patch_cache_control(response, private=True)
+    return response
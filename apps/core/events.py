@@ -0,0 +1,173 @@
+"""In-process publish/subscribe for server-sent event streams.
+
+Each process keeps its subscribers as asyncio queues, one per open stream, so an idle stream
+costs a queue entry rather than a thread or a broker connection. `InMemoryEventBroker`
+delivers only within the publishing process and suits tests and single-process servers.
+`RedisEventBroker` publishes through Redis, and one listener per process fans messages out to
+that process's subscribers. The backend is chosen by the `EVENT_BROKER` setting.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import Iterable, Optional
+
+import orjson
+import redis
+import redis.asyncio
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Messages buffered per stream; a client this far behind misses events and should resync.
+SUBSCRIBER_QUEUE_SIZE = 100
+REDIS_CHANNEL_PREFIX = 'events:'
+LISTENER_RETRY_SECONDS = 1
+
+
+class Subscription:
+    """Messages published to a set of channels, buffered for one consumer."""
+
+    def __init__(self, channels: Iterable[str]) -> None:
+        self.channels = frozenset(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def _put(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f'Dropped an event for a slow subscriber on {sorted(self.channels)}.')
+
+    def deliver(self, message: dict) -> None:
+        """Queue `message` from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # The subscriber's loop has closed; it is about to be removed.
+            pass
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Return the next message, or None if none arrives within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class InMemoryEventBroker:
+    """Deliver published messages to subscribers in this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    def _deliver(self, channel: str, message: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(message)
+
+    def publish(self, channel: str, message: dict) -> None:
+        self._deliver(channel, message)
+
+    async def _subscribed(self) -> None:
+        """Hook run after a subscription is registered."""
+
+    @asynccontextmanager
+    async def subscribe(self, channels: Iterable[str]) -> AsyncIterator[Subscription]:
+        subscription = Subscription(channels)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscriptions.setdefault(channel, set()).add(subscription)
+        try:
+            await self._subscribed()
+            yield subscription
+        finally:
+            with self._lock:
+                for channel in subscription.channels:
+                    subscribers = self._subscriptions.get(channel)
+                    if subscribers is not None:
+                        subscribers.discard(subscription)
+                        if not subscribers:
+                            del self._subscriptions[channel]
+
+
+class RedisEventBroker(InMemoryEventBroker):
+    """Publish through Redis so subscribers in every process receive messages."""
+
+    def __init__(self, url: Optional[str] = None) -> None:
+        super().__init__()
+        self.url = url or settings.REDIS_URL
+        self._client = redis.Redis.from_url(self.url)
+        self._listeners: dict[asyncio.AbstractEventLoop, tuple[asyncio.Task, asyncio.Event]] = {}
+
+    def publish(self, channel: str, message: dict) -> None:
+        self._client.publish(f'{REDIS_CHANNEL_PREFIX}{channel}', orjson.dumps(message))
+
+    async def _subscribed(self) -> None:
+        """Start this loop's listener if needed and wait until Redis confirms its subscription."""
+        loop = asyncio.get_running_loop()
+        listener, ready = self._listeners.get(loop, (None, None))
+        if listener is None or listener.done():
+            ready = asyncio.Event()
+            self._listeners[loop] = (loop.create_task(self._listen(ready)), ready)
+        await ready.wait()
+
+    async def _listen(self, ready: asyncio.Event) -> None:
+        """Fan messages from Redis out to this process's subscribers, reconnecting on errors.
+
+        `ready` is set once Redis confirms the pattern subscription and cleared while reconnecting,
+        so new subscribers wait for it instead of missing messages published before Redis starts
+        forwarding them.
+        """
+        while True:
+            client = redis.asyncio.Redis.from_url(self.url)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f'{REDIS_CHANNEL_PREFIX}*')
+                    async for item in pubsub.listen():
+                        if item['type'] == 'psubscribe':
+                            # Redis has confirmed the pattern; publishes from here on reach us.
+                            ready.set()
+                        elif item['type'] == 'pmessage':
+                            channel = item['channel'].decode().removeprefix(REDIS_CHANNEL_PREFIX)
+                            self._deliver(channel, orjson.loads(item['data']))
+            except redis.RedisError:
+                ready.clear()
+                logger.exception('Event listener lost its Redis connection; reconnecting.')
+                await asyncio.sleep(LISTENER_RETRY_SECONDS)
+            finally:
+                await client.aclose()
+
+
+@cache
+def get_event_broker() -> InMemoryEventBroker:
+    """Return the process-wide broker configured by `EVENT_BROKER`."""
+    return import_string(settings.EVENT_BROKER)()
+
+
+def sse_message(event: str, data: dict) -> bytes:
+    """Encode one server-sent event."""
+    return b'event: ' + event.encode() + b'\ndata: ' + orjson.dumps(data) + b'\n\n'
+
+
+async def event_stream(channels: Iterable[str], heartbeat: float) -> AsyncIterator[bytes]:
+    """Yield server-sent events published to `channels`, with a comment every `heartbeat` seconds.
+
+    Heartbeats keep proxies from closing idle connections and let the server notice
+    disconnected clients.
+    """
+    async with get_event_broker().subscribe(channels) as subscription:
+        # Sent once subscribed, so a client that then fetches missed changes cannot lose any.
+        yield b': connected\n\n'
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                yield b': heartbeat\n\n'
+            else:
+                yield sse_message(message['event'], message)
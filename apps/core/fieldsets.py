@@ -0,0 +1,139 @@
+"""Sparse fieldsets and relation expansion for API responses.
+
+`fields=name,points` limits a response to the listed top-level fields (the identifying field
+is always kept) and `expand=location,tasks.equipment` limits which relations are embedded;
+expanding a nested path expands its parents too. A relation is embedded only when it is both
+selected and expanded. Leaving both parameters out keeps the full response, so existing
+clients see no change. Endpoints use the selection to decide which columns and relations to
+load as well as what to encode.
+
+Endpoints accepting a selection declare `sparse_schema` copies of their response schemas, in
+which every field but the identifying one may be left out.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable, Iterable, Optional, Union, get_args, get_origin
+
+from ninja import Field, Schema
+from pydantic import create_model
+
+
+class FieldSelectionError(ValueError):
+    """The request named a field or relation the endpoint does not have."""
+
+
+def _parse_names(value: Optional[str]) -> Optional[frozenset[str]]:
+    if value is None:
+        return None
+    return frozenset(name.strip() for name in value.split(',') if name.strip())
+
+
+@dataclass(frozen=True)
+class FieldSelection:
+    fields: Optional[frozenset[str]] = None
+    expand: Optional[frozenset[str]] = None
+
+    @classmethod
+    def parse(
+        cls,
+        fields: Optional[str],
+        expand: Optional[str],
+        allowed_fields: Iterable[str],
+        relations: Iterable[str] = (),
+        key_field: str = 'id',
+    ) -> 'FieldSelection':
+        """Build a selection from query parameters, rejecting names the endpoint does not have."""
+        selected = _parse_names(fields)
+        expanded = _parse_names(expand)
+        unknown = (selected or frozenset()) - set(allowed_fields)
+        if unknown:
+            raise FieldSelectionError(f'Unknown fields: {", ".join(sorted(unknown))}')
+        unknown = (expanded or frozenset()) - set(relations)
+        if unknown:
+            raise FieldSelectionError(f'Unknown relations: {", ".join(sorted(unknown))}')
+        if selected is not None:
+            selected |= {key_field}
+        if expanded is not None:
+            # Expanding `tasks.equipment` implies expanding `tasks`.
+            expanded = frozenset(
+                path.rsplit('.', depth)[0] for path in expanded for depth in range(path.count('.') + 1)
+            )
+        return cls(fields=selected, expand=expanded)
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields is None and self.expand is None
+
+    @property
+    def key(self) -> str:
+        """Return a stable string identifying the selection, for cache keys and ETags."""
+        if self.is_full:
+            return 'full'
+        fields = ','.join(sorted(self.fields)) if self.fields is not None else '*'
+        expand = ','.join(sorted(self.expand)) if self.expand is not None else '*'
+        return f'fields={fields};expand={expand}'
+
+    def includes(self, name: str) -> bool:
+        """Tell whether a top-level field is part of the response."""
+        return self.fields is None or name in self.fields
+
+    def expands(self, path: str) -> bool:
+        """Tell whether the relation at a dotted `path` is embedded."""
+        return self.includes(path.split('.')[0]) and (self.expand is None or path in self.expand)
+
+    def selected(self, names: Iterable[str], relations: Iterable[str] = ()) -> list[str]:
+        """Return the `names` in the response, dropping relations that are not expanded."""
+        relations = set(relations)
+        return [name for name in names if (self.expands(name) if name in relations else self.includes(name))]
+
+    def columns(self, columns: dict[str, tuple[str, ...]], relations: Iterable[str] = ()) -> list[str]:
+        """Return the columns backing the selected fields, given each field's columns."""
+        return list(dict.fromkeys(column for name in self.selected(columns, relations) for column in columns[name]))
+
+    def builder(self, getters: dict[str, Callable[[Any], Any]], relations: Iterable[str] = ()) -> Callable[[Any], dict]:
+        """Return a function building the selected fields of a payload, one `getters` entry per field.
+
+        Fields are resolved once, so the builder is cheap to apply to every row of a list.
+        """
+        getters = {name: getters[name] for name in self.selected(getters, relations)}
+        return lambda obj: {name: getter(obj) for name, getter in getters.items()}
+
+
+ALL_FIELDS = FieldSelection()
+
+
+def _sparse_annotation(annotation: Any) -> Any:
+    """Return `annotation` with every schema it mentions replaced by its sparse copy."""
+    if isinstance(annotation, type) and issubclass(annotation, Schema):
+        return sparse_schema(annotation)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is None or not args:
+        return annotation
+    if origin is list:
+        return list[_sparse_annotation(args[0])]
+    if origin is Union:
+        return Union[tuple(_sparse_annotation(arg) for arg in args)]
+    return annotation
+
+
+def _omit_default(field_schema: dict) -> None:
+    # The default only makes the field optional; absent fields are left out, not sent as null.
+    field_schema.pop('default', None)
+
+
+@cache
+def sparse_schema(schema: type[Schema], key_fields: tuple[str, ...] = ('id', 'assignment_id')) -> type[Schema]:
+    """Return a copy of `schema` for responses trimmed by `fields` and `expand`.
+
+    Only the identifying field stays required, in nested schemas too, so generated clients
+    accept responses that leave out unselected fields and unexpanded relations.
+    """
+    fields = {}
+    for name, info in schema.model_fields.items():
+        annotation = _sparse_annotation(info.annotation)
+        if name in key_fields:
+            fields[name] = (annotation, ...)
+        else:
+            fields[name] = (annotation, Field(None, json_schema_extra=_omit_default))
+    return create_model(f'Sparse{schema.__name__}', __base__=Schema, **fields)
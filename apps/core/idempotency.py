@@ -0,0 +1,143 @@
+"""Replay responses to retried requests that carry an `Idempotency-Key` header.
+
+Mobile clients on flaky connections resend uploads and state transitions whose first attempt
+went through but whose response was lost. The first successful response to a key is stored in
+the cache and in `IdempotencyRecord` for `IDEMPOTENCY_TTL`. A retry with the same key, from the
+same session, to the same method and path gets the stored response back without the request
+body being parsed or acted on; usually that costs a cache lookup and a session lookup. A retry
+arriving while the first attempt is still running gets a 409 and may try again later.
+
+Only successful responses are stored: failed attempts changed nothing, so running them again
+is harmless. Keys are scoped by the session token rather than the user because the check runs
+before authentication, which keeps replays from reading the body or loading the user. A stored
+response is only replayed while its session is still live, so a token that was logged out or
+revoked gets the usual authentication error instead.
+"""
+
+import hashlib
+from datetime import timedelta
+from functools import wraps
+from importlib import import_module
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils import timezone
+
+from apps.core.models import IdempotencyRecord
+from apps.core.renderers import PrevalidatedResponse
+
+IDEMPOTENCY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+# Credentials the key is scoped to; the API authenticates with allauth's session tokens.
+SESSION_TOKEN_HEADER = 'HTTP_X_SESSION_TOKEN'
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+IDEMPOTENCY_TTL = timedelta(hours=24)
+# Long enough for a large upload; a crashed attempt frees the key after this.
+IDEMPOTENCY_LOCK_TIMEOUT = 60 * 10
+IDEMPOTENCY_CACHE_PREFIX = 'idempotency:'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+# Headers describing the response itself; connection and cookie headers are not replayed.
+_STORED_HEADERS = {'etag', 'last-modified', 'location', 'vary'}
+
+
+def _record_key(request: HttpRequest, key: str) -> str:
+    source = '\n'.join([request.META[SESSION_TOKEN_HEADER], request.method, request.path, key])
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _session_is_live(request: HttpRequest) -> bool:
+    """Whether the request's session token still names a logged-in session, at the cost of one session lookup."""
+    # allauth's session tokens are session keys; loading a missing or expired session yields an empty one.
+    session = import_module(settings.SESSION_ENGINE).SessionStore(request.META[SESSION_TOKEN_HEADER])
+    return SESSION_KEY in session
+
+
+def _stored_response(stored: dict) -> HttpResponse:
+    response = HttpResponse(stored['content'], status=stored['status_code'], content_type=stored['content_type'])
+    for header, value in stored['headers'].items():
+        response[header] = value
+    response[REPLAYED_HEADER] = 'true'
+    return response
+
+
+def _load(record_key: str) -> Optional[dict]:
+    stored = cache.get(IDEMPOTENCY_CACHE_PREFIX + record_key)
+    if stored is not None:
+        return stored
+    record = IdempotencyRecord.objects.filter(key=record_key, expires_at__gt=timezone.now()).first()
+    if record is None:
+        return None
+    stored = {
+        'status_code': record.status_code,
+        'content_type': record.content_type,
+        'headers': record.headers,
+        'content': bytes(record.content),
+    }
+    timeout = (record.expires_at - timezone.now()).total_seconds()
+    if timeout > 0:
+        cache.set(IDEMPOTENCY_CACHE_PREFIX + record_key, stored, timeout)
+    return stored
+
+
+def _save(record_key: str, response: HttpResponse) -> None:
+    stored = {
+        'status_code': response.status_code,
+        'content_type': response.get('Content-Type', ''),
+        'headers': {header: value for header, value in response.items() if header.lower() in _STORED_HEADERS},
+        'content': response.content,
+    }
+    expires_at = timezone.now() + IDEMPOTENCY_TTL
+    try:
+        IdempotencyRecord.objects.create(key=record_key, expires_at=expires_at, **stored)
+    except IntegrityError:
+        # An expired record for the key awaits purging; this response replaces it.
+        IdempotencyRecord.objects.filter(key=record_key).update(expires_at=expires_at, **stored)
+    cache.set(IDEMPOTENCY_CACHE_PREFIX + record_key, stored, IDEMPOTENCY_TTL.total_seconds())
+
+
+def idempotent(run: Callable[..., HttpResponseBase]) -> Callable[..., HttpResponseBase]:
+    """Honor `Idempotency-Key` on a synchronous API operation; apply with `ninja.decorators.decorate_view`.
+
+    Runs before Django Ninja authenticates the request or parses its parameters and body.
+    Requests without the header, or without a session token, run as usual.
+    """
+
+    @wraps(run)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponseBase:
+        key = request.META.get(IDEMPOTENCY_HEADER)
+        if key is None or not request.META.get(SESSION_TOKEN_HEADER):
+            return run(request, *args, **kwargs)
+        if not 0 < len(key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+            message = f'Idempotency-Key must be 1 to {IDEMPOTENCY_KEY_MAX_LENGTH} characters'
+            return PrevalidatedResponse({'message': message}, status=400, request=request)
+        record_key = _record_key(request, key)
+        stored = _load(record_key)
+        if stored is not None:
+            if not _session_is_live(request):
+                # Let authentication reject the request rather than replaying to a dead session.
+                return run(request, *args, **kwargs)
+            return _stored_response(stored)
+
+        lock_key = f'{IDEMPOTENCY_CACHE_PREFIX}lock:{record_key}'
+        if not cache.add(lock_key, True, IDEMPOTENCY_LOCK_TIMEOUT):
+            message = 'A request with this Idempotency-Key is still in progress'
+            return PrevalidatedResponse({'message': message}, status=409, request=request)
+        try:
+            response = run(request, *args, **kwargs)
+            if 200 <= response.status_code < 300 and not response.streaming:
+                _save(record_key, response)
+            return response
+        finally:
+            cache.delete(lock_key)
+
+    return wrapper
+
+
+def purge_idempotency_records() -> int:
+    """Delete stored responses past their expiry and return how many were removed."""
+    deleted, _ = IdempotencyRecord.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
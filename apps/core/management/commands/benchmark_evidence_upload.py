@@ -0,0 +1,70 @@
+import tempfile
+import time
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand
+
+from apps.core.storage import STORAGE_WRITE_WORKERS, delete_stored_files, save_files_concurrently
+
+DEFAULT_FILES = 8
+DEFAULT_SIZE_KB = 512
+DEFAULT_LATENCY_MS = 80
+DEFAULT_ROUNDS = 3
+
+
+class LatentFileSystemStorage(FileSystemStorage):
+    """Local storage that waits before each write to stand in for an object-store round trip."""
+
+    def __init__(self, latency: float, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.latency = latency
+
+    def _save(self, name, content):
+        time.sleep(self.latency)
+        return super()._save(name, content)
+
+
+class Command(BaseCommand):
+    help = 'Compare sequential and concurrent storage writes for a batch of evidence files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--files', type=int, default=DEFAULT_FILES, help='Files per batch.')
+        parser.add_argument('--size-kb', type=int, default=DEFAULT_SIZE_KB, help='Size of each file in KiB.')
+        parser.add_argument(
+            '--latency-ms', type=int, default=DEFAULT_LATENCY_MS, help='Simulated round trip per write; 0 for none.'
+        )
+        parser.add_argument('--workers', type=int, default=STORAGE_WRITE_WORKERS, help='Concurrent writers.')
+        parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Timed batches per path.')
+
+    def handle(self, *args, **options) -> None:
+        body = b'\0' * (options['size_kb'] * 1024)
+        workers = options['workers']
+
+        with tempfile.TemporaryDirectory() as location:
+            storage = LatentFileSystemStorage(options['latency_ms'] / 1000, location=location)
+
+            def batch():
+                return [
+                    (storage, f'evidence/photo-{index}.jpg', ContentFile(body)) for index in range(options['files'])
+                ]
+
+            def sequential():
+                return [storage.save(name, content) for _, name, content in batch()]
+
+            def concurrent():
+                return save_files_concurrently(batch(), max_workers=workers)
+
+            self.stdout.write(
+                f'Writing {options["files"]} x {options["size_kb"]} KiB files, '
+                f'{options["latency_ms"]} ms simulated latency, {options["rounds"]} rounds each'
+            )
+            for label, run in {'before: sequential saves': sequential, f'after: {workers} workers': concurrent}.items():
+                elapsed = 0.0
+                for _ in range(options['rounds']):
+                    started = time.perf_counter()
+                    names = run()
+                    elapsed += time.perf_counter() - started
+                    delete_stored_files((storage, name) for name in names)
+                elapsed_ms = elapsed / options['rounds'] * 1000
+                self.stdout.write(f'{label:<30} {elapsed_ms:8.2f} ms/batch')
@@ -0,0 +1,194 @@
+import asyncio
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from importlib import import_module
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import RequestFactory
+from django.utils import timezone
+
+from apps.chores.models import Assignment, Chore, Equipment, Location
+from apps.users.models import User
+
+DEFAULT_CLIENTS = 64
+DEFAULT_REQUESTS = 512
+DEFAULT_THREADS = 8
+DEFAULT_ASSIGNMENTS = 50
+DEFAULT_HOST = 'localhost'
+
+
+def _session_store(session_key: Optional[str] = None):
+    return import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+
+
+def _seed(assignments: int) -> tuple[User, list[Chore], Location, str]:
+    """Create a child with open assignments, a small catalog and a logged-in session token."""
+    suffix = uuid.uuid4().hex[:8]
+    child = User.objects.create_user(username=f'benchmark-read-{suffix}', password=uuid.uuid4().hex)
+    child.groups.add(Group.objects.get_or_create(name='child')[0])
+    location = Location.objects.create(name=f'Benchmark {suffix}')
+    chores = [
+        Chore.objects.create(name=f'Benchmark {suffix} {index}', is_recurring=False, location=location)
+        for index in range(5)
+    ]
+    for index, chore in enumerate(chores):
+        chore.equipment.add(Equipment.objects.create(name=f'Benchmark {suffix} {index}', location=location))
+    now = timezone.now()
+    Assignment.objects.bulk_create(
+        Assignment(chore=chores[index % len(chores)], assigned_to=child, due_date=now + timedelta(hours=index))
+        for index in range(assignments)
+    )
+    session = _session_store()
+    session[SESSION_KEY] = str(child.pk)
+    session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+    session[HASH_SESSION_KEY] = child.get_session_auth_hash()
+    session.create()
+    return child, chores, location, session.session_key
+
+
+def _cleanup(child: User, chores: list[Chore], location: Location, token: str) -> None:
+    _session_store(token).delete()
+    Assignment.objects.filter(assigned_to=child).delete()
+    Equipment.objects.filter(location=location).delete()
+    Chore.objects.filter(pk__in=[chore.pk for chore in chores]).delete()
+    location.delete()
+    child.delete()
+
+
+def _asgi_scope(environ: dict) -> dict:
+    """Translate a RequestFactory WSGI environ into the HTTP scope an ASGI server would send."""
+    headers = [
+        (key[5:].replace('_', '-').lower().encode(), value.encode())
+        for key, value in environ.items()
+        if key.startswith('HTTP_')
+    ]
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': environ['REQUEST_METHOD'],
+        'scheme': environ['wsgi.url_scheme'],
+        'path': environ['PATH_INFO'],
+        'raw_path': environ['PATH_INFO'].encode(),
+        'query_string': environ['QUERY_STRING'].encode(),
+        'headers': headers,
+        'client': ('127.0.0.1', 50000),
+        'server': (environ['SERVER_NAME'], int(environ['SERVER_PORT'])),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare throughput of the async chore read endpoints for concurrent clients, served through the '
+        'WSGI handler with a fixed pool of request threads and through the ASGI handler.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=DEFAULT_CLIENTS, help='Clients with a request in flight.')
+        parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS, help='Requests per run.')
+        parser.add_argument(
+            '--threads', type=int, default=DEFAULT_THREADS, help='WSGI request threads (gunicorn workers x threads).'
+        )
+        parser.add_argument(
+            '--assignments', type=int, default=DEFAULT_ASSIGNMENTS, help='Open assignments seeded for the child.'
+        )
+        parser.add_argument('--host', default=DEFAULT_HOST, help='Host header; must be in ALLOWED_HOSTS.')
+
+    def handle(self, *args, **options) -> None:
+        # Imported here so the handlers load the middleware of the settings the command runs with.
+        from config.asgi import application as asgi_application
+        from config.wsgi import application as wsgi_application
+
+        clients = options['clients']
+        requests = options['requests']
+        child, chores, location, token = _seed(options['assignments'])
+        assignment_ids = list(Assignment.objects.filter(assigned_to=child).values_list('id', flat=True))
+        paths = [
+            f'/api/v1/chores/children/{child.id}/assignments',
+            f'/api/v1/chores/assignments/{assignment_ids[0]}',
+            f'/api/v1/chores/chores/{chores[0].id}',
+            '/api/v1/chores/locations',
+            '/api/v1/chores/equipment',
+        ]
+        factory = RequestFactory(headers={'Host': options['host'], 'X-Session-Token': token})
+
+        def environ(index: int) -> dict:
+            return factory.get(paths[index % len(paths)], secure=settings.SECURE_SSL_REDIRECT).environ
+
+        def wsgi_request(index: int) -> tuple[int, float]:
+            started = time.perf_counter()
+            status = []
+            body = wsgi_application(environ(index), lambda line, headers, exc_info=None: status.append(line))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                body.close()
+            return int(status[0].split()[0]), time.perf_counter() - started
+
+        def wsgi() -> list[tuple[int, float]]:
+            # Requests beyond the thread count queue, as they do for gunicorn's sync workers.
+            with ThreadPoolExecutor(max_workers=min(clients, options['threads'])) as executor:
+                results = list(executor.map(wsgi_request, range(requests)))
+            connections.close_all()
+            return results
+
+        async def asgi_request(index: int, slots: asyncio.Semaphore) -> tuple[int, float]:
+            async with slots:
+                started = time.perf_counter()
+                messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+                finished = asyncio.Event()
+                status = []
+
+                async def receive():
+                    if messages:
+                        return messages.pop()
+                    # The client stays connected; the handler cancels this wait once it has responded.
+                    await finished.wait()
+                    return {'type': 'http.disconnect'}
+
+                async def send(message):
+                    if message['type'] == 'http.response.start':
+                        status.append(message['status'])
+                    elif not message.get('more_body'):
+                        finished.set()
+
+                await asgi_application(_asgi_scope(environ(index)), receive, send)
+                return status[0], time.perf_counter() - started
+
+        async def serve_asgi() -> list[tuple[int, float]]:
+            slots = asyncio.Semaphore(clients)
+            return await asyncio.gather(*(asgi_request(index, slots) for index in range(requests)))
+
+        def asgi() -> list[tuple[int, float]]:
+            return asyncio.run(serve_asgi())
+
+        runs = {f'wsgi: {options["threads"]} request threads': wsgi, 'asgi: async views': asgi}
+        try:
+            self.stdout.write(
+                f'{requests} requests from {clients} concurrent clients over {len(paths)} read endpoints, '
+                f'{connections["default"].vendor} database'
+            )
+            for label, run in runs.items():
+                run()  # Warm caches, connections and imports.
+                started = time.perf_counter()
+                results = run()
+                elapsed = time.perf_counter() - started
+                latencies = sorted(latency for _, latency in results)
+                failed = sum(1 for status, _ in results if status != 200)
+                p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+                self.stdout.write(
+                    f'{label:<32} {requests / elapsed:9.1f} req/s '
+                    f'p50 {statistics.median(latencies) * 1000:7.1f} ms p95 {p95:7.1f} ms'
+                    + (f' {failed} non-200 responses' if failed else '')
+                )
+        finally:
+            _cleanup(child, chores, location, token)
@@ -0,0 +1,82 @@
+import time
+from functools import partial
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from ninja import NinjaAPI
+from ninja.testing import TestClient
+
+from apps.chores.api import _assignment_summary_payload
+from apps.chores.api_schema import AssignmentSummarySchema
+from apps.chores.models import Assignment, Chore
+from apps.core.renderers import RENDERERS, PrevalidatedResponse, renderer
+
+DEFAULT_ITEMS = 1000
+DEFAULT_ROUNDS = 20
+
+
+def _build_assignments(count: int) -> list[Assignment]:
+    """Build unsaved assignments so the benchmark measures serialization only."""
+    now = timezone.now()
+    chores = [
+        Chore(id=index + 1, name=f'Chore {index}', description='Benchmark chore.', points=index % 10)
+        for index in range(25)
+    ]
+    return [
+        Assignment(id=index + 1, chore=chores[index % len(chores)], due_date=now + timedelta(minutes=index))
+        for index in range(count)
+    ]
+
+
+def _build_client(assignments: list[Assignment]) -> TestClient:
+    """Expose the previous and current list serialization paths on a throwaway API."""
+    api = NinjaAPI(urls_namespace='benchmark-serialization')
+
+    @api.get('/schemas', response=list[AssignmentSummarySchema], auth=None)
+    def schemas(request):
+        # Previous path: build a validated schema per row, then let Ninja validate the list.
+        return [AssignmentSummarySchema(**_assignment_summary_payload(item)) for item in assignments]
+
+    @api.get('/prevalidated', response=list[AssignmentSummarySchema], auth=None)
+    def prevalidated(request):
+        return PrevalidatedResponse([_assignment_summary_payload(item) for item in assignments])
+
+    return TestClient(api)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare serialization time for assignment list responses before and after the fast rendering path, '
+        'and payload size and encode time for each negotiated response encoding.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=DEFAULT_ITEMS, help='Assignments per response.')
+        parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='Timed requests per path.')
+
+    def handle(self, *args, **options) -> None:
+        items = options['items']
+        rounds = options['rounds']
+        assignments = _build_assignments(items)
+        client = _build_client(assignments)
+        payload = [_assignment_summary_payload(item) for item in assignments]
+
+        self.stdout.write(f'Serializing {items} assignments, {rounds} rounds each')
+        results = {
+            'before: schemas + JSONRenderer': lambda: client.get('/schemas').content,
+            'after: prevalidated + ORJSONRenderer': lambda: client.get('/prevalidated').content,
+            'encode only: ORJSONRenderer': lambda: renderer.render(None, payload, response_status=200),
+            **{
+                f'encode only: {type(item).__name__}': partial(item.render, None, payload, response_status=200)
+                for item in RENDERERS.values()
+                if item is not renderer
+            },
+        }
+        for label, run in results.items():
+            body = run()  # warm up
+            started = time.perf_counter()
+            for _ in range(rounds):
+                run()
+            elapsed_ms = (time.perf_counter() - started) / rounds * 1000
+            self.stdout.write(f'{label:<40} {elapsed_ms:8.2f} ms/response {len(body):>9} bytes')
@@ -0,0 +1,141 @@
+"""Media URL generation with caching for signed storage URLs.
+
+With S3 query-string auth every `storage.url()` call computes an HMAC signature. Signed URLs
+are cached in the Django cache for half their lifetime, which keeps them valid for at least as
+long as any cached API payload that embeds them, and are remembered on the request so a
+response signs each file once. List endpoints prime the whole page with one cache round trip.
+When `MEDIA_CDN_URL` is set, URLs are built from it directly and nothing is signed.
+"""
+
+import hashlib
+import time
+from typing import Iterable, Optional
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import Storage
+from django.http import HttpRequest
+
+MEDIA_URL_CACHE_PREFIX = 'media-url:'
+DEFAULT_SIGNED_URL_LIFETIME = 3600
+
+
+def _signs_urls(storage: Storage) -> bool:
+    return not settings.MEDIA_CDN_URL and bool(getattr(storage, 'querystring_auth', False))
+
+
+def _signed_url_timeout(storage: Storage) -> int:
+    return int(getattr(storage, 'querystring_expire', None) or DEFAULT_SIGNED_URL_LIFETIME) // 2
+
+
+def signing_window_start(storage: Storage) -> Optional[int]:
+    """Return when the current URL-signing window began, or None if `storage` does not sign URLs.
+
+    Signed URLs are cached for one window, so payloads embedding them change from one window
+    to the next and their validators must too.
+    """
+    if not _signs_urls(storage):
+        return None
+    timeout = _signed_url_timeout(storage)
+    return int(time.time()) // timeout * timeout
+
+
+def _storage_id(storage: Storage) -> str:
+    return ':'.join(
+        [type(storage).__name__, getattr(storage, 'bucket_name', '') or '', getattr(storage, 'location', '') or '']
+    )
+
+
+def _cache_key(storage: Storage, name: str) -> str:
+    digest = hashlib.blake2b(f'{_storage_id(storage)}:{name}'.encode(), digest_size=16).hexdigest()
+    return f'{MEDIA_URL_CACHE_PREFIX}{digest}'
+
+
+def _build_url(storage: Storage, name: str) -> str:
+    if settings.MEDIA_CDN_URL:
+        return f'{settings.MEDIA_CDN_URL.rstrip("/")}/{quote(name)}'
+    return storage.url(name)
+
+
+def _request_memo(request: Optional[HttpRequest]) -> dict:
+    if request is None:
+        return {}
+    if not hasattr(request, '_media_urls'):
+        request._media_urls = {}
+    return request._media_urls
+
+
+def _split_memoized(storage: Storage, names: Iterable[Optional[str]], memo: dict) -> tuple[dict, list[str]]:
+    """Return the URLs already resolved for this request and the names still to resolve."""
+    storage_id = _storage_id(storage)
+    urls = {}
+    missing = []
+    for name in dict.fromkeys(name for name in names if name):
+        if (storage_id, name) in memo:
+            urls[name] = memo[storage_id, name]
+        else:
+            missing.append(name)
+    return urls, missing
+
+
+def _sign_missing(storage: Storage, missing: list[str], keys: dict, cached: dict) -> tuple[dict, dict]:
+    """Return URLs for `missing` and the newly signed ones to cache, keyed by cache key."""
+    urls = {}
+    signed = {}
+    for name in missing:
+        url = cached.get(keys[name])
+        if url is None:
+            url = signed[keys[name]] = _build_url(storage, name)
+        urls[name] = url
+    return urls, signed
+
+
+def _remember(storage: Storage, memo: dict, urls: dict) -> None:
+    storage_id = _storage_id(storage)
+    memo.update({(storage_id, name): url for name, url in urls.items()})
+
+
+def media_urls(storage: Storage, names: Iterable[Optional[str]], request: Optional[HttpRequest] = None) -> dict:
+    """Return `{name: url}` for the given storage names, signing only those not cached."""
+    memo = _request_memo(request)
+    urls, missing = _split_memoized(storage, names, memo)
+    if not missing:
+        return urls
+
+    if _signs_urls(storage):
+        keys = {name: _cache_key(storage, name) for name in missing}
+        resolved, signed = _sign_missing(storage, missing, keys, cache.get_many(keys.values()))
+        if signed:
+            cache.set_many(signed, _signed_url_timeout(storage))
+    else:
+        resolved = {name: _build_url(storage, name) for name in missing}
+
+    _remember(storage, memo, resolved)
+    return urls | resolved
+
+
+async def amedia_urls(storage: Storage, names: Iterable[Optional[str]], request: Optional[HttpRequest] = None) -> dict:
+    """Async `media_urls` for async views; later sync lookups on the same request hit the memo."""
+    memo = _request_memo(request)
+    urls, missing = _split_memoized(storage, names, memo)
+    if not missing:
+        return urls
+
+    if _signs_urls(storage):
+        keys = {name: _cache_key(storage, name) for name in missing}
+        resolved, signed = _sign_missing(storage, missing, keys, await cache.aget_many(keys.values()))
+        if signed:
+            await cache.aset_many(signed, _signed_url_timeout(storage))
+    else:
+        resolved = {name: _build_url(storage, name) for name in missing}
+
+    _remember(storage, memo, resolved)
+    return urls | resolved
+
+
+def media_url(storage: Storage, name: Optional[str], request: Optional[HttpRequest] = None) -> Optional[str]:
+    """Return the URL for a single storage name, or None when there is no file."""
+    if not name:
+        return None
+    return media_urls(storage, [name], request)[name]
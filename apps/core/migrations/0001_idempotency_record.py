@@ -0,0 +1,27 @@
+# Generated by Django 6.0.9 on 2026-10-19 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Digest of the caller, method, path and key.', max_length=64, unique=True)),
+                ('status_code', models.PositiveSmallIntegerField()),
+                ('content_type', models.CharField(max_length=255)),
+                ('headers', models.JSONField(default=dict, help_text='Response headers replayed with the content.')),
+                ('content', models.BinaryField()),
+                ('expires_at', models.DateTimeField(db_index=True, help_text='Retries after this time run the request again.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -1,3 +1,19 @@
-from django.db import models  # noqa: F401
+from django.db import models
 
-# Create your models here.
+
+class IdempotencyRecord(models.Model):
+    """A stored response to a request sent with an `Idempotency-Key`, replayed to retries of it.
+
+    The cache holds the same responses; these rows outlive cache evictions until they expire.
+    """
+
+    key = models.CharField(max_length=64, unique=True, help_text='Digest of the caller, method, path and key.')
+    status_code = models.PositiveSmallIntegerField()
+    content_type = models.CharField(max_length=255)
+    headers = models.JSONField(default=dict, help_text='Response headers replayed with the content.')
+    content = models.BinaryField()
+    expires_at = models.DateTimeField(db_index=True, help_text='Retries after this time run the request again.')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f'Idempotent response {self.status_code} expiring at {self.expires_at}'
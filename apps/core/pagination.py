@@ -0,0 +1,37 @@
+"""Cursors for keyset pagination.
+
+A cursor holds the sort value and id of the last row on a page; the next page starts after
+that position, so it costs one index range scan however deep the client pages and rows
+inserted or removed meanwhile do not shift the pages. Cursors are signed so clients treat
+them as opaque.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+def make_cursor(salt: str, sort_value: datetime, pk: int) -> str:
+    return signing.dumps([sort_value.isoformat(), pk], salt=salt)
+
+
+def read_cursor(salt: str, cursor: str) -> Optional[tuple[datetime, int]]:
+    """Return the `(sort value, id)` position a cursor was issued for, or None if it is not a valid cursor."""
+    try:
+        value = signing.loads(cursor, salt=salt)
+    except signing.BadSignature:
+        return None
+    if not (isinstance(value, list) and len(value) == 2 and isinstance(value[0], str) and isinstance(value[1], int)):
+        return None
+    sort_value = parse_datetime(value[0])
+    return (sort_value, value[1]) if sort_value and timezone.is_aware(sort_value) else None
+
+
+def after_cursor(field: str, position: tuple[datetime, int]) -> Q:
+    """Match the rows ordered after `position` by `(field, id)`."""
+    sort_value, pk = position
+    return Q(**{f'{field}__gt': sort_value}) | Q(**{field: sort_value, 'id__gt': pk})
@@ -0,0 +1,258 @@
+from datetime import date, datetime, time
+from itertools import batched
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+from uuid import UUID
+
+import cbor2
+import msgpack
+import orjson
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from ninja import NinjaAPI
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+_fallback_encoder = NinjaJSONEncoder()
+
+
+def _encode_fallback(obj: Any) -> Any:
+    """Encode types orjson does not handle natively (pydantic models, Decimal, URLs, enums)."""
+    return _fallback_encoder.default(obj)
+
+
+def _isoformat(value: Union[datetime, date, time]) -> str:
+    text = value.isoformat()
+    return text[:-6] + 'Z' if text.endswith('+00:00') else text
+
+
+class ArrayStream:
+    """Encode a JSON array chunk by chunk, for streamed list responses."""
+
+    def __init__(self, renderer: BaseRenderer) -> None:
+        self.renderer = renderer
+        self.started = False
+
+    def chunk(self, items: list) -> bytes:
+        # Drop the brackets orjson puts around each chunk; the stream supplies its own.
+        separator = b',' if self.started else b'['
+        self.started = True
+        return separator + self.renderer.render(None, items, response_status=200)[1:-1]
+
+    def close(self) -> bytes:
+        return b']' if self.started else b'[]'
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render API responses with orjson.
+
+    Datetimes, dates, times and UUIDs are encoded natively; UTC datetimes keep the
+    `Z` suffix produced by Django's JSON encoder.
+    """
+
+    media_type = 'application/json'
+    option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    @property
+    def content_type(self) -> str:
+        return f'{self.media_type}; charset={self.charset}'
+
+    def render(self, request: Optional[HttpRequest], data: Any, *, response_status: int) -> bytes:
+        return orjson.dumps(data, default=_encode_fallback, option=self.option)
+
+    def array_stream(self) -> ArrayStream:
+        return ArrayStream(self)
+
+
+class MsgPackArrayStream(ArrayStream):
+    """Encode a MessagePack array; the item count leads the array, so items are buffered encoded."""
+
+    def __init__(self, renderer: BaseRenderer) -> None:
+        super().__init__(renderer)
+        self.count = 0
+        self.buffer: list[bytes] = []
+
+    def chunk(self, items: list) -> bytes:
+        self.count += len(items)
+        self.buffer.extend(self.renderer.render(None, item, response_status=200) for item in items)
+        return b''
+
+    def close(self) -> bytes:
+        return msgpack.Packer().pack_array_header(self.count) + b''.join(self.buffer)
+
+
+class MsgPackRenderer(BaseRenderer):
+    """Render API responses as MessagePack.
+
+    Values are the ones the JSON renderer emits: datetimes, dates, times and UUIDs become the
+    same strings, so clients can share their models between encodings.
+    """
+
+    media_type = 'application/msgpack'
+    charset = None
+
+    @property
+    def content_type(self) -> str:
+        return self.media_type
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, (datetime, date, time)):
+            return _isoformat(obj)
+        if isinstance(obj, UUID):
+            return str(obj)
+        return _encode_fallback(obj)
+
+    def render(self, request: Optional[HttpRequest], data: Any, *, response_status: int) -> bytes:
+        return msgpack.packb(data, default=self._default)
+
+    def array_stream(self) -> ArrayStream:
+        return MsgPackArrayStream(self)
+
+
+class CBORArrayStream(ArrayStream):
+    """Encode an indefinite-length CBOR array, which needs no item count up front."""
+
+    def chunk(self, items: list) -> bytes:
+        prefix = b'' if self.started else b'\x9f'
+        self.started = True
+        return prefix + b''.join(self.renderer.render(None, item, response_status=200) for item in items)
+
+    def close(self) -> bytes:
+        return b'\xff' if self.started else b'\x9f\xff'
+
+
+class CBORRenderer(MsgPackRenderer):
+    """Render API responses as CBOR.
+
+    Datetimes, dates and UUIDs use CBOR's standard tags; datetimes and dates carry the same
+    RFC 3339 text the JSON renderer emits.
+    """
+
+    media_type = 'application/cbor'
+
+    @staticmethod
+    def _cbor_default(encoder: cbor2.CBOREncoder, obj: Any) -> None:
+        encoder.encode(_isoformat(obj) if isinstance(obj, time) else _encode_fallback(obj))
+
+    def render(self, request: Optional[HttpRequest], data: Any, *, response_status: int) -> bytes:
+        return cbor2.dumps(data, default=self._cbor_default)
+
+    def array_stream(self) -> ArrayStream:
+        return CBORArrayStream(self)
+
+
+renderer = ORJSONRenderer()
+RENDERERS = {item.media_type: item for item in (renderer, MsgPackRenderer(), CBORRenderer())}
+STREAMING_CHUNK_SIZE = 500
+
+
+def negotiate_renderer(request: Optional[HttpRequest]) -> BaseRenderer:
+    """Return the renderer the request's Accept header prefers, falling back to JSON."""
+    if request is None:
+        return renderer
+    return RENDERERS.get(request.get_preferred_type(list(RENDERERS)), renderer)
+
+
+class NegotiatingNinjaAPI(NinjaAPI):
+    """Encode responses in the format the client accepts: JSON, MessagePack or CBOR."""
+
+    def create_response(
+        self,
+        request: HttpRequest,
+        data: Any,
+        *,
+        status: Optional[int] = None,
+        temporal_response: Optional[HttpResponse] = None,
+    ) -> HttpResponse:
+        selected = negotiate_renderer(request)
+        if temporal_response:
+            status = temporal_response.status_code
+        content = selected.render(request, data, response_status=status)
+        if temporal_response:
+            response = temporal_response
+            response.content = content
+            response['Content-Type'] = selected.content_type
+        else:
+            response = HttpResponse(content, status=status, content_type=selected.content_type)
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+    def create_temporal_response(self, request: HttpRequest) -> HttpResponse:
+        response = HttpResponse('', content_type=negotiate_renderer(request).content_type)
+        # Also covers 304s built from the temporal response.
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+
+class PrevalidatedResponse(HttpResponse):
+    """Response for payloads that are already shaped like the endpoint's response schema.
+
+    Django Ninja returns HttpResponse results untouched, so the payload skips response-model
+    validation and is encoded once by the API renderer. Builders feeding this response must
+    keep their output in step with the declared schema. The payload stays available as `data`
+    for in-process callers. Headers set on Ninja's temporal response (ETag, Cache-Control)
+    are carried over when it is passed in. Pass the request to encode for its Accept header.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        status: int = 200,
+        temporal_response: Optional[HttpResponse] = None,
+        request: Optional[HttpRequest] = None,
+    ) -> None:
+        selected = negotiate_renderer(request)
+        super().__init__(
+            selected.render(request, data, response_status=status), status=status, content_type=selected.content_type
+        )
+        self.data = data
+        if temporal_response is not None:
+            for header, value in temporal_response.items():
+                if header.lower() != 'content-type':
+                    self[header] = value
+        patch_vary_headers(self, ('Accept',))
+
+
+class StreamingPrevalidatedResponse(StreamingHttpResponse):
+    """Stream an array of prevalidated items, encoding them in chunks.
+
+    Pair with `QuerySet.iterator(chunk_size=...)` so rows are fetched, encoded and sent without
+    holding the whole result set in memory. Under ASGI pass an async iterable instead, such as
+    one fed by `QuerySet.aiterator()`, so the server streams it without a worker thread.
+    MessagePack arrays lead with their length, so those are sent once the last row is encoded.
+    """
+
+    def __init__(
+        self,
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+        chunk_size: int = STREAMING_CHUNK_SIZE,
+        status: int = 200,
+        request: Optional[HttpRequest] = None,
+    ) -> None:
+        selected = negotiate_renderer(request)
+        if hasattr(items, '__aiter__'):
+            content = self._aencode(items, chunk_size, selected.array_stream())
+        else:
+            content = self._encode(items, chunk_size, selected.array_stream())
+        super().__init__(content, status=status, content_type=selected.content_type)
+        patch_vary_headers(self, ('Accept',))
+
+    @staticmethod
+    def _encode(items: Iterable[Any], chunk_size: int, stream: ArrayStream) -> Iterator[bytes]:
+        for chunk in batched(items, chunk_size):
+            if content := stream.chunk(list(chunk)):
+                yield content
+        yield stream.close()
+
+    @staticmethod
+    async def _aencode(items: AsyncIterable[Any], chunk_size: int, stream: ArrayStream) -> AsyncIterator[bytes]:
+        chunk = []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                if content := stream.chunk(chunk):
+                    yield content
+                chunk = []
+        if chunk and (content := stream.chunk(chunk)):
+            yield content
+        yield stream.close()
@@ -0,0 +1,68 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Sequence
+
+from django.core.files import File
+from django.core.files.storage import Storage
+
+logger = logging.getLogger(__name__)
+
+STORAGE_WRITE_WORKERS = 4
+
+
+def _claim_unique_names(files: Sequence[tuple[Storage, str, File]]) -> list[str]:
+    """Give files that share a target name within the batch distinct names.
+
+    Storages that overwrite (S3 by default) would otherwise let parallel writes clobber each other.
+    """
+    claimed: set[tuple[int, str]] = set()
+    names = []
+    for storage, name, _ in files:
+        while (id(storage), name) in claimed:
+            root, ext = os.path.splitext(name)
+            name = storage.get_alternative_name(root, ext)
+        claimed.add((id(storage), name))
+        names.append(name)
+    return names
+
+
+def delete_stored_files(stored: Iterable[tuple[Storage, str]]) -> None:
+    """Delete files written to storage, logging rather than raising on failure."""
+    for storage, name in stored:
+        try:
+            storage.delete(name)
+        except Exception:
+            logger.exception(f'Failed to delete orphaned file {name}.')
+
+
+def save_files_concurrently(
+    files: Sequence[tuple[Storage, str, File]],
+    max_length: Optional[int] = None,
+    max_workers: int = STORAGE_WRITE_WORKERS,
+) -> list[str]:
+    """Write `(storage, name, content)` triples in parallel and return the stored names in order.
+
+    If any write fails, files that were written are deleted and the first error is raised.
+    Workers only talk to storage, never to the database.
+    """
+    if not files:
+        return []
+    names = _claim_unique_names(files)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        futures = [
+            executor.submit(storage.save, name, content, max_length=max_length)
+            for (storage, _, content), name in zip(files, names)
+        ]
+
+    stored: list[tuple[Storage, str]] = []
+    error: Optional[BaseException] = None
+    for (storage, _, _), future in zip(files, futures):
+        if future.exception() is None:
+            stored.append((storage, future.result()))
+        elif error is None:
+            error = future.exception()
+    if error is not None:
+        delete_stored_files(stored)
+        raise error
+    return [name for _, name in stored]
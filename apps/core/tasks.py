@@ -0,0 +1,13 @@
+import logging
+
+from apps.core.idempotency import purge_idempotency_records
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(name='core.tasks.purge_idempotency_records')
+def purge_expired_idempotency_records() -> None:
+    """Delete stored idempotent responses whose retry window has passed."""
+    purged = purge_idempotency_records()
+    logger.info(f'Purged {purged} idempotency records.')
@@ -0,0 +1,82 @@
+import orjson
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import Group
+from django.test import RequestFactory
+from django.utils import timezone
+
+from apps.chores.models import Assignment, Chore, Location
+from apps.core import api
+from apps.core.api_schema import BatchRequestSchema
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _user(username: str, group: str) -> User:
+    user = User.objects.create_user(username=username, password="pass")
+    user.groups.add(Group.objects.get_or_create(name=group)[0])
+    return user
+
+
+def _run_batch(user: User, operations: list[dict]) -> list[dict]:
+    request = RequestFactory().post("/api/v1/batch")
+    request.auth = user
+    response = async_to_sync(api.run_batch_operations)(
+        request, BatchRequestSchema.model_validate({"operations": operations})
+    )
+    return orjson.loads(response.content)["results"]
+
+
+def test_batch_runs_operations_with_one_role_lookup(django_assert_max_num_queries):
+    parent = _user("parent", "parent")
+    child = _user("child", "child")
+    chore = Chore.objects.create(name="Dishes", disabled=False, is_recurring=False)
+    assignment = Assignment.objects.create(chore=chore, assigned_to=child, due_date=timezone.now())
+    Location.objects.create(name="Kitchen")
+
+    with django_assert_max_num_queries(20) as captured:
+        results = _run_batch(
+            parent,
+            [
+                {"path": "/users/children"},
+                {"path": "/chores/locations?fields=name"},
+                {"path": "/chores/chores/{}?fields=name".format(chore.id)},
+                {"path": "/chores/children/{}/assignments".format(child.id)},
+                {
+                    "method": "POST",
+                    "path": "/chores/assignments/bulk",
+                    "body": {"action": "close", "assignment_ids": [assignment.id]},
+                },
+                {"path": "/chores/missing"},
+            ],
+        )
+
+    assert [result["status"] for result in results] == [200, 200, 200, 200, 200, 404]
+    assert [item["id"] for item in results[0]["body"]] == [child.id]
+    assert results[1]["body"][0]["name"] == "Kitchen"
+    assert "ETag" in results[1]["headers"]
+    assert results[2]["body"] == {"id": chore.id, "name": "Dishes"}
+    assert results[3]["body"][0]["assignment_id"] == assignment.id
+    assert results[4]["body"]["results"] == [{"assignment_id": assignment.id, "outcome": "applied"}]
+    role_queries = [query for query in captured.captured_queries if query["sql"].startswith('SELECT "auth_group"')]
+    assert len(role_queries) == 1
+
+
+def test_batch_applies_operation_headers_and_rejects_foreign_paths():
+    child = _user("child", "child")
+    Location.objects.create(name="Garage")
+    first = _run_batch(child, [{"path": "chores/locations"}])[0]
+
+    results = _run_batch(
+        child,
+        [
+            {"path": "chores/locations", "headers": {"If-None-Match": first["headers"]["ETag"]}},
+            {"method": "POST", "path": "batch", "body": {"operations": [{"path": "chores/locations"}]}},
+            {"path": "../../admin/"},
+            {"method": "POST", "path": "chores/assignments/bulk", "body": {"action": "close", "assignment_ids": [1]}},
+        ],
+    )
+
+    assert [result["status"] for result in results] == [304, 400, 404, 403]
+    assert results[0]["body"] is None
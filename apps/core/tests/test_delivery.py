@@ -0,0 +1,57 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import RequestFactory
+
+from apps.core.delivery import RangeNotSatisfiable, parse_byte_range, serve_media
+
+VIDEO = bytes(range(256)) * 40
+
+
+def test_parse_byte_range():
+    assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_byte_range("bytes=900-", 1000) == (900, 999)
+    assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+    assert parse_byte_range("bytes=-5000", 1000) == (0, 999)
+    assert parse_byte_range("bytes=500-5000", 1000) == (500, 999)
+    assert parse_byte_range("bytes=0-1,5-6", 1000) is None
+    assert parse_byte_range("bytes=9-3", 1000) is None
+    assert parse_byte_range("items=0-1", 1000) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range("bytes=1000-", 1000)
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range("bytes=-0", 1000)
+
+
+def test_streamed_media_answers_range_and_conditional_requests(tmp_path, settings):
+    settings.MEDIA_DELIVERY = ""
+    storage = FileSystemStorage(location=tmp_path)
+    name = storage.save("videos/intro.mp4", ContentFile(VIDEO))
+
+    def get(**headers):
+        return serve_media(RequestFactory().get("/video", headers=headers), storage, name)
+
+    full = get()
+    assert full.status_code == 200
+    assert b"".join(full.streaming_content) == VIDEO
+    assert full["Accept-Ranges"] == "bytes"
+    etag, last_modified = full["ETag"], full["Last-Modified"]
+
+    partial = get(Range="bytes=1000-1999")
+    assert partial.status_code == 206
+    assert partial["Content-Range"] == f"bytes 1000-1999/{len(VIDEO)}"
+    assert partial["Content-Length"] == "1000"
+    assert partial["Content-Type"] == "video/mp4"
+    assert b"".join(partial.streaming_content) == VIDEO[1000:2000]
+    assert b"".join(get(Range="bytes=-10").streaming_content) == VIDEO[-10:]
+
+    unsatisfiable = get(Range=f"bytes={len(VIDEO)}-")
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable["Content-Range"] == f"bytes */{len(VIDEO)}"
+
+    assert get(Range="bytes=0-9", If_Range=etag).status_code == 206
+    assert get(Range="bytes=0-9", If_Range=last_modified).status_code == 206
+    assert get(Range="bytes=0-9", If_Range='"stale"').status_code == 200
+    assert get(If_None_Match=etag).status_code == 304
+    assert get(If_Modified_Since=last_modified).status_code == 304
+    assert get(If_Match='"stale"').status_code == 412
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+from asgiref.sync import async_to_sync
+
+from apps.core import events
+from apps.core.events import InMemoryEventBroker, event_stream, get_event_broker
+
+
+def test_in_memory_broker_delivers_to_matching_subscribers_across_threads():
+    broker = InMemoryEventBroker()
+
+    async def scenario():
+        async with broker.subscribe(["a"]) as first, broker.subscribe(["b"]) as second:
+            publisher = threading.Thread(target=broker.publish, args=("a", {"event": "ping"}))
+            publisher.start()
+            publisher.join()
+            received = await first.get(timeout=1)
+            missed = await second.get(timeout=0.01)
+        return received, missed, broker._subscriptions
+
+    received, missed, remaining = async_to_sync(scenario)()
+
+    assert received == {"event": "ping"}
+    assert missed is None
+    assert remaining == {}
+
+
+def test_event_stream_sends_heartbeats_and_events():
+    async def scenario():
+        stream = event_stream(["stream"], heartbeat=0.01)
+        chunks = [await anext(stream), await anext(stream)]
+        get_event_broker().publish("stream", {"event": "approved", "assignment_id": 1})
+        await asyncio.sleep(0)
+        while (chunk := await anext(stream)) == b": heartbeat\n\n":
+            pass
+        await stream.aclose()
+        return chunks + [chunk]
+
+    connected, heartbeat, event = async_to_sync(scenario)()
+
+    assert connected == b": connected\n\n"
+    assert heartbeat == b": heartbeat\n\n"
+    assert event == b'event: approved\ndata: {"event":"approved","assignment_id":1}\n\n'
+
+
+class FakePubSub:
+    def __init__(self, items):
+        self.items = items
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def psubscribe(self, pattern):
+        pass
+
+    async def listen(self):
+        while True:
+            yield await self.items.get()
+
+
+class FakeAsyncRedis:
+    def __init__(self, items):
+        self.items = items
+
+    def pubsub(self):
+        return FakePubSub(self.items)
+
+    async def aclose(self):
+        pass
+
+
+def test_redis_broker_waits_for_subscription_confirmation(monkeypatch):
+    """Only hand out a subscription once Redis has confirmed the listener's pattern."""
+    monkeypatch.setattr(events.redis, "Redis", Mock())
+
+    async def scenario():
+        items = asyncio.Queue()
+        monkeypatch.setattr(events.redis.asyncio.Redis, "from_url", lambda url: FakeAsyncRedis(items))
+        broker = events.RedisEventBroker("redis://events")
+        entered = asyncio.Event()
+
+        async def subscriber():
+            async with broker.subscribe(["a"]) as subscription:
+                entered.set()
+                return await subscription.get(timeout=1)
+
+        task = asyncio.create_task(subscriber())
+        await asyncio.sleep(0.01)
+        waited = not entered.is_set()
+        await items.put({"type": "psubscribe", "channel": b"events:*", "data": 1})
+        await entered.wait()
+        await items.put({"type": "pmessage", "channel": b"events:a", "data": b'{"event":"ping"}'})
+        received = await task
+        for listener, _ in broker._listeners.values():
+            listener.cancel()
+        return waited, received
+
+    waited, received = async_to_sync(scenario)()
+
+    assert waited
+    assert received == {"event": "ping"}
@@ -0,0 +1,102 @@
+from io import BytesIO
+
+import pytest
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import Group
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.utils import timezone
+from PIL import Image
+
+from apps.chores.models import Assignment, AssignmentEvidence, Chore
+from apps.core.idempotency import REPLAYED_HEADER, purge_idempotency_records
+from apps.core.models import IdempotencyRecord
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _child_session() -> tuple[User, str]:
+    child = User.objects.create_user(username="child", password="pass")
+    child.groups.add(Group.objects.get_or_create(name="child")[0])
+    session = SessionStore()
+    session[SESSION_KEY] = str(child.pk)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = child.get_session_auth_hash()
+    session.create()
+    return child, session.session_key
+
+
+def _assignment(child: User) -> Assignment:
+    chore = Chore.objects.create(name="Dishes", disabled=False, is_recurring=False)
+    return Assignment.objects.create(chore=chore, assigned_to=child, due_date=timezone.now())
+
+
+def test_retried_evidence_upload_replays_first_response(settings, tmp_path, django_assert_num_queries):
+    settings.MEDIA_ROOT = tmp_path
+    child, token = _child_session()
+    assignment = _assignment(child)
+    url = "/api/v1/chores/assignments/{}/evidence".format(assignment.id)
+
+    def upload(key: str):
+        buffer = BytesIO()
+        Image.new("RGB", (32, 24), "blue").save(buffer, format="JPEG")
+        photo = SimpleUploadedFile("photo.jpg", buffer.getvalue(), content_type="image/jpeg")
+        return Client().post(url, {"photo": photo}, headers={"X-Session-Token": token, "Idempotency-Key": key})
+
+    first = upload("upload-1")
+    # A cache hit answers with one session lookup, before authentication and without reading the upload.
+    with django_assert_num_queries(1):
+        retry = upload("upload-1")
+    cache.clear()
+    with django_assert_num_queries(2):
+        after_eviction = upload("upload-1")
+    other = upload("upload-2")
+
+    assert first.status_code == retry.status_code == after_eviction.status_code == 201
+    assert retry.content == after_eviction.content == first.content
+    assert retry[REPLAYED_HEADER] == "true"
+    assert REPLAYED_HEADER not in first
+    assert other.status_code == 201
+    assert AssignmentEvidence.objects.count() == 2
+    assert len(list((tmp_path / "chore" / "evidence" / "photos").iterdir())) == 2
+
+
+def test_retried_transition_replays_and_failures_are_not_stored():
+    child, token = _child_session()
+    assignment = _assignment(child)
+    client = Client()
+    url = "/api/v1/chores/assignments/{}/ready-for-approval".format(assignment.id)
+    headers = {"X-Session-Token": token, "Idempotency-Key": "ready-1"}
+
+    first = client.patch(url, headers=headers)
+    retry = client.patch(url, headers=headers)
+    Assignment.objects.filter(id=assignment.id).update(closed=True)
+    failed = client.patch(url, headers={**headers, "Idempotency-Key": "ready-2"})
+    Assignment.objects.filter(id=assignment.id).update(closed=False, pending_approval=False)
+    retried_failure = client.patch(url, headers={**headers, "Idempotency-Key": "ready-2"})
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.content == first.content
+    assert failed.status_code == 409
+    assert retried_failure.status_code == 200
+    assert REPLAYED_HEADER not in retried_failure
+
+    IdempotencyRecord.objects.update(expires_at=timezone.now())
+    assert purge_idempotency_records() == 2
+
+
+def test_stored_responses_are_not_replayed_after_logout():
+    child, token = _child_session()
+    assignment = _assignment(child)
+    url = "/api/v1/chores/assignments/{}/ready-for-approval".format(assignment.id)
+    headers = {"X-Session-Token": token, "Idempotency-Key": "ready-1"}
+
+    assert Client().patch(url, headers=headers).status_code == 200
+    SessionStore(session_key=token).delete()
+    retry = Client().patch(url, headers=headers)
+
+    assert retry.status_code == 401
+    assert REPLAYED_HEADER not in retry
@@ -0,0 +1,43 @@
+from django.test import RequestFactory
+from storages.backends.s3 import S3Storage
+
+from apps.core import media
+
+
+class CountingS3Storage(S3Storage):
+    """S3 storage that counts how many URLs it signs."""
+
+    signed = 0
+
+    def url(self, name, *args, **kwargs):
+        self.signed += 1
+        return super().url(name, *args, **kwargs)
+
+
+def _storage() -> CountingS3Storage:
+    return CountingS3Storage(
+        bucket_name="media", access_key="test-key", secret_key="test-secret", region_name="us-east-1"
+    )
+
+
+def test_media_urls_cache_signed_urls_across_requests():
+    storage = _storage()
+    names = ["chore/a.jpg", "chore/b.jpg", None, "chore/a.jpg"]
+
+    first = media.media_urls(storage, names, RequestFactory().get("/"))
+    second = media.media_urls(storage, names, RequestFactory().get("/"))
+
+    assert set(first) == {"chore/a.jpg", "chore/b.jpg"}
+    assert "Signature=" in first["chore/a.jpg"]
+    assert second == first
+    assert storage.signed == 2
+
+
+def test_media_url_uses_cdn_without_signing(settings):
+    settings.MEDIA_CDN_URL = "https://cdn.example.com/"
+    storage = _storage()
+
+    url = media.media_url(storage, "chore/evidence/my photo.jpg")
+
+    assert url == "https://cdn.example.com/chore/evidence/my%20photo.jpg"
+    assert storage.signed == 0
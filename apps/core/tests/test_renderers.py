@@ -0,0 +1,74 @@
+from datetime import datetime, time, timezone
+from uuid import UUID
+
+import cbor2
+import msgpack
+import orjson
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from apps.core.renderers import PrevalidatedResponse, StreamingPrevalidatedResponse
+from config.api import api_v1
+
+PAYLOAD = {
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "due": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "time_due": time(7, 30),
+    "points": 3,
+}
+
+
+def _request(accept: str):
+    return RequestFactory().get("/api/v1/chores/locations", HTTP_ACCEPT=accept)
+
+
+def test_prevalidated_response_negotiates_encoding():
+    as_json = PrevalidatedResponse(PAYLOAD, request=_request("application/json"))
+    as_msgpack = PrevalidatedResponse(PAYLOAD, request=_request("application/msgpack, application/json;q=0.5"))
+    as_cbor = PrevalidatedResponse(PAYLOAD, request=_request("application/cbor"))
+    fallback = PrevalidatedResponse(PAYLOAD, request=_request("text/html"))
+
+    assert as_json["Content-Type"] == "application/json; charset=utf-8"
+    assert as_msgpack["Content-Type"] == "application/msgpack"
+    assert as_cbor["Content-Type"] == "application/cbor"
+    assert fallback.content == as_json.content
+    assert msgpack.unpackb(as_msgpack.content) == orjson.loads(as_json.content)
+    decoded = cbor2.loads(as_cbor.content)
+    assert decoded["due"] == PAYLOAD["due"]
+    assert decoded["time_due"] == "07:30:00"
+    assert as_msgpack["Vary"] == "Accept"
+
+
+def test_streaming_response_encodes_binary_arrays():
+    items = [{"id": index, "due": PAYLOAD["due"]} for index in range(5)]
+
+    def content(accept: str) -> bytes:
+        response = StreamingPrevalidatedResponse(iter(items), chunk_size=2, request=_request(accept))
+        return b"".join(response.streaming_content)
+
+    async def acontent(accept: str) -> bytes:
+        async def rows():
+            for item in items:
+                yield item
+
+        response = StreamingPrevalidatedResponse(rows(), chunk_size=2, request=_request(accept))
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    expected = orjson.loads(content("application/json"))
+    assert msgpack.unpackb(content("application/msgpack")) == expected
+    assert msgpack.unpackb(async_to_sync(acontent)("application/msgpack")) == expected
+    assert [item["id"] for item in cbor2.loads(content("application/cbor"))] == list(range(5))
+    assert cbor2.loads(async_to_sync(acontent)("application/cbor"))[4]["due"] == PAYLOAD["due"]
+    empty = StreamingPrevalidatedResponse(iter([]), request=_request("application/cbor"))
+    assert cbor2.loads(b"".join(empty.streaming_content)) == []
+
+
+def test_api_negotiates_schema_responses():
+    request = _request("application/msgpack")
+    response = api_v1.create_response(request, {"message": "Unauthorized"}, status=403)
+    temporal = api_v1.create_temporal_response(request)
+
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"message": "Unauthorized"}
+    assert temporal["Content-Type"] == "application/msgpack"
+    assert temporal["Vary"] == "Accept"
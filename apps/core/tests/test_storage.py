@@ -0,0 +1,40 @@
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+
+from apps.core import storage
+
+
+class FailingStorage(FileSystemStorage):
+    """Filesystem storage that refuses to write names containing "broken"."""
+
+    def _save(self, name, content):
+        if "broken" in name:
+            raise OSError("write failed")
+        return super()._save(name, content)
+
+
+def test_save_files_concurrently_keeps_order_and_unique_names(tmp_path):
+    target = FileSystemStorage(location=tmp_path)
+    files = [(target, "evidence/photo.jpg", ContentFile(f"photo-{index}".encode())) for index in range(3)]
+
+    names = storage.save_files_concurrently(files)
+
+    assert names[0] == "evidence/photo.jpg"
+    assert len(set(names)) == 3
+    assert [target.open(name).read() for name in names] == [b"photo-0", b"photo-1", b"photo-2"]
+
+
+def test_save_files_concurrently_removes_written_files_on_failure(tmp_path):
+    target = FailingStorage(location=tmp_path)
+    files = [
+        (target, "evidence/first.jpg", ContentFile(b"first")),
+        (target, "evidence/broken.jpg", ContentFile(b"broken")),
+        (target, "evidence/last.jpg", ContentFile(b"last")),
+    ]
+
+    with pytest.raises(OSError):
+        storage.save_files_concurrently(files)
+
+    assert not target.exists("evidence/first.jpg")
+    assert not target.exists("evidence/last.jpg")
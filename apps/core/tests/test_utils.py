@@ -1,4 +1,5 @@
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 
@@ -39,3 +40,13 @@ def test_is_parent_and_is_child_helpers():
 
     assert utils.is_child(child) is True
     assert utils.is_child(parent) is False
+
+
+@pytest.mark.django_db
+def test_async_role_helpers_match_sync_helpers():
+    parent = User.objects.create_user(username="async_parent", password="pass")
+    parent.groups.add(Group.objects.create(name="parent"))
+
+    assert async_to_sync(utils.ais_parent)(parent) is True
+    assert async_to_sync(utils.ais_child)(parent) is False
+    assert async_to_sync(utils.ais_member)(parent, "no-such-group") is False
@@ -1,9 +1,34 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
 from apps.users.models import User
 
+# user id -> group names, while a `shared_role_cache()` block is active.
+_role_cache: ContextVar[Optional[dict[int, frozenset[str]]]] = ContextVar('role_cache', default=None)
+
+
+@contextmanager
+def shared_role_cache() -> Iterator[None]:
+    """Load each user's groups once for all role checks in the block, such as the operations of a batch.
+
+    The cache is shared with threads `sync_to_async` starts from the block, since they copy the context.
+    """
+    token = _role_cache.set({})
+    try:
+        yield
+    finally:
+        _role_cache.reset(token)
+
 
 def is_member(user: User, group_name: str) -> bool:
     """Check if a user is a member of a group."""
-    return user.groups.filter(name=group_name).exists()
+    roles = _role_cache.get()
+    if roles is None:
+        return user.groups.filter(name=group_name).exists()
+    if user.pk not in roles:
+        roles[user.pk] = frozenset(user.groups.values_list('name', flat=True))
+    return group_name in roles[user.pk]
 
 
 def is_parent(user: User) -> bool:
@@ -14,3 +39,23 @@ def is_parent(user: User) -> bool:
 def is_child(user: User) -> bool:
     """Check if a user is a child."""
     return is_member(user, 'child')
+
+
+async def ais_member(user: User, group_name: str) -> bool:
+    """Check if a user is a member of a group from an async view."""
+    roles = _role_cache.get()
+    if roles is None:
+        return await user.groups.filter(name=group_name).aexists()
+    if user.pk not in roles:
+        roles[user.pk] = frozenset([name async for name in user.groups.values_list('name', flat=True)])
+    return group_name in roles[user.pk]
+
+
+async def ais_parent(user: User) -> bool:
+    """Check if a user is a parent from an async view."""
+    return await ais_member(user, 'parent')
+
+
+async def ais_child(user: User) -> bool:
+    """Check if a user is a child from an async view."""
+    return await ais_member(user, 'child')
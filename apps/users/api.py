@@ -1,7 +1,9 @@
 from datetime import date
+from typing import Optional
 from apps.users.models import User
 from apps.core.utils import is_parent
 from apps.core.api_schema import AuthErrorSchema
+from apps.core.renderers import STREAMING_CHUNK_SIZE, StreamingPrevalidatedResponse
 from ninja import Router, Schema
 
 router = Router(tags=['Users'])
@@ -12,7 +14,7 @@ class GetChildrenSchema(Schema):
     first_name: str
     last_name: str
     email: str
-    birth_date: date
+    birth_date: Optional[date]
 
 
 @router.get('/children', response={200: list[GetChildrenSchema], 403: AuthErrorSchema})
@@ -21,5 +23,11 @@ def get_children(request):
     user: User = request.auth
     if not is_parent(user):
         return 403, {'message': 'Unauthorized'}
-    children = User.objects.filter(groups__name='child', is_active=True)
-    return [GetChildrenSchema.from_orm(child) for child in children]
+    # Rows already match GetChildrenSchema field for field.
+    children = (
+        User.objects.filter(groups__name='child', is_active=True)
+        .order_by('id')
+        .values('id', 'first_name', 'last_name', 'email', 'birth_date')
+        .iterator(chunk_size=STREAMING_CHUNK_SIZE)
+    )
+    return StreamingPrevalidatedResponse(children, request=request)
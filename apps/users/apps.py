@@ -6,3 +6,8 @@ class UsersConfig(AppConfig):
 
     class Meta:
         default_auto_field = 'django.db.models.BigAutoField'
+
+    def ready(self) -> None:
+        from apps.users.signals import connect_signals
+
+        connect_signals()
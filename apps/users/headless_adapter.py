@@ -1,8 +1,10 @@
 import dataclasses
+import functools
 import uuid
 from typing import Any, List, Optional, Type
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models
 
 from allauth.account import app_settings as account_settings
@@ -10,6 +12,68 @@ from allauth.account.models import EmailAddress
 from allauth.account.utils import user_display, user_username
 from allauth.headless.adapter import DefaultHeadlessAdapter
 
+# Serialized headless user payloads, cleared by `apps.users.signals` when the user, their
+# email addresses or their groups change. The timeout only bounds changes made behind the
+# ORM's back, such as `QuerySet.update()`.
+HEADLESS_USER_CACHE_TIMEOUT = 60 * 60
+
+
+def headless_user_cache_key(user_id: int) -> str:
+    """Return the cache key holding a user's serialized headless payload."""
+    return f'users:headless-user:{user_id}'
+
+
+@functools.cache
+def _user_dataclass() -> Type:
+    """Build the user dataclass once per process; `make_dataclass` is too slow to run per request."""
+    fields = []
+    User = get_user_model()
+    pk_field_class = type(User._meta.pk)
+    if issubclass(pk_field_class, models.UUIDField):
+        id_type = str
+        id_example = str(uuid.uuid4())
+    elif issubclass(pk_field_class, models.IntegerField):
+        id_type = int
+        id_example = 123
+    else:
+        id_type = str
+        id_example = 'uid'
+
+    def dc_field(attr, typ, description, example):
+        return (
+            attr,
+            typ,
+            dataclasses.field(
+                metadata={
+                    'description': description,
+                    'example': example,
+                }
+            ),
+        )
+
+    fields.extend(
+        [
+            dc_field('id', Optional[id_type], 'The user ID.', id_example),
+            dc_field('display', str, 'The display name for the user.', 'Magic Wizard'),
+            dc_field('email', Optional[str], 'The email address.', 'email@domain.org'),
+            dc_field(
+                'has_usable_password',
+                bool,
+                'Whether or not the account has a password set.',
+                True,
+            ),
+            dc_field(
+                'groups',
+                List[str],
+                'The group names assigned to the user.',
+                ['parent', 'child'],
+            ),
+        ]
+    )
+    if account_settings.USER_MODEL_USERNAME_FIELD:
+        fields.append(dc_field('username', str, 'The username.', 'wizard'))
+    return dataclasses.make_dataclass('User', fields)
+
 
 class GroupAwareHeadlessAdapter(DefaultHeadlessAdapter):
     """
@@ -19,8 +83,22 @@ class GroupAwareHeadlessAdapter(DefaultHeadlessAdapter):
     def user_as_dataclass(self, user: Any) -> Any:
         """
         Return a dataclass instance that includes group names.
+
+        Saved users are served from the cache, so a session check adds no queries.
+        """
+        if not user.pk:
+            return self.get_user_dataclass()(**self._user_payload(user))
+        key = headless_user_cache_key(user.pk)
+        payload = cache.get(key)
+        if payload is None:
+            payload = self._user_payload(user)
+            cache.set(key, payload, HEADLESS_USER_CACHE_TIMEOUT)
+        return self.get_user_dataclass()(**payload)
+
+    def _user_payload(self, user: Any) -> dict:
+        """
+        Return the user dataclass fields, loading the primary email and groups.
         """
-        UserDc = self.get_user_dataclass()
         kwargs = {}
         User = get_user_model()
         pk_field_class = type(User._meta.pk)
@@ -49,59 +127,13 @@ class GroupAwareHeadlessAdapter(DefaultHeadlessAdapter):
                 'groups': self._group_names(user),
             }
         )
-        return UserDc(**kwargs)
+        return kwargs
 
     def get_user_dataclass(self) -> Type:
         """
         Return a user dataclass schema that includes group names.
         """
-        fields = []
-        User = get_user_model()
-        pk_field_class = type(User._meta.pk)
-        if issubclass(pk_field_class, models.UUIDField):
-            id_type = str
-            id_example = str(uuid.uuid4())
-        elif issubclass(pk_field_class, models.IntegerField):
-            id_type = int
-            id_example = 123
-        else:
-            id_type = str
-            id_example = 'uid'
-
-        def dc_field(attr, typ, description, example):
-            return (
-                attr,
-                typ,
-                dataclasses.field(
-                    metadata={
-                        'description': description,
-                        'example': example,
-                    }
-                ),
-            )
-
-        fields.extend(
-            [
-                dc_field('id', Optional[id_type], 'The user ID.', id_example),
-                dc_field('display', str, 'The display name for the user.', 'Magic Wizard'),
-                dc_field('email', Optional[str], 'The email address.', 'email@domain.org'),
-                dc_field(
-                    'has_usable_password',
-                    bool,
-                    'Whether or not the account has a password set.',
-                    True,
-                ),
-                dc_field(
-                    'groups',
-                    List[str],
-                    'The group names assigned to the user.',
-                    ['parent', 'child'],
-                ),
-            ]
-        )
-        if account_settings.USER_MODEL_USERNAME_FIELD:
-            fields.append(dc_field('username', str, 'The username.', 'wizard'))
-        return dataclasses.make_dataclass('User', fields)
+        return _user_dataclass()
 
     def _group_names(self, user: Any) -> List[str]:
         """
@@ -0,0 +1,62 @@
+from functools import partial
+from typing import Iterable
+
+from allauth.account.models import EmailAddress
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from apps.users.headless_adapter import headless_user_cache_key
+from apps.users.models import User
+
+
+def _invalidate_on_commit(user_ids: Iterable[int]) -> None:
+    # Invalidating before commit would let a concurrent session check re-cache the old rows.
+    keys = [headless_user_cache_key(user_id) for user_id in user_ids]
+    if keys:
+        transaction.on_commit(partial(cache.delete_many, keys))
+
+
+def user_changed(sender, instance, update_fields=None, **kwargs) -> None:
+    """Drop the cached headless payload of a saved or deleted user."""
+    # Logging in only stamps last_login, which the payload does not include.
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    _invalidate_on_commit([instance.pk])
+
+
+def email_changed(sender, instance, **kwargs) -> None:
+    """Drop the cached headless payload of the user owning a changed email address."""
+    _invalidate_on_commit([instance.user_id])
+
+
+def group_changing(sender, instance, created: bool = False, **kwargs) -> None:
+    """Drop the cached headless payloads of the members of a renamed or deleted group."""
+    if created:
+        return
+    _invalidate_on_commit(instance.user_set.values_list('id', flat=True))
+
+
+def memberships_changed(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    """Drop the cached headless payloads of users who joined or left groups."""
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        _invalidate_on_commit([instance.pk])
+    elif pk_set is not None:
+        _invalidate_on_commit(pk_set)
+    else:
+        # Clearing a group's members: resolve them before the rows go away.
+        _invalidate_on_commit(instance.user_set.values_list('id', flat=True))
+
+
+def connect_signals() -> None:
+    """Connect the receivers keeping cached headless user payloads current."""
+    post_save.connect(user_changed, sender=User, dispatch_uid='users-headless-user-save')
+    post_delete.connect(user_changed, sender=User, dispatch_uid='users-headless-user-delete')
+    post_save.connect(email_changed, sender=EmailAddress, dispatch_uid='users-headless-email-save')
+    post_delete.connect(email_changed, sender=EmailAddress, dispatch_uid='users-headless-email-delete')
+    post_save.connect(group_changing, sender=Group, dispatch_uid='users-headless-group-save')
+    pre_delete.connect(group_changing, sender=Group, dispatch_uid='users-headless-group-delete')
+    m2m_changed.connect(memberships_changed, sender=User.groups.through, dispatch_uid='users-headless-groups')
@@ -0,0 +1,33 @@
+import orjson
+import pytest
+from django.contrib.auth.models import Group
+from django.test import RequestFactory
+
+from apps.users import api
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_children_streams_projected_rows(django_assert_num_queries):
+    """Return active children, including those without a birth date, from one projected query."""
+    parent_group = Group.objects.create(name="parent")
+    child_group = Group.objects.create(name="child")
+    parent = User.objects.create_user(username="parent", password="pass")
+    parent.groups.add(parent_group)
+    child = User.objects.create_user(username="child", password="pass", first_name="Sam")
+    child.groups.add(child_group)
+    inactive = User.objects.create_user(username="inactive", password="pass", is_active=False)
+    inactive.groups.add(child_group)
+
+    request = RequestFactory().get("/api/v1/users/children")
+    request.auth = parent
+
+    # Role check and one projected children query, run while the response streams.
+    with django_assert_num_queries(2):
+        result = api.get_children(request)
+        payload = orjson.loads(b"".join(result.streaming_content))
+
+    assert payload == [
+        {"id": child.id, "first_name": "Sam", "last_name": "", "email": "", "birth_date": None}
+    ]
@@ -1,4 +1,5 @@
 import pytest
+from allauth.account.models import EmailAddress
 from django.contrib.auth.models import Group
 
 
@@ -20,3 +21,35 @@ def test_headless_session_includes_groups(client, django_user_model) -> None:
     user_data = payload['data']['user']
     assert 'groups' in user_data
     assert 'parent' in user_data['groups']
+
+
+@pytest.mark.django_db
+def test_headless_session_caches_user_payload(
+    client, django_user_model, django_assert_max_num_queries, django_capture_on_commit_callbacks
+) -> None:
+    """
+    Serve repeat session checks from the cache and refresh them when emails or groups change.
+    """
+    user = django_user_model.objects.create_user(username='cacheduser', password='password')
+    client.force_login(user)
+    client.get('/_allauth/browser/v1/auth/session')
+
+    with django_assert_max_num_queries(10) as captured:
+        response = client.get('/_allauth/browser/v1/auth/session')
+    tables = ' '.join(query['sql'] for query in captured.captured_queries)
+    assert 'account_emailaddress' not in tables
+    assert 'auth_group' not in tables
+    assert response.json()['data']['user']['groups'] == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.groups.add(Group.objects.create(name='child'))
+        EmailAddress.objects.create(user=user, email='cached@example.com', primary=True, verified=True)
+
+    user_data = client.get('/_allauth/browser/v1/auth/session').json()['data']['user']
+    assert user_data['groups'] == ['child']
+    assert user_data['email'] == 'cached@example.com'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Group.objects.filter(name='child').get().user_set.clear()
+
+    assert client.get('/_allauth/browser/v1/auth/session').json()['data']['user']['groups'] == []
@@ -1,8 +1,10 @@
 from ninja import Redoc
 from allauth.headless.contrib.ninja.security import XSessionTokenAuth
-from ninja import NinjaAPI
 from apps.behavior.api import router as behavior_router
 from apps.chores.api import router as chores_router
+from apps.core.api import router as core_router
+from apps.core.batch import BATCH_AUTH_ATTRIBUTE
+from apps.core.renderers import NegotiatingNinjaAPI, renderer
 from apps.users.api import router as users_router
 
 # API Constants
@@ -32,14 +34,28 @@ API_DOCS_TYPE = Redoc(
 
 
 class XSessionAuth(XSessionTokenAuth):
+    # allauth's session lookup is synchronous; Ninja runs it through sync_to_async for async views.
     openapi_name = 'X-Session-Token'
     openapi_description = "Authenticate using the X-Session-Token header provided by django-allauth's headless mode."
 
+    def __call__(self, request):
+        # Batch operations reuse the user the batch request authenticated as.
+        user = getattr(request, BATCH_AUTH_ATTRIBUTE, None)
+        if user is not None:
+            return user
+        return super().__call__(request)
 
-api_v1 = NinjaAPI(
-    title=API_TITLE, description=API_DESCRIPTION, version='1.0.0', docs=API_DOCS_TYPE, auth=XSessionAuth()
+
+api_v1 = NegotiatingNinjaAPI(
+    title=API_TITLE,
+    description=API_DESCRIPTION,
+    version='1.0.0',
+    docs=API_DOCS_TYPE,
+    auth=XSessionAuth(),
+    renderer=renderer,
 )
 
+api_v1.add_router('/', core_router)
 api_v1.add_router('/behavior/', behavior_router)
 api_v1.add_router('/chores/', chores_router)
 api_v1.add_router('/users/', users_router)
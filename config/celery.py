@@ -22,6 +22,13 @@ app.autodiscover_tasks()
 app.conf.beat_schedule = {
     'close-days-chores': {'task': 'chores.tasks.close_days_chores', 'schedule': crontab(minute=0, hour=0)},
     'assign-chores': {'task': 'chores.tasks.assign_chores', 'schedule': crontab(minute=30, hour=0)},
+    'expire-evidence-uploads': {'task': 'chores.tasks.expire_evidence_uploads', 'schedule': crontab(minute=15)},
+    'purge-sync-tombstones': {'task': 'chores.tasks.purge_sync_tombstones', 'schedule': crontab(minute=45, hour=1)},
+    'purge-direct-uploads': {'task': 'chores.tasks.purge_direct_uploads', 'schedule': crontab(minute=30, hour=2)},
+    'purge-idempotency-records': {
+        'task': 'core.tasks.purge_idempotency_records',
+        'schedule': crontab(minute=0, hour=2),
+    },
 }
 
 
@@ -143,3 +143,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
+
+# Delta sync re-reads rows updated this many seconds before a client's sync token, so a write
+# is only missed if its transaction commits longer than this after it timestamped the row.
+SYNC_OVERLAP_SECONDS = env.int('SYNC_OVERLAP_SECONDS', default=60)
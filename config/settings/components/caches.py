@@ -0,0 +1,25 @@
+from config.settings.components.base import env
+
+# Cache
+# Use Redis when available so cache-backed state (catalog versions, cached payloads)
+# is shared across worker processes. Fall back to a per-process memory cache, which
+# production settings refuse because workers would then serve each other's stale entries.
+REDIS_URL = env.str('REDIS_URL', default=None)
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+
+# Assignment events reach server-sent event streams in every worker through Redis pub/sub.
+# Without Redis they only reach streams served by the publishing process.
+EVENT_BROKER = 'apps.core.events.RedisEventBroker' if REDIS_URL else 'apps.core.events.InMemoryEventBroker'
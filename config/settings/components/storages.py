@@ -1,3 +1,6 @@
+import tempfile
+from pathlib import Path
+
 from config.settings.components.base import env
 
 # Storages
@@ -33,3 +36,20 @@ else:
             'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
         },
     }
+
+# Serve media from a CDN in front of the bucket; URLs are then built from this base and not signed
+MEDIA_CDN_URL = env.str('MEDIA_CDN_URL', default='')
+
+# How protected media in local storage is handed over: '' streams it from Django, 'x-accel-redirect'
+# (nginx) or 'x-sendfile' (Apache, lighttpd) lets the front proxy send the file
+MEDIA_DELIVERY = env.str('MEDIA_DELIVERY', default='')
+# Internal nginx location aliased to MEDIA_ROOT, used with X-Accel-Redirect
+MEDIA_ACCEL_REDIRECT_PREFIX = env.str('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+
+# Uploaded images are re-encoded with their longest edge capped at this many pixels
+IMAGE_UPLOAD_MAX_EDGE = env.int('IMAGE_UPLOAD_MAX_EDGE', default=2560)
+IMAGE_UPLOAD_QUALITY = env.int('IMAGE_UPLOAD_QUALITY', default=85)
+
+# Resumable evidence uploads are assembled here before they are copied to media storage.
+# Every web worker must see the same directory.
+EVIDENCE_UPLOAD_DIR = env.str('EVIDENCE_UPLOAD_DIR', default=str(Path(tempfile.gettempdir()) / 'evidence-uploads'))
@@ -1,8 +1,17 @@
+from django.core.exceptions import ImproperlyConfigured
+
 from config.settings.components.base import *  # noqa: F403
 from config.settings.components.base import env
+from config.settings.components.caches import REDIS_URL
 
 DEBUG = False
 
+# Catalog versions, cached API payloads and idempotency records must be shared by every worker.
+# With the per-process fallback cache a write only invalidates the worker that handled it, and
+# the others keep serving stale payloads and answering 304 to outdated ETags.
+if not REDIS_URL:
+    raise ImproperlyConfigured('REDIS_URL must be set in production so workers share one cache.')
+
 # Security
 SECURE_SSL_REDIRECT = env.bool('DJANGO_SECURE_SSL_REDIRECT', default=True)
 SESSION_COOKIE_SECURE = env.bool('DJANGO_SESSION_COOKIE_SECURE', default=True)
@@ -19,6 +19,15 @@ STORAGES = {
     },
 }
 
+# Keep cache state local to the test process even when REDIS_URL is set (e.g. in CI)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
+EVENT_BROKER = 'apps.core.events.InMemoryEventBroker'
+
 # Disable unnecessary apps/middleware if present in base (though typically added in dev)
 # We ensure they are NOT added here. Since we import * from base, we only have what base has.
 # Dev tools like debug_toolbar and zeal are added in development.py, so they won't be here.
@@ -26,6 +35,9 @@ STORAGES = {
 # Add any test-specific apps if needed
 # INSTALLED_APPS += ["tests"]
 
+# Run queued Celery tasks in-process instead of sending them to the broker
+CELERY_TASK_ALWAYS_EAGER = True
+
 # Use SQLite for testing to avoid postgres dependency issues in CI/Test envs
 DATABASES = {
     'default': {
@@ -1,5 +1,16 @@
 import os
 
+import pytest
+
 # Allow synchronous Django DB operations even if an async loop is running
 # This is often needed when combining pytest-django and pytest-playwright
 os.environ['DJANGO_ALLOW_ASYNC_UNSAFE'] = 'true'
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached API payloads never leak between tests."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield